@@ -1,17 +1,68 @@
 """API clients for communicating with the server."""
 
-import base64
-import json
+import asyncio
+import contextlib
 from typing import Any
 
 import httpx
-import websocket
+import msgpack
+import orjson
+import pybase64
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+from websockets.protocol import State
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Connection pool tuned for bursty voice traffic: keep connections warm
+# between utterances so follow-up requests skip the TCP/TLS handshake.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_HTTP_HEADERS = {"Accept": f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9"}
+
+# httpx clients shared per base_url across RESTClient instances, created on first use
+_async_clients: dict[str, httpx.AsyncClient] = {}
+_sync_clients: dict[str, httpx.Client] = {}
+
+# Keepalive pings detect dead connections while idle between utterances
+_WS_PING_INTERVAL = 20
+_WS_PING_TIMEOUT = 20
+
+
+def _decode_json_audio(result: dict[str, Any]) -> dict[str, Any]:
+    """Decode the base64 ``audio`` field of a JSON chat response to raw bytes.
+
+    MessagePack responses already carry audio as a binary field, so this only
+    applies to the JSON fallback.
+
+    Args:
+        result: Decoded JSON response.
+
+    Returns:
+        The same dictionary with ``audio`` as bytes.
+    """
+    if result.get("audio"):
+        result["audio"] = pybase64.b64decode(result["audio"], validate=False)
+    return result
+
+
+def _shared_client(pool: dict, client_cls: type, base_url: str):
+    """Return the pooled httpx client for ``base_url``, creating it if needed."""
+    client = pool.get(base_url)
+    if client is None or client.is_closed:
+        client = client_cls(
+            base_url=base_url, http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, headers=_HTTP_HEADERS
+        )
+        pool[base_url] = client
+    return client
 
 
 class RESTClient:
     """REST API client for the Home AI server.
 
     Provides synchronous and asynchronous methods for API communication.
+    The underlying httpx clients are created on first use and shared between
+    instances pointing at the same server.
     """
 
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -21,8 +72,59 @@ class RESTClient:
             base_url: Base URL of the server.
         """
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(base_url=self.base_url)
-        self._sync_client = httpx.Client(base_url=self.base_url)
+        # Explicitly assigned clients take precedence over the shared pool
+        self._async_override: httpx.AsyncClient | None = None
+        self._sync_override: httpx.Client | None = None
+        self._devices_inflight: asyncio.Task | None = None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Async httpx client, shared per base_url and created lazily."""
+        return self._async_override or _shared_client(_async_clients, httpx.AsyncClient, self.base_url)
+
+    @_client.setter
+    def _client(self, client: httpx.AsyncClient):
+        self._async_override = client
+
+    @_client.deleter
+    def _client(self):
+        self._async_override = None
+
+    @property
+    def _sync_client(self) -> httpx.Client:
+        """Sync httpx client, shared per base_url and created lazily."""
+        return self._sync_override or _shared_client(_sync_clients, httpx.Client, self.base_url)
+
+    @_sync_client.setter
+    def _sync_client(self, client: httpx.Client):
+        self._sync_override = client
+
+    @_sync_client.deleter
+    def _sync_client(self):
+        self._sync_override = None
+
+    @staticmethod
+    def _text_payload(text: str | None, mode: str) -> dict[str, Any]:
+        """Build the JSON body for a text chat request."""
+        payload = {"mode": mode}
+        if text:
+            payload["text"] = text
+        return payload
+
+    @staticmethod
+    def _audio_request(text: str | None, audio: bytes, mode: str) -> dict[str, Any]:
+        """Build multipart form arguments for an audio chat request."""
+        data = {"mode": mode}
+        if text:
+            data["text"] = text
+        return {"data": data, "files": {"audio": ("audio.wav", audio, "audio/wav")}}
+
+    @staticmethod
+    def _chat_result(response: httpx.Response) -> dict[str, Any]:
+        """Decode a chat response, preferring MessagePack when the server sent it."""
+        if MSGPACK_MEDIA_TYPE in response.headers.get("content-type", ""):
+            return msgpack.unpackb(response.content, raw=False)
+        return _decode_json_audio(response.json())
 
     async def chat_async(
         self, text: str | None = None, audio: bytes | None = None, mode: str = "text"
@@ -35,19 +137,16 @@ class RESTClient:
             mode: Input mode ('text' or 'audio').
 
         Returns:
-            Response dictionary with text and optional audio.
+            Response dictionary with text and optional audio bytes.
         """
-        payload = {"mode": mode}
-
-        if text:
-            payload["text"] = text
-        if audio:
-            payload["audio"] = base64.b64encode(audio).decode()
-
-        response = await self._client.post("/api/chat", json=payload)
+        if audio is not None:
+            # Send raw audio as multipart/form-data to avoid base64 overhead
+            response = await self._client.post("/api/chat/audio", **self._audio_request(text, audio, mode))
+        else:
+            response = await self._client.post("/api/chat", json=self._text_payload(text, mode))
         response.raise_for_status()
 
-        return response.json()
+        return self._chat_result(response)
 
     def chat(self, text: str | None = None, audio: bytes | None = None, mode: str = "text") -> dict[str, Any]:
         """Send a chat request synchronously.
@@ -58,22 +157,29 @@ class RESTClient:
             mode: Input mode ('text' or 'audio').
 
         Returns:
-            Response dictionary with text and optional audio.
+            Response dictionary with text and optional audio bytes.
         """
-        payload = {"mode": mode}
-
-        if text:
-            payload["text"] = text
-        if audio:
-            payload["audio"] = base64.b64encode(audio).decode()
-
-        response = self._sync_client.post("/api/chat", json=payload)
+        if audio is not None:
+            response = self._sync_client.post("/api/chat/audio", **self._audio_request(text, audio, mode))
+        else:
+            response = self._sync_client.post("/api/chat", json=self._text_payload(text, mode))
         response.raise_for_status()
 
-        return response.json()
+        return self._chat_result(response)
 
     async def get_devices_async(self) -> dict[str, Any]:
-        """Get device states asynchronously."""
+        """Get device states asynchronously.
+
+        Concurrent callers share a single in-flight request.
+        """
+        if self._devices_inflight is None:
+            self._devices_inflight = asyncio.create_task(self._fetch_devices_async())
+            self._devices_inflight.add_done_callback(lambda _: setattr(self, "_devices_inflight", None))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(self._devices_inflight)
+
+    async def _fetch_devices_async(self) -> dict[str, Any]:
+        """Fetch device states from the server."""
         response = await self._client.get("/api/devices")
         response.raise_for_status()
         return response.json()
@@ -85,15 +191,24 @@ class RESTClient:
         return response.json()
 
     async def close(self):
-        """Close the client connections."""
-        await self._client.aclose()
-        self._sync_client.close()
+        """Close the client connections.
+
+        Closes the shared pool for this server; other instances get a fresh
+        one on their next request.
+        """
+        async_client = self._async_override or _async_clients.pop(self.base_url, None)
+        if async_client is not None:
+            await async_client.aclose()
+        sync_client = self._sync_override or _sync_clients.pop(self.base_url, None)
+        if sync_client is not None:
+            sync_client.close()
 
 
 class WebSocketClient:
     """WebSocket client for real-time communication with the server.
 
-    Provides methods for maintaining persistent connection and message exchange.
+    Provides async methods for maintaining a persistent connection and message
+    exchange without blocking the event loop.
     """
 
     def __init__(self, url: str = "ws://localhost:8000/ws"):
@@ -103,23 +218,61 @@ class WebSocketClient:
             url: WebSocket URL of the server.
         """
         self.url = url
-        self._ws: websocket.WebSocket | None = None
+        self._ws: ClientConnection | None = None
+        self._connect_task: asyncio.Task | None = None
         self._callbacks: dict[str, list] = {
             "response": [],
             "error": [],
         }
 
-    def connect(self):
+    async def connect(self):
         """Connect to the WebSocket server."""
-        self._ws = websocket.create_connection(self.url)
+        self._ws = await connect(self.url, ping_interval=_WS_PING_INTERVAL, ping_timeout=_WS_PING_TIMEOUT)
+
+    def start(self):
+        """Open the connection in the background so the first send skips the handshake.
+
+        Must be called from a running event loop.
+        """
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.create_task(self.connect())
 
-    def disconnect(self):
+    async def _ensure_connected(self):
+        """Wait for a pending background connect, or connect if the socket is not open."""
+        if self._connect_task is not None and not self._connect_task.done():
+            await self._connect_task
+        if self._ws is None or self._ws.state is not State.OPEN:
+            await self.connect()
+
+    async def disconnect(self):
         """Disconnect from the WebSocket server."""
+        if self._connect_task:
+            self._connect_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, OSError):
+                await self._connect_task
+            self._connect_task = None
         if self._ws:
-            self._ws.close()
+            await self._ws.close()
             self._ws = None
 
-    def send_text(self, text: str, request_id: str | None = None) -> dict[str, Any]:
+    async def send_async(self, frame: bytes, text: bool = False):
+        """Send a frame, connecting first if needed.
+
+        Args:
+            frame: Encoded frame payload.
+            text: Send as a text (JSON) frame instead of a binary (MessagePack) frame.
+
+        Raises:
+            ConnectionClosed: If the connection dropped; a background reconnect is started.
+        """
+        await self._ensure_connected()
+        try:
+            await self._ws.send(frame, text=text)
+        except ConnectionClosed:
+            self.start()
+            raise
+
+    async def send_text_async(self, text: str, request_id: str | None = None) -> dict[str, Any]:
         """Send a text message and wait for response.
 
         Args:
@@ -129,19 +282,15 @@ class WebSocketClient:
         Returns:
             Response dictionary.
         """
-        if not self._ws:
-            self.connect()
-
         message = {"type": "text", "content": text}
         if request_id:
             message["request_id"] = request_id
 
-        self._ws.send(json.dumps(message))
-        response = self._ws.recv()
+        # orjson emits UTF-8 bytes, sent as a text frame without re-encoding
+        await self.send_async(orjson.dumps(message), text=True)
+        return await self._recv()
 
-        return json.loads(response)
-
-    def send_audio(self, audio: bytes, request_id: str | None = None) -> dict[str, Any]:
+    async def send_audio_async(self, audio: bytes, request_id: str | None = None) -> dict[str, Any]:
         """Send an audio message and wait for response.
 
         Args:
@@ -149,25 +298,27 @@ class WebSocketClient:
             request_id: Optional request ID.
 
         Returns:
-            Response dictionary.
+            Response dictionary with optional audio bytes.
         """
-        if not self._ws:
-            self.connect()
-
-        message = {"type": "audio", "content": base64.b64encode(audio).decode()}
+        message = {"type": "audio", "content": audio}
         if request_id:
             message["request_id"] = request_id
 
-        self._ws.send(json.dumps(message))
-        response = self._ws.recv()
-
-        result = json.loads(response)
-
-        # Decode audio response if present
-        if result.get("audio"):
-            result["audio_bytes"] = base64.b64decode(result["audio"])
-
-        return result
+        # Binary MessagePack frame: audio travels as raw bytes, no base64
+        await self.send_async(msgpack.packb(message, use_bin_type=True))
+        return await self._recv()
+
+    async def _recv(self) -> dict[str, Any]:
+        """Receive a response frame; binary frames are MessagePack, text frames JSON."""
+        try:
+            response = await self._ws.recv()
+        except ConnectionClosed:
+            # Start reconnecting now so the next request doesn't pay for the handshake
+            self.start()
+            raise
+        if isinstance(response, bytes):
+            return msgpack.unpackb(response, raw=False)
+        return _decode_json_audio(orjson.loads(response))
 
     def on_response(self, callback):
         """Register a callback for response messages."""
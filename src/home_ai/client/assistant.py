@@ -50,9 +50,9 @@ class ClientAssistant:
         # Local STT/TTS (optional)
         self._stt = None
         self._tts = None
+        settings = get_settings()
 
         if use_local_stt:
-            settings = get_settings()
             if settings.stt_provider == "openai":
                 from home_ai.common.stt.openai_stt import OpenAISTT
 
@@ -63,15 +63,16 @@ class ClientAssistant:
                 self._stt = GoogleSTT()
 
         if use_local_tts:
-            settings = get_settings()
+            from home_ai.common.tts.cache import TTSCache
+
             if settings.tts_provider == "openai":
                 from home_ai.common.tts.openai_tts import OpenAITTS
 
-                self._tts = OpenAITTS(api_key=settings.openai_api_key)
+                self._tts = OpenAITTS(api_key=settings.openai_api_key, cache=TTSCache.from_settings(settings))
             else:
                 from home_ai.common.tts.gtts_impl import GTTSImpl
 
-                self._tts = GTTSImpl()
+                self._tts = GTTSImpl(cache=TTSCache.from_settings(settings))
 
         # Logger
         self._logger = get_client_logger()
@@ -90,8 +91,7 @@ class ClientAssistant:
         if isinstance(self._api_client, RESTClient):
             result = await self._api_client.chat_async(text=text, mode="text")
         else:
-            # WebSocket - need to implement async version
-            result = self._api_client.send_text(text)
+            result = await self._api_client.send_text_async(text)
 
         self._logger.info(f"Response: {result.get('text', '')}")
 
@@ -123,14 +123,11 @@ class ClientAssistant:
             if isinstance(self._api_client, RESTClient):
                 result = await self._api_client.chat_async(audio=audio_data, mode="audio")
             else:
-                result = self._api_client.send_audio(audio_data)
+                result = await self._api_client.send_audio_async(audio_data)
 
         # Play audio response
         if result.get("audio"):
-            import base64
-
-            audio_response = base64.b64decode(result["audio"])
-            await self._player.play_async(audio_response)
+            await self._player.play_async(result["audio"])
         elif self.use_local_tts and self._tts:
             audio_response = await self._tts.synthesize_async(result["text"])
             await self._player.play_async(audio_response)
@@ -139,6 +136,10 @@ class ClientAssistant:
 
     async def run_interactive(self):
         """Run interactive voice assistant loop."""
+        if isinstance(self._api_client, WebSocketClient):
+            # Connect up front so the first request doesn't pay for the handshake
+            await self._api_client.connect()
+
         print("Home AI Assistant 시작됨. '종료'를 입력하면 종료됩니다.")
         print("텍스트 입력 또는 Enter를 눌러 음성 녹음을 시작합니다.")
 
@@ -172,7 +173,7 @@ class ClientAssistant:
         if isinstance(self._api_client, RESTClient):
             await self._api_client.close()
         elif isinstance(self._api_client, WebSocketClient):
-            self._api_client.disconnect()
+            await self._api_client.disconnect()
 
         self._recorder.close()
 
@@ -195,4 +196,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
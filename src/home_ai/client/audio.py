@@ -2,7 +2,54 @@
 
 import asyncio
 import io
-import wave
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+try:
+    import pyaudio
+except ImportError:
+    pyaudio = None
+
+# RIFF/WAVE header for 16-bit PCM: RIFF chunk, "fmt " chunk, "data" chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_SAMPLE_WIDTH = 2  # 16-bit
+
+# How often to check whether playback has finished
+_PLAYBACK_POLL_MS = 100
+
+# Dedicated threads for blocking audio I/O, isolated from the default executor
+_AUDIO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio")
+
+
+def _wav_header(data_len: int, channels: int, sample_rate: int) -> bytes:
+    """Build a 44-byte WAV header for 16-bit PCM data.
+
+    Args:
+        data_len: Length of the PCM payload in bytes.
+        channels: Number of audio channels.
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        WAV header bytes.
+    """
+    block_align = channels * _SAMPLE_WIDTH
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        _WAV_HEADER.size - 8 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        _SAMPLE_WIDTH * 8,
+        b"data",
+        data_len,
+    )
 
 
 class AudioRecorder:
@@ -31,12 +78,8 @@ class AudioRecorder:
         self._pyaudio = None
         self._stream = None
 
-        try:
-            import pyaudio
-
+        if pyaudio is not None:
             self._pyaudio = pyaudio.PyAudio()
-        except ImportError:
-            pass
 
     def record(self, duration: float = 5.0) -> bytes:
         """Record audio for a specified duration.
@@ -51,8 +94,6 @@ class AudioRecorder:
             # Return mock audio data if pyaudio not available
             return self._create_mock_audio(duration)
 
-        import pyaudio
-
         stream = self._pyaudio.open(
             format=pyaudio.paInt16,
             channels=self.channels,
@@ -61,17 +102,21 @@ class AudioRecorder:
             frames_per_buffer=self.chunk_size,
         )
 
-        frames = []
         num_chunks = int(self.sample_rate / self.chunk_size * duration)
+        chunk_bytes = self.chunk_size * self.channels * _SAMPLE_WIDTH
+
+        # Fill one pre-sized buffer instead of collecting chunks and joining them
+        pcm = bytearray(num_chunks * chunk_bytes)
+        view = memoryview(pcm)
 
-        for _ in range(num_chunks):
-            data = stream.read(self.chunk_size)
-            frames.append(data)
+        for i in range(num_chunks):
+            offset = i * chunk_bytes
+            view[offset : offset + chunk_bytes] = stream.read(self.chunk_size, exception_on_overflow=False)
 
         stream.stop_stream()
         stream.close()
 
-        return self._frames_to_wav(frames)
+        return self._frames_to_wav(pcm)
 
     async def record_async(self, duration: float = 5.0) -> bytes:
         """Record audio asynchronously.
@@ -82,36 +127,18 @@ class AudioRecorder:
         Returns:
             Audio bytes in WAV format.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.record, duration)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_AUDIO_EXECUTOR, self.record, duration)
 
-    def _frames_to_wav(self, frames: list[bytes]) -> bytes:
-        """Convert frames to WAV bytes."""
-        buffer = io.BytesIO()
-
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b"".join(frames))
-
-        buffer.seek(0)
-        return buffer.read()
+    def _frames_to_wav(self, pcm: bytes | bytearray) -> bytes:
+        """Convert raw 16-bit PCM to WAV bytes."""
+        return _wav_header(len(pcm), self.channels, self.sample_rate) + pcm
 
     def _create_mock_audio(self, duration: float) -> bytes:
         """Create mock audio data for testing."""
-        buffer = io.BytesIO()
-
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            # Write silence
-            num_samples = int(self.sample_rate * duration)
-            wf.writeframes(b"\x00\x00" * num_samples)
-
-        buffer.seek(0)
-        return buffer.read()
+        # Write silence; bytes(n) is a single zero-filled allocation
+        num_samples = int(self.sample_rate * duration)
+        return self._frames_to_wav(bytes(num_samples * self.channels * _SAMPLE_WIDTH))
 
     def close(self):
         """Close audio recorder."""
@@ -129,13 +156,24 @@ class AudioPlayer:
         """Initialize audio player."""
         self._initialized = False
         try:
-            import pygame
-
             pygame.mixer.init()
             self._initialized = True
         except Exception:
             pass
 
+    def _start(self, audio_data: bytes, format: str) -> bool:
+        """Load audio data and start playback without waiting for it to finish.
+
+        Returns:
+            True if playback was started.
+        """
+        if not self._initialized:
+            return False
+
+        pygame.mixer.music.load(io.BytesIO(audio_data), format)
+        pygame.mixer.music.play()
+        return True
+
     def play(self, audio_data: bytes, format: str = "mp3"):
         """Play audio data.
 
@@ -143,34 +181,31 @@ class AudioPlayer:
             audio_data: Audio bytes to play.
             format: Audio format (mp3, wav).
         """
-        if not self._initialized:
+        if not self._start(audio_data, format):
             return
 
-        import io
-
-        import pygame
-
-        audio_buffer = io.BytesIO(audio_data)
-        pygame.mixer.music.load(audio_buffer, format)
-        pygame.mixer.music.play()
-
         # Wait for playback to finish
         while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
+            pygame.time.wait(_PLAYBACK_POLL_MS)
 
     async def play_async(self, audio_data: bytes, format: str = "mp3"):
         """Play audio asynchronously.
 
+        Playback runs in the mixer's own thread, so completion is awaited on the
+        event loop instead of holding an executor thread for the clip's length.
+
         Args:
             audio_data: Audio bytes to play.
             format: Audio format.
         """
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.play, audio_data, format)
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(_AUDIO_EXECUTOR, self._start, audio_data, format):
+            return
+
+        while pygame.mixer.music.get_busy():
+            await asyncio.sleep(_PLAYBACK_POLL_MS / 1000)
 
     def stop(self):
         """Stop playback."""
         if self._initialized:
-            import pygame
-
             pygame.mixer.music.stop()
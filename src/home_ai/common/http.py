@@ -0,0 +1,48 @@
+"""Shared HTTP clients for provider SDKs."""
+
+import httpx
+
+# One keep-alive pool per process for all provider API calls (OpenAI STT/TTS/LLM)
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+
+# Global client instances
+_async_http: httpx.AsyncClient | None = None
+_sync_http: httpx.Client | None = None
+
+
+def new_async_http() -> httpx.AsyncClient:
+    """Create an async HTTP client with the provider pool settings.
+
+    Pooled connections are bound to the event loop that opened them, so a
+    second event loop needs its own client rather than the shared one.
+
+    Returns:
+        New httpx.AsyncClient instance.
+    """
+    return httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, follow_redirects=True)
+
+
+def get_shared_async_http() -> httpx.AsyncClient:
+    """Get the shared async HTTP client.
+
+    Only for use on the main (server) event loop.
+
+    Returns:
+        httpx.AsyncClient instance (singleton).
+    """
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = new_async_http()
+    return _async_http
+
+
+def get_shared_http() -> httpx.Client:
+    """Get the shared sync HTTP client.
+
+    Returns:
+        httpx.Client instance (singleton).
+    """
+    global _sync_http
+    if _sync_http is None or _sync_http.is_closed:
+        _sync_http = httpx.Client(http2=True, limits=_HTTP_LIMITS, follow_redirects=True)
+    return _sync_http
@@ -1,11 +1,10 @@
 """IoT Device interface protocol."""
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 from home_ai.common.models import IoTCommand, IoTResult
 
 
-@runtime_checkable
 class IoTDeviceInterface(Protocol):
     """Protocol for IoT device implementations.
 
@@ -1,11 +1,11 @@
 """LLM interface protocol."""
 
-from typing import Protocol, runtime_checkable
+from collections.abc import Callable
+from typing import Protocol
 
 from home_ai.common.models import LLMResponse
 
 
-@runtime_checkable
 class LLMInterface(Protocol):
     """Protocol for LLM implementations.
 
@@ -25,14 +25,21 @@ class LLMInterface(Protocol):
         """
         ...
 
-    async def process_async(self, text: str, context: list[dict] | None = None) -> LLMResponse:
+    async def process_async(
+        self, text: str, context: list[dict] | None = None, on_text: Callable[[str], None] | None = None
+    ) -> LLMResponse:
         """Asynchronously process user input and generate a response.
 
         Args:
             text: User input text.
             context: Optional conversation history for context.
+            on_text: Optional callback receiving response text deltas as they are generated.
 
         Returns:
             LLMResponse containing text response and any IoT commands.
         """
         ...
+
+    async def warmup(self) -> None:
+        """Prepare network connections so the first request doesn't pay setup latency."""
+        ...
@@ -1,9 +1,8 @@
 """Speech-to-Text interface protocol."""
 
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class STTInterface(Protocol):
     """Protocol for Speech-to-Text implementations.
 
@@ -1,9 +1,8 @@
 """Text-to-Speech interface protocol."""
 
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class TTSInterface(Protocol):
     """Protocol for Text-to-Speech implementations.
 
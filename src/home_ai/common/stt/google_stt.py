@@ -1,15 +1,40 @@
 """Google Speech Recognition STT implementation."""
 
 import asyncio
+import io
+import wave
 
+import httpx
 import speech_recognition as sr
+from speech_recognition.recognizers import google as sr_google
+
+from home_ai.common.http import get_shared_http
+
+# Format assumed for headerless input: 16 kHz, 16-bit mono PCM
+_DEFAULT_SAMPLE_RATE = 16000
+_DEFAULT_SAMPLE_WIDTH = 2
+
+
+def _to_audio_data(audio_data: bytes) -> sr.AudioData:
+    """Wrap WAV or raw PCM bytes as AudioData.
+
+    WAV input is unwrapped using its own header, so the header bytes aren't
+    fed to the recognizer as samples; anything else is taken as raw PCM.
+    """
+    if audio_data[:4] != b"RIFF":
+        return sr.AudioData(audio_data, _DEFAULT_SAMPLE_RATE, _DEFAULT_SAMPLE_WIDTH)
+
+    with wave.open(io.BytesIO(audio_data), "rb") as wf:
+        return sr.AudioData(wf.readframes(wf.getnframes()), wf.getframerate(), wf.getsampwidth())
 
 
 class GoogleSTT:
     """Speech-to-Text using Google Speech Recognition.
 
     Uses the free Google Speech Recognition API via the SpeechRecognition library.
-    Requires internet connection.
+    Requires internet connection. Requests go through the shared keep-alive
+    HTTP client instead of the library's one-shot urlopen, so consecutive
+    transcriptions reuse one connection.
     """
 
     def __init__(self, language: str = "ko-KR"):
@@ -19,13 +44,15 @@ class GoogleSTT:
             language: Language code for recognition (default: Korean).
         """
         self.language = language
-        self._recognizer = sr.Recognizer()
+        self._http = get_shared_http()
+        self._request_builder = sr_google.create_request_builder(endpoint=sr_google.ENDPOINT, language=language)
+        self._parser = sr_google.OutputParser(show_all=False, with_confidence=False)
 
     def transcribe(self, audio_data: bytes) -> str:
         """Transcribe audio data to text.
 
         Args:
-            audio_data: Raw audio bytes (WAV format expected).
+            audio_data: WAV bytes, or raw 16 kHz 16-bit mono PCM.
 
         Returns:
             Transcribed text string.
@@ -34,17 +61,31 @@ class GoogleSTT:
             sr.UnknownValueError: If speech is unintelligible.
             sr.RequestError: If API request fails.
         """
-        # Convert bytes to AudioData
-        audio = sr.AudioData(audio_data, sample_rate=16000, sample_width=2)
+        audio = _to_audio_data(audio_data)
 
         try:
-            text = self._recognizer.recognize_google(audio, language=self.language)
-            return text
+            return self._parser.parse(self._post(audio))
         except sr.UnknownValueError as err:
             raise Exception("Could not understand audio") from err
         except sr.RequestError as e:
             raise Exception(f"API request failed: {e}") from e
 
+    def _post(self, audio: sr.AudioData) -> str:
+        """Send a recognition request over the shared client and return the response body.
+
+        Transport failures are raised as ``sr.RequestError`` with the library's
+        own messages, as ``recognize_google`` would.
+        """
+        request = self._request_builder.build(audio)
+        try:
+            response = self._http.post(request.full_url, content=request.data, headers=dict(request.header_items()))
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise sr.RequestError(f"recognition request failed: {e.response.reason_phrase}") from e
+        except httpx.HTTPError as e:
+            raise sr.RequestError(f"recognition connection failed: {e}") from e
+        return response.text
+
     async def transcribe_async(self, audio_data: bytes) -> str:
         """Asynchronously transcribe audio data to text.
 
@@ -1,9 +1,15 @@
 """OpenAI Whisper API STT implementation."""
 
 import io
+from collections.abc import AsyncIterator
 
 from openai import AsyncOpenAI, OpenAI
 
+from home_ai.common.http import get_shared_async_http, get_shared_http
+
+# Only the GPT-4o transcription models support streamed transcripts; whisper-1 returns the text at once
+_STREAMING_MODELS = ("gpt-4o-transcribe", "gpt-4o-mini-transcribe")
+
 
 class OpenAISTT:
     """Speech-to-Text using OpenAI Whisper API.
@@ -27,8 +33,8 @@ class OpenAISTT:
         """
         self.model = model
         self.language = language
-        self._client = OpenAI(api_key=api_key)
-        self._async_client = AsyncOpenAI(api_key=api_key)
+        self._client = OpenAI(api_key=api_key, http_client=get_shared_http())
+        self._async_client = AsyncOpenAI(api_key=api_key, http_client=get_shared_async_http())
 
     def transcribe(self, audio_data: bytes) -> str:
         """Transcribe audio data to text.
@@ -70,3 +76,32 @@ class OpenAISTT:
         )
 
         return response.text
+
+    async def stream_transcribe(self, audio_data: bytes) -> AsyncIterator[str]:
+        """Transcribe audio data, yielding text deltas as they are recognized.
+
+        Models without streaming support yield the whole transcript once.
+
+        Args:
+            audio_data: Raw audio bytes.
+
+        Yields:
+            Transcript text deltas, in order.
+        """
+        if not self.model.startswith(_STREAMING_MODELS):
+            yield await self.transcribe_async(audio_data)
+            return
+
+        audio_file = io.BytesIO(audio_data)
+        audio_file.name = "audio.wav"
+
+        stream = await self._async_client.audio.transcriptions.create(
+            model=self.model,
+            file=audio_file,
+            language=self.language,
+            stream=True,
+        )
+
+        async for event in stream:
+            if event.type == "transcript.text.delta":
+                yield event.delta
@@ -0,0 +1,31 @@
+"""Concurrent batch synthesis shared by TTS implementations."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+async def synthesize_many(
+    synthesize_async: Callable[[str], Awaitable[bytes]], texts: list[str], max_concurrency: int
+) -> list[bytes]:
+    """Synthesize several texts concurrently.
+
+    Duplicate texts are synthesized once, so repeats in a batch share a single
+    request (and a single cache entry).
+
+    Args:
+        synthesize_async: Coroutine function converting text to audio bytes.
+        texts: Texts to synthesize.
+        max_concurrency: Maximum number of synthesis requests in flight.
+
+    Returns:
+        Audio bytes for each text, in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def synthesize_one(text: str) -> bytes:
+        async with semaphore:
+            return await synthesize_async(text)
+
+    unique = list(dict.fromkeys(texts))
+    results = dict(zip(unique, await asyncio.gather(*(synthesize_one(text) for text in unique)), strict=True))
+    return [results[text] for text in texts]
@@ -0,0 +1,189 @@
+"""Content-addressed cache for synthesized audio."""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from home_ai.common.config import Settings
+
+
+class TTSCache:
+    """Cache for synthesized audio keyed by a SHA-256 of the synthesis inputs.
+
+    An in-memory LRU sits in front of an optional on-disk store. The disk store
+    is bounded by ``max_bytes`` and evicts the least recently used files first;
+    its size and recency order are tracked in memory, so the directory is only
+    scanned once, at startup. On an event loop use :meth:`get_async` /
+    :meth:`put_async`, which keep disk I/O off the loop.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        max_entries: int = 256,
+        max_bytes: int = 100 * 1024 * 1024,
+    ):
+        """Initialize TTS cache.
+
+        Args:
+            cache_dir: Directory for the persistent cache. Memory-only if None.
+            max_entries: Maximum number of clips kept in memory.
+            max_bytes: Maximum total size of the on-disk cache.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dir = Path(cache_dir) if cache_dir else None
+        # Clip sizes on disk, least recently used first
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+
+        if self._dir:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TTSCache":
+        """Create a cache configured from application settings."""
+        return cls(cache_dir=settings.tts_cache_dir or None, max_bytes=settings.tts_cache_max_bytes)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Build a cache key from the synthesis inputs (provider, voice, text, ...)."""
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Look up cached audio, reading the disk store on a memory miss.
+
+        Blocks on disk I/O; use :meth:`get_async` from an event loop.
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            Cached audio bytes, or None on a miss.
+        """
+        audio = self.get_memory(key)
+        if audio is None and self._dir is not None:
+            audio = self._read_disk(key)
+        return audio
+
+    async def get_async(self, key: str) -> bytes | None:
+        """Look up cached audio without blocking the event loop on disk reads.
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            Cached audio bytes, or None on a miss.
+        """
+        audio = self.get_memory(key)
+        if audio is None and self._dir is not None:
+            audio = await asyncio.to_thread(self._read_disk, key)
+        return audio
+
+    def get_memory(self, key: str) -> bytes | None:
+        """Look up audio in the in-memory tier only (never touches the disk).
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            Cached audio bytes, or None on a miss.
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store synthesized audio.
+
+        Blocks on disk I/O; use :meth:`put_async` from an event loop.
+
+        Args:
+            key: Cache key from :meth:`key`.
+            audio: Audio bytes to cache.
+        """
+        self._remember(key, audio)
+        if self._dir is not None:
+            self._write_disk(key, audio)
+
+    async def put_async(self, key: str, audio: bytes) -> None:
+        """Store synthesized audio, writing the disk tier off the event loop.
+
+        Args:
+            key: Cache key from :meth:`key`.
+            audio: Audio bytes to cache.
+        """
+        self._remember(key, audio)
+        if self._dir is not None:
+            await asyncio.to_thread(self._write_disk, key, audio)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.mp3"
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        with self._lock:
+            self._memory[key] = audio
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _load_disk_index(self) -> None:
+        """Index the clips already on disk, oldest access first."""
+        entries = []
+        for path in self._dir.glob("*.mp3"):
+            try:
+                entries.append((path.stat(), path.stem))
+            except FileNotFoundError:
+                continue
+
+        for stat, key in sorted(entries, key=lambda entry: entry[0].st_atime):
+            self._disk[key] = stat.st_size
+            self._disk_bytes += stat.st_size
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            # Refresh access time so the recency order survives a restart, even on noatime mounts
+            os.utime(path)
+        except FileNotFoundError:
+            with self._disk_lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+
+        with self._disk_lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+        self._remember(key, audio)
+        return audio
+
+    def _write_disk(self, key: str, audio: bytes) -> None:
+        # Write to a temp file and rename so readers never see a partial clip
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio)
+        os.replace(tmp_path, self._path(key))
+
+        with self._disk_lock:
+            self._disk_bytes += len(audio) - self._disk.pop(key, 0)
+            self._disk[key] = len(audio)
+            evicted = []
+            while self._disk_bytes > self.max_bytes and self._disk:
+                old_key, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            self._path(old_key).unlink(missing_ok=True)
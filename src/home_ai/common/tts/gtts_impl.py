@@ -2,9 +2,20 @@
 
 import asyncio
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 from gtts import gTTS
 
+from home_ai.common.tts.batch import synthesize_many
+from home_ai.common.tts.cache import TTSCache
+from home_ai.common.tts.playback import speak_pipelined
+
+# Bounded pool for blocking gTTS requests, isolated from the default executor
+_GTTS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gtts")
+
+# Separate pool for blocking playback in speak_async, so playback never starves synthesis
+_PLAYBACK_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gtts-speak")
+
 
 class GTTSImpl:
     """Text-to-Speech using gTTS (Google Text-to-Speech).
@@ -13,13 +24,17 @@ class GTTSImpl:
     Requires internet connection.
     """
 
-    def __init__(self, lang: str = "ko"):
+    def __init__(self, lang: str = "ko", cache: TTSCache | None = None, max_concurrency: int = 4):
         """Initialize gTTS.
 
         Args:
             lang: Language code for synthesis (default: Korean).
+            cache: Audio cache. Defaults to an in-memory cache.
+            max_concurrency: Default concurrency for synthesize_many.
         """
         self.lang = lang
+        self.max_concurrency = max_concurrency
+        self._cache = cache or TTSCache()
 
     def synthesize(self, text: str) -> bytes:
         """Synthesize text to audio bytes.
@@ -30,6 +45,11 @@ class GTTSImpl:
         Returns:
             Audio bytes in MP3 format.
         """
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         tts = gTTS(text=text, lang=self.lang)
 
         # Write to BytesIO
@@ -37,7 +57,9 @@ class GTTSImpl:
         tts.write_to_fp(audio_buffer)
         audio_buffer.seek(0)
 
-        return audio_buffer.read()
+        audio = audio_buffer.read()
+        self._cache.put(key, audio)
+        return audio
 
     async def synthesize_async(self, text: str) -> bytes:
         """Asynchronously synthesize text to audio bytes.
@@ -48,27 +70,44 @@ class GTTSImpl:
         Returns:
             Audio bytes in MP3 format.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.synthesize, text)
+        # Serve phrases held in memory without a thread hop; disk lookups run in the pool
+        cached = self._cache.get_memory(self._cache_key(text))
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_GTTS_POOL, self.synthesize, text)
+
+    async def synthesize_many(self, texts: list[str], max_concurrency: int | None = None) -> list[bytes]:
+        """Synthesize several texts concurrently.
+
+        Args:
+            texts: Texts to convert to speech.
+            max_concurrency: Override for the instance's max_concurrency.
+
+        Returns:
+            Audio bytes in MP3 format for each text, in input order.
+        """
+        return await synthesize_many(self.synthesize_async, texts, max_concurrency or self.max_concurrency)
+
+    def _cache_key(self, text: str) -> str:
+        return TTSCache.key("gtts", self.lang, text)
 
     def speak(self, text: str) -> None:
         """Synthesize and immediately play audio.
 
+        Playback starts after the first sentence; the rest is synthesized meanwhile.
+
         Args:
             text: Text to speak.
         """
-        import pygame
-
-        audio_data = self.synthesize(text)
+        speak_pipelined(self.synthesize, text)
 
-        # Initialize pygame mixer
-        pygame.mixer.init()
+    async def speak_async(self, text: str) -> None:
+        """Asynchronously synthesize and play audio.
 
-        # Load and play audio
-        audio_buffer = io.BytesIO(audio_data)
-        pygame.mixer.music.load(audio_buffer, "mp3")
-        pygame.mixer.music.play()
-
-        # Wait for playback to finish
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
+        Args:
+            text: Text to speak.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_PLAYBACK_POOL, self.speak, text)
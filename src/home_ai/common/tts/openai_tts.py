@@ -1,12 +1,25 @@
 """OpenAI TTS API implementation."""
 
-import io
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 from openai import AsyncOpenAI, OpenAI
 
+from home_ai.common.http import get_shared_async_http, get_shared_http
+from home_ai.common.tts.batch import synthesize_many
+from home_ai.common.tts.cache import TTSCache
+from home_ai.common.tts.playback import speak_pipelined
+
 VoiceType = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
 
+# Bounded pool for blocking playback in speak_async
+_TTS_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="openai-tts")
+
+# Size of the audio chunks yielded by stream_synthesize
+_STREAM_CHUNK_SIZE = 4096
+
 
 class OpenAITTS:
     """Text-to-Speech using OpenAI TTS API.
@@ -20,6 +33,8 @@ class OpenAITTS:
         api_key: str,
         model: str = "tts-1",
         voice: VoiceType = "alloy",
+        cache: TTSCache | None = None,
+        max_concurrency: int = 5,
     ):
         """Initialize OpenAI TTS.
 
@@ -27,11 +42,15 @@ class OpenAITTS:
             api_key: OpenAI API key.
             model: TTS model to use (tts-1 or tts-1-hd).
             voice: Voice to use for synthesis.
+            cache: Audio cache. Defaults to an in-memory cache.
+            max_concurrency: Default concurrency for synthesize_many (mind API rate limits).
         """
         self.model = model
         self.voice = voice
-        self._client = OpenAI(api_key=api_key)
-        self._async_client = AsyncOpenAI(api_key=api_key)
+        self.max_concurrency = max_concurrency
+        self._cache = cache or TTSCache()
+        self._client = OpenAI(api_key=api_key, http_client=get_shared_http())
+        self._async_client = AsyncOpenAI(api_key=api_key, http_client=get_shared_async_http())
 
     def synthesize(self, text: str) -> bytes:
         """Synthesize text to audio bytes.
@@ -42,12 +61,18 @@ class OpenAITTS:
         Returns:
             Audio bytes in MP3 format.
         """
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         response = self._client.audio.speech.create(
             model=self.model,
             voice=self.voice,
             input=text,
         )
 
+        self._cache.put(key, response.content)
         return response.content
 
     async def synthesize_async(self, text: str) -> bytes:
@@ -59,32 +84,80 @@ class OpenAITTS:
         Returns:
             Audio bytes in MP3 format.
         """
+        key = self._cache_key(text)
+        cached = await self._cache.get_async(key)
+        if cached is not None:
+            return cached
+
         response = await self._async_client.audio.speech.create(
             model=self.model,
             voice=self.voice,
             input=text,
         )
 
+        await self._cache.put_async(key, response.content)
         return response.content
 
+    async def stream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize text, yielding MP3 chunks as they arrive from the API.
+
+        The complete clip is cached once the stream finishes; cached clips
+        are yielded in one piece.
+
+        Args:
+            text: Text to convert to speech.
+
+        Yields:
+            Chunks of MP3 audio, in order.
+        """
+        key = self._cache_key(text)
+        cached = await self._cache.get_async(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async with self._async_client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+        ) as response:
+            async for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                yield chunk
+
+        await self._cache.put_async(key, b"".join(chunks))
+
+    async def synthesize_many(self, texts: list[str], max_concurrency: int | None = None) -> list[bytes]:
+        """Synthesize several texts concurrently over the shared HTTP pool.
+
+        Args:
+            texts: Texts to convert to speech.
+            max_concurrency: Override for the instance's max_concurrency.
+
+        Returns:
+            Audio bytes in MP3 format for each text, in input order.
+        """
+        return await synthesize_many(self.synthesize_async, texts, max_concurrency or self.max_concurrency)
+
+    def _cache_key(self, text: str) -> str:
+        return TTSCache.key("openai", self.model, self.voice, text)
+
     def speak(self, text: str) -> None:
         """Synthesize and immediately play audio.
 
+        Playback starts after the first sentence; the rest is synthesized meanwhile.
+
         Args:
             text: Text to speak.
         """
-        import pygame
-
-        audio_data = self.synthesize(text)
-
-        # Initialize pygame mixer
-        pygame.mixer.init()
+        speak_pipelined(self.synthesize, text)
 
-        # Load and play audio
-        audio_buffer = io.BytesIO(audio_data)
-        pygame.mixer.music.load(audio_buffer, "mp3")
-        pygame.mixer.music.play()
+    async def speak_async(self, text: str) -> None:
+        """Asynchronously synthesize and play audio.
 
-        # Wait for playback to finish
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
+        Args:
+            text: Text to speak.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_TTS_POOL, self.speak, text)
@@ -0,0 +1,74 @@
+"""Audio playback shared by TTS implementations."""
+
+import io
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.。!?])\s+")
+
+# How often to check whether playback has finished
+_PLAYBACK_POLL_MS = 100
+
+_mixer_lock = threading.Lock()
+
+
+def _ensure_mixer() -> None:
+    """Open the audio device once; re-initializing the mixer costs tens of ms."""
+    with _mixer_lock:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+
+def split_first_sentence(text: str) -> tuple[str, str]:
+    """Split text into its first sentence and the remainder.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Tuple of (first sentence, rest). Rest is empty for single-sentence text.
+    """
+    parts = _SENTENCE_END.split(text.strip(), maxsplit=1)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def play_mp3(audio_data: bytes) -> None:
+    """Play MP3 audio and block until playback finishes.
+
+    Args:
+        audio_data: MP3 audio bytes.
+    """
+    _ensure_mixer()
+
+    pygame.mixer.music.load(io.BytesIO(audio_data), "mp3")
+    pygame.mixer.music.play()
+
+    # Wait for playback to finish
+    while pygame.mixer.music.get_busy():
+        pygame.time.wait(_PLAYBACK_POLL_MS)
+
+
+def speak_pipelined(synthesize: Callable[[str], bytes], text: str) -> None:
+    """Synthesize and play text, starting playback after the first sentence.
+
+    The remainder is synthesized in a background thread while the first
+    sentence plays, so first-audio latency doesn't grow with text length.
+
+    Args:
+        synthesize: Function converting text to MP3 bytes.
+        text: Text to speak.
+    """
+    first, rest = split_first_sentence(text)
+    if not rest:
+        play_mp3(synthesize(first))
+        return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-speak") as pool:
+        remainder = pool.submit(synthesize, rest)
+        play_mp3(synthesize(first))
+        play_mp3(remainder.result())
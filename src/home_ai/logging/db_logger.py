@@ -1,25 +1,66 @@
 """Database logging implementation for PostgreSQL."""
 
+import atexit
+import logging
+import queue
+import threading
+import time
 from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
 from home_ai.logging.models import ErrorLog, RequestLog
 
+logger = logging.getLogger(__name__)
+
+# Queue sentinel that stops the writer thread
+_STOP = object()
+
+# Open loggers, closed by one exit hook; close() removes a logger so it can be freed
+_open_loggers: set["DatabaseLogger"] = set()
+
+
+@atexit.register
+def _close_loggers() -> None:
+    """Write out pending entries before the interpreter exits."""
+    for db_logger in list(_open_loggers):
+        db_logger.close()
+
 
 class DatabaseLogger:
     """Logger that writes to PostgreSQL database.
 
-    Used for server-side logging of requests and errors.
+    Used for server-side logging of requests and errors. Entries are queued and
+    written by a background thread in batches, one commit per batch, so logging
+    never blocks the request path on a database round trip. ``dropped`` counts
+    entries rejected by a full queue and ``failed`` entries lost to write errors.
     """
 
-    def __init__(self, session_factory: Callable):
+    def __init__(
+        self,
+        session_factory: Callable,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_queue_size: int = 10_000,
+    ):
         """Initialize database logger.
 
         Args:
             session_factory: Callable that returns a database session.
+            batch_size: Maximum number of entries written per commit.
+            flush_interval: Seconds to wait for more entries before writing a batch.
+            max_queue_size: Maximum number of pending entries; new entries are dropped when full.
         """
         self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self.failed = 0
+
+        self._writer = threading.Thread(target=self._run, name="db-logger", daemon=True)
+        self._writer.start()
+        _open_loggers.add(self)
 
     def log_request(
         self,
@@ -44,9 +85,8 @@ class DatabaseLogger:
             iot_commands: List of IoT commands executed.
             level: Log level.
         """
-        session = self._session_factory()
-        try:
-            log_entry = RequestLog(
+        self._enqueue(
+            RequestLog(
                 request_id=request_id,
                 user_id=user_id,
                 input_type=input_type,
@@ -56,10 +96,7 @@ class DatabaseLogger:
                 duration_ms=duration_ms,
                 level=level,
             )
-            session.add(log_entry)
-            session.commit()
-        finally:
-            session.close()
+        )
 
     def log_error(
         self,
@@ -76,15 +113,72 @@ class DatabaseLogger:
             stack_trace: Full stack trace.
             request_id: Optional request ID if error occurred during request.
         """
-        session = self._session_factory()
-        try:
-            log_entry = ErrorLog(
+        self._enqueue(
+            ErrorLog(
                 request_id=request_id,
                 error_type=error_type,
                 error_message=error_message,
                 stack_trace=stack_trace,
             )
-            session.add(log_entry)
+        )
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write pending entries and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        _open_loggers.discard(self)
+
+    def _enqueue(self, entry: RequestLog | ErrorLog) -> None:
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            # Drop rather than block the request path when the database falls behind
+            self.dropped += 1
+
+    def _run(self) -> None:
+        """Writer thread: collect entries into batches and commit each batch once."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size and batch[-1] is not _STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            entries = [entry for entry in batch if entry is not _STOP]
+            if entries:
+                self._write(entries)
+            for _ in batch:
+                self._queue.task_done()
+
+            if batch[-1] is _STOP:
+                return
+
+    def _write(self, entries: list[RequestLog | ErrorLog]) -> None:
+        try:
+            self._write_batch(entries)
+        except Exception:
+            self.failed += len(entries)
+            logger.exception("Failed to write %d log entries", len(entries))
+
+    def _write_batch(self, entries: list[RequestLog | ErrorLog]) -> None:
+        """Write one batch in a single commit; runs on the writer thread.
+
+        Subclasses override this to write through a different session type.
+        """
+        session = self._session_factory()
+        try:
+            for entry in entries:
+                session.add(entry)
             session.commit()
         finally:
             session.close()
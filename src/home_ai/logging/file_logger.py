@@ -1,15 +1,85 @@
 """File-based logging implementation."""
 
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import os
+import queue
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
+# Background listeners by logger name, so re-creating a logger replaces its listener
+_listeners: dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Drain a listener's queue, then close its file handlers.
+
+    QueueListener.stop() leaves its handlers open, which would leak a file
+    descriptor every time a logger is re-created.
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Write out pending records before the interpreter exits."""
+    for listener in _listeners.values():
+        _stop_listener(listener)
+    _listeners.clear()
+
+
+class _DailyFileHandler(logging.FileHandler):
+    """File handler writing to ``{prefix}-YYYY-MM-DD.log``, switching files at midnight."""
+
+    def __init__(self, log_dir: Path, prefix: str):
+        self._log_dir = log_dir
+        self._prefix = prefix
+        now = datetime.now()
+        self._rollover_at = self._next_midnight(now.date())
+        super().__init__(self._path_for(now.date()), encoding="utf-8")
+
+    def _path_for(self, day: date) -> Path:
+        return self._log_dir / f"{self._prefix}-{day:%Y-%m-%d}.log"
+
+    @staticmethod
+    def _next_midnight(day: date) -> float:
+        return datetime.combine(day + timedelta(days=1), time.min).timestamp()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.created >= self._rollover_at:
+            day = datetime.fromtimestamp(record.created).date()
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = os.path.abspath(self._path_for(day))
+            self._rollover_at = self._next_midnight(day)
+        super().emit(record)
+
+
+class _ContextFilter(logging.Filter):
+    """Render a record's ``ctx`` dict as a ``" | k=v ..."`` message tail.
+
+    Runs on the handler, so the tail is only built for records that are emitted.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        ctx = getattr(record, "ctx", None)
+        if ctx:
+            record.msg = f"{record.msg} | " + " ".join(f"{k}={v}" for k, v in ctx.items())
+            record.ctx = None
+        return True
+
 
 class FileLogger:
     """File logger with daily rotation.
 
-    Creates log files with date-based naming and automatic rotation.
+    Creates log files with date-based naming and automatic rotation. Records
+    are handed to a background thread through a queue, so logging calls never
+    wait on disk I/O.
     """
 
     def __init__(
@@ -42,10 +112,7 @@ class FileLogger:
         self._logger.handlers.clear()
 
         # Create file handler with daily rotation
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_file = self.log_dir / f"{name}-{today}.log"
-
-        handler = logging.FileHandler(log_file, encoding="utf-8")
+        handler = _DailyFileHandler(self.log_dir, name)
         handler.setLevel(self.level)
 
         # Set format
@@ -53,34 +120,47 @@ class FileLogger:
             format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         formatter = logging.Formatter(format_string)
         handler.setFormatter(formatter)
+        handler.addFilter(_ContextFilter())
+
+        # The logger only enqueues; a listener thread owns the file handler
+        self._queue: queue.Queue = queue.Queue()
+        self._logger.addHandler(logging.handlers.QueueHandler(self._queue))
+
+        previous = _listeners.pop(self._logger.name, None)
+        if previous is not None:
+            _stop_listener(previous)
+        self._listener = logging.handlers.QueueListener(self._queue, handler, respect_handler_level=True)
+        self._listener.start()
+        _listeners[self._logger.name] = self._listener
 
-        self._logger.addHandler(handler)
+    def flush(self) -> None:
+        """Block until every queued record has been written to the file."""
+        self._queue.join()
 
-    def _format_extra(self, extra: dict[str, Any] | None) -> str:
-        """Format extra data for logging."""
-        if extra:
-            return " | " + " ".join(f"{k}={v}" for k, v in extra.items())
-        return ""
+    def _log(self, level: int, message: str, extra: dict[str, Any] | None) -> None:
+        """Log a message, passing extra data through for the handler to render."""
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, message, extra={"ctx": extra} if extra else None)
 
     def debug(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log debug message."""
-        self._logger.debug(message + self._format_extra(extra))
+        self._log(logging.DEBUG, message, extra)
 
     def info(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log info message."""
-        self._logger.info(message + self._format_extra(extra))
+        self._log(logging.INFO, message, extra)
 
     def warning(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log warning message."""
-        self._logger.warning(message + self._format_extra(extra))
+        self._log(logging.WARNING, message, extra)
 
     def error(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log error message."""
-        self._logger.error(message + self._format_extra(extra))
+        self._log(logging.ERROR, message, extra)
 
     def critical(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log critical message."""
-        self._logger.critical(message + self._format_extra(extra))
+        self._log(logging.CRITICAL, message, extra)
 
 
 def get_client_logger(log_dir: str = "./logs/client") -> FileLogger:
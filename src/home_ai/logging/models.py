@@ -1,19 +1,21 @@
 """Database models for logging."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
 
+@dataclass(slots=True, kw_only=True)
+class RequestLog:
+    """Model for request logs stored in PostgreSQL.
 
-class RequestLog(BaseModel):
-    """Model for request logs stored in PostgreSQL."""
-
-    model_config = ConfigDict(from_attributes=True)
+    A plain slotted dataclass: log rows are built on every request and never
+    cross an API boundary, so they skip pydantic validation.
+    """
 
     id: int | None = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     request_id: UUID
     user_id: str | None = None
     input_type: str  # 'text' or 'audio'
@@ -24,13 +26,12 @@ class RequestLog(BaseModel):
     level: str = "INFO"
 
 
-class ErrorLog(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ErrorLog:
     """Model for error logs stored in PostgreSQL."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int | None = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     request_id: UUID | None = None
     error_type: str
     error_message: str
@@ -1,11 +1,22 @@
 """Alarm device implementation."""
 
 from datetime import datetime
+from time import time_ns
 from typing import Any
 
 from home_ai.common.models import IoTCommand, IoTResult
 from home_ai.mcp_iot.devices.base import BaseDevice
 
+_MSG_SET_NO_TIME = "알람 시간을 지정해주세요."
+_MSG_CANCEL_NO_TIME = "취소할 알람 시간을 지정해주세요."
+
+
+def _serialize(alarm: dict[str, Any]) -> dict[str, Any]:
+    """Convert a stored alarm to its public form with an ISO ``created_at``."""
+    public = {k: v for k, v in alarm.items() if k != "created_at_ns"}
+    public["created_at"] = datetime.fromtimestamp(alarm["created_at_ns"] / 1e9).isoformat()
+    return public
+
 
 class Alarm(BaseDevice):
     """Simulated alarm device.
@@ -13,9 +24,14 @@ class Alarm(BaseDevice):
     Supports setting, canceling, and listing alarms.
     """
 
+    __slots__ = ("_alarms", "_actions")
+
     def __init__(self):
         """Initialize alarm device."""
-        self._alarms: list[dict[str, Any]] = []
+        # Alarms keyed by time; setting an existing time replaces that alarm.
+        # created_at is kept as epoch nanoseconds and only formatted when serialized.
+        self._alarms: dict[str, dict[str, Any]] = {}
+        self._actions = {"set": self._set, "cancel": self._cancel, "list": self._list}
 
     @property
     def device_type(self) -> str:
@@ -30,47 +46,39 @@ class Alarm(BaseDevice):
         - cancel: Cancel an alarm (requires 'time' parameter)
         - list: List all alarms
         """
-        action = command.action
-        params = command.parameters
-
-        if action == "set":
-            time = params.get("time")
-            label = params.get("label", "")
-
-            if not time:
-                return IoTResult(success=False, message="알람 시간을 지정해주세요.", data={})
+        return self._dispatch(command)
 
-            alarm = {"time": time, "label": label, "enabled": True, "created_at": datetime.now().isoformat()}
-            self._alarms.append(alarm)
+    def _set(self, params: dict[str, Any]) -> IoTResult:
+        time = params.get("time")
+        label = params.get("label", "")
 
-            return IoTResult(success=True, message=f"{time}에 알람을 설정했습니다.", data={"alarm": alarm})
+        if not time:
+            return IoTResult(success=False, message=_MSG_SET_NO_TIME)
 
-        elif action == "cancel":
-            time = params.get("time")
+        alarm = {"time": time, "label": label, "enabled": True, "created_at_ns": time_ns()}
+        self._alarms[time] = alarm
 
-            if not time:
-                return IoTResult(success=False, message="취소할 알람 시간을 지정해주세요.", data={})
+        return IoTResult(success=True, message=f"{time}에 알람을 설정했습니다.", data={"alarm": _serialize(alarm)})
 
-            original_count = len(self._alarms)
-            self._alarms = [a for a in self._alarms if a["time"] != time]
+    def _cancel(self, params: dict[str, Any]) -> IoTResult:
+        time = params.get("time")
 
-            if len(self._alarms) < original_count:
-                return IoTResult(success=True, message=f"{time} 알람을 취소했습니다.", data=self.get_state())
-            else:
-                return IoTResult(success=False, message=f"{time}에 설정된 알람이 없습니다.", data={})
+        if not time:
+            return IoTResult(success=False, message=_MSG_CANCEL_NO_TIME)
 
-        elif action == "list":
-            return IoTResult(
-                success=True,
-                message=f"{len(self._alarms)}개의 알람이 설정되어 있습니다.",
-                data={"alarms": self._alarms},
-            )
+        if self._alarms.pop(time, None) is None:
+            return IoTResult(success=False, message=f"{time}에 설정된 알람이 없습니다.")
+        return IoTResult(success=True, message=f"{time} 알람을 취소했습니다.", data=self.get_state())
 
-        else:
-            return IoTResult(success=False, message=f"알 수 없는 동작: {action}", data={})
+    def _list(self, params: dict[str, Any]) -> IoTResult:
+        return IoTResult(
+            success=True,
+            message=f"{len(self._alarms)}개의 알람이 설정되어 있습니다.",
+            data=self.get_state(),
+        )
 
     def get_state(self) -> dict[str, Any]:
         """Get current alarm state."""
         return {
-            "alarms": self._alarms,
+            "alarms": [_serialize(alarm) for alarm in self._alarms.values()],
         }
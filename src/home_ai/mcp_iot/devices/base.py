@@ -1,13 +1,22 @@
 """Base class for IoT devices."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from home_ai.common.models import IoTCommand, IoTResult
 
 
 class BaseDevice(ABC):
-    """Abstract base class for IoT devices."""
+    """Abstract base class for IoT devices.
+
+    Subclasses map action names to handlers in ``_actions`` and dispatch
+    commands with :meth:`_dispatch`.
+    """
+
+    __slots__ = ()
+
+    _actions: dict[str, Callable[[dict[str, Any]], IoTResult]]
 
     @property
     @abstractmethod
@@ -24,3 +33,10 @@ class BaseDevice(ABC):
     def get_state(self) -> dict[str, Any]:
         """Get the current state of the device."""
         ...
+
+    def _dispatch(self, command: IoTCommand) -> IoTResult:
+        """Run the handler registered for the command's action."""
+        handler = self._actions.get(command.action)
+        if handler is None:
+            return IoTResult(success=False, message=f"알 수 없는 동작: {command.action}")
+        return handler(command.parameters)
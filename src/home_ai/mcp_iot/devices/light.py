@@ -12,15 +12,35 @@ class Light(BaseDevice):
     Supports on/off control and brightness adjustment.
     """
 
+    __slots__ = ("_room", "_power", "_brightness", "_results", "_actions", "_msg_on", "_msg_off", "_state")
+
     def __init__(self, room: str = "default"):
         """Initialize light device.
 
         Args:
             room: Room identifier where the light is located.
         """
-        self.room = room
         self._power = "off"
         self._brightness = 0
+        # Results for the current state, reused while a command doesn't change it.
+        # Callers get copies, so the cached instances are never mutated.
+        self._results: dict[str, IoTResult] = {}
+        self._state: dict[str, Any] | None = None
+        self._actions = {"on": self._on, "off": self._off, "set_brightness": self._set_brightness}
+        self.room = room
+
+    @property
+    def room(self) -> str:
+        """Room identifier where the light is located."""
+        return self._room
+
+    @room.setter
+    def room(self, room: str) -> None:
+        self._room = room
+        self._msg_on = f"{room} 조명을 켰습니다."
+        self._msg_off = f"{room} 조명을 껐습니다."
+        self._results.clear()
+        self._state = None
 
     @property
     def device_type(self) -> str:
@@ -35,35 +55,46 @@ class Light(BaseDevice):
         - off: Turn light off
         - set_brightness: Set brightness level (0-100)
         """
-        action = command.action
-        params = command.parameters
-
-        if action == "on":
-            self._power = "on"
-            self._brightness = 100
-            return IoTResult(success=True, message=f"{self.room} 조명을 켰습니다.", data=self.get_state())
-
-        elif action == "off":
-            self._power = "off"
-            self._brightness = 0
-            return IoTResult(success=True, message=f"{self.room} 조명을 껐습니다.", data=self.get_state())
-
-        elif action == "set_brightness":
-            brightness = params.get("brightness", 100)
-            brightness = max(0, min(100, brightness))  # Clamp to 0-100
+        return self._dispatch(command)
+
+    def _on(self, params: dict[str, Any]) -> IoTResult:
+        self._set("on", 100)
+        return self._result("on", self._msg_on)
+
+    def _off(self, params: dict[str, Any]) -> IoTResult:
+        self._set("off", 0)
+        return self._result("off", self._msg_off)
+
+    def _set_brightness(self, params: dict[str, Any]) -> IoTResult:
+        brightness = params.get("brightness", 100)
+        brightness = max(0, min(100, brightness))  # Clamp to 0-100
+        self._set("on" if brightness > 0 else "off", brightness)
+        return self._result(f"set_brightness:{brightness}", f"{self.room} 조명 밝기를 {brightness}%로 설정했습니다.")
+
+    def _set(self, power: str, brightness: int) -> None:
+        """Update state, dropping cached results if anything changed."""
+        if power != self._power or brightness != self._brightness:
+            self._power = power
             self._brightness = brightness
-            self._power = "on" if brightness > 0 else "off"
-            return IoTResult(
-                success=True, message=f"{self.room} 조명 밝기를 {brightness}%로 설정했습니다.", data=self.get_state()
-            )
+            self._results.clear()
+            self._state = None
 
-        else:
-            return IoTResult(success=False, message=f"알 수 없는 동작: {action}", data={})
+    def _result(self, key: str, message: str) -> IoTResult:
+        """Get a copy of the success result for a command, building it once per state."""
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = IoTResult(success=True, message=message, data=self.get_state())
+        return result.model_copy(update={"data": self.get_state()})
 
     def get_state(self) -> dict[str, Any]:
-        """Get current light state."""
-        return {
-            "room": self.room,
-            "power": self._power,
-            "brightness": self._brightness,
-        }
+        """Get current light state.
+
+        The dict is cached until the state changes; each call returns a copy.
+        """
+        if self._state is None:
+            self._state = {
+                "room": self.room,
+                "power": self._power,
+                "brightness": self._brightness,
+            }
+        return dict(self._state)
@@ -7,6 +7,8 @@ from home_ai.mcp_iot.devices.base import BaseDevice
 
 ThermostatMode = Literal["off", "heating", "cooling", "auto"]
 
+_MODE_NAMES = {"off": "끔", "heating": "난방", "cooling": "냉방", "auto": "자동"}
+
 
 class Thermostat(BaseDevice):
     """Simulated thermostat device.
@@ -14,6 +16,8 @@ class Thermostat(BaseDevice):
     Supports temperature and mode control.
     """
 
+    __slots__ = ("_current_temp", "_target_temp", "_mode", "_off_result", "_actions", "_state")
+
     def __init__(self, current_temp: float = 22.0, target_temp: float = 22.0):
         """Initialize thermostat device.
 
@@ -24,6 +28,11 @@ class Thermostat(BaseDevice):
         self._current_temp = current_temp
         self._target_temp = target_temp
         self._mode: ThermostatMode = "auto"
+        # Result of "off", reused while the thermostat stays off; dropped whenever
+        # the state changes. Callers get copies.
+        self._off_result: IoTResult | None = None
+        self._state: dict[str, Any] | None = None
+        self._actions = {"set_temp": self._set_temp, "set_mode": self._set_mode, "off": self._off}
 
     @property
     def device_type(self) -> str:
@@ -38,50 +47,54 @@ class Thermostat(BaseDevice):
         - set_mode: Set mode ('off', 'heating', 'cooling', 'auto')
         - off: Turn off thermostat
         """
-        action = command.action
-        params = command.parameters
-
-        if action == "set_temp":
-            temp = params.get("temperature")
+        return self._dispatch(command)
 
-            if temp is None:
-                return IoTResult(success=False, message="온도를 지정해주세요.", data={})
+    def _set_temp(self, params: dict[str, Any]) -> IoTResult:
+        temp = params.get("temperature")
 
-            # Clamp temperature to reasonable range
-            temp = max(10, min(35, float(temp)))
-            self._target_temp = temp
+        if temp is None:
+            return IoTResult(success=False, message="온도를 지정해주세요.", data={})
 
-            # Auto-enable if was off
-            if self._mode == "off":
-                self._mode = "auto"
+        # Clamp temperature to reasonable range
+        temp = max(10, min(35, float(temp)))
+        self._target_temp = temp
 
-            return IoTResult(success=True, message=f"온도를 {temp}°C로 설정했습니다.", data=self.get_state())
+        # Auto-enable if was off
+        if self._mode == "off":
+            self._mode = "auto"
+        self._state = None
+        self._off_result = None
 
-        elif action == "set_mode":
-            mode = params.get("mode")
+        return IoTResult(success=True, message=f"온도를 {temp}°C로 설정했습니다.", data=self.get_state())
 
-            if mode not in ("off", "heating", "cooling", "auto"):
-                return IoTResult(success=False, message=f"지원하지 않는 모드입니다: {mode}", data={})
+    def _set_mode(self, params: dict[str, Any]) -> IoTResult:
+        mode = params.get("mode")
 
-            self._mode = mode
+        if mode not in _MODE_NAMES:
+            return IoTResult(success=False, message=f"지원하지 않는 모드입니다: {mode}", data={})
 
-            mode_names = {"off": "끔", "heating": "난방", "cooling": "냉방", "auto": "자동"}
+        self._mode = mode
+        self._state = None
+        self._off_result = None
 
-            return IoTResult(
-                success=True, message=f"모드를 {mode_names[mode]}(으)로 설정했습니다.", data=self.get_state()
-            )
+        return IoTResult(success=True, message=f"모드를 {_MODE_NAMES[mode]}(으)로 설정했습니다.", data=self.get_state())
 
-        elif action == "off":
+    def _off(self, params: dict[str, Any]) -> IoTResult:
+        if self._mode != "off" or self._off_result is None:
             self._mode = "off"
-            return IoTResult(success=True, message="온도 조절기를 껐습니다.", data=self.get_state())
-
-        else:
-            return IoTResult(success=False, message=f"알 수 없는 동작: {action}", data={})
+            self._state = None
+            self._off_result = IoTResult(success=True, message="온도 조절기를 껐습니다.", data=self.get_state())
+        return self._off_result.model_copy(update={"data": self.get_state()})
 
     def get_state(self) -> dict[str, Any]:
-        """Get current thermostat state."""
-        return {
-            "current_temp": self._current_temp,
-            "target_temp": self._target_temp,
-            "mode": self._mode,
-        }
+        """Get current thermostat state.
+
+        The dict is cached until the state changes; each call returns a copy.
+        """
+        if self._state is None:
+            self._state = {
+                "current_temp": self._current_temp,
+                "target_temp": self._target_temp,
+                "mode": self._mode,
+            }
+        return dict(self._state)
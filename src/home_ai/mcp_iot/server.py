@@ -3,6 +3,7 @@
 import asyncio
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
@@ -12,6 +13,88 @@ from home_ai.mcp_iot.devices.alarm import Alarm
 from home_ai.mcp_iot.devices.light import Light
 from home_ai.mcp_iot.devices.thermostat import Thermostat
 
+# Tool schemas are fully static, so they're built once at import
+_TOOL_SCHEMAS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "control_light",
+        "description": "조명을 제어합니다. 켜기, 끄기, 밝기 조절이 가능합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "room": {
+                    "type": "string",
+                    "description": "방 이름 (living_room, bedroom, kitchen)",
+                    "enum": ["living_room", "bedroom", "kitchen"],
+                },
+                "action": {
+                    "type": "string",
+                    "description": "동작 (on, off, set_brightness)",
+                    "enum": ["on", "off", "set_brightness"],
+                },
+                "brightness": {
+                    "type": "integer",
+                    "description": "밝기 (0-100), set_brightness 동작 시 필요",
+                    "minimum": 0,
+                    "maximum": 100,
+                },
+            },
+            "required": ["room", "action"],
+        },
+    },
+    {
+        "name": "control_alarm",
+        "description": "알람을 제어합니다. 설정, 취소, 목록 조회가 가능합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "description": "동작 (set, cancel, list)",
+                    "enum": ["set", "cancel", "list"],
+                },
+                "time": {
+                    "type": "string",
+                    "description": "알람 시간 (HH:MM 형식)",
+                    "pattern": "^([01]?[0-9]|2[0-3]):[0-5][0-9]$",
+                },
+                "label": {"type": "string", "description": "알람 라벨"},
+            },
+            "required": ["action"],
+        },
+    },
+    {
+        "name": "control_thermostat",
+        "description": "온도 조절기를 제어합니다. 온도 설정, 모드 변경이 가능합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "description": "동작 (set_temp, set_mode, off)",
+                    "enum": ["set_temp", "set_mode", "off"],
+                },
+                "temperature": {
+                    "type": "number",
+                    "description": "목표 온도 (10-35°C)",
+                    "minimum": 10,
+                    "maximum": 35,
+                },
+                "mode": {
+                    "type": "string",
+                    "description": "모드 (heating, cooling, auto)",
+                    "enum": ["heating", "cooling", "auto"],
+                },
+            },
+            "required": ["action"],
+        },
+    },
+    {
+        "name": "get_device_status",
+        "description": "모든 디바이스의 현재 상태를 조회합니다.",
+        "inputSchema": {"type": "object", "properties": {}, "required": []},
+    },
+)
+
 
 class IoTController:
     """Controller for managing IoT devices.
@@ -29,88 +112,12 @@ class IoTController:
         self._alarm = Alarm()
         self._thermostat = Thermostat()
 
-    def get_tools(self) -> list[dict[str, Any]]:
-        """Get list of available tools for MCP."""
-        return [
-            {
-                "name": "control_light",
-                "description": "조명을 제어합니다. 켜기, 끄기, 밝기 조절이 가능합니다.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "room": {
-                            "type": "string",
-                            "description": "방 이름 (living_room, bedroom, kitchen)",
-                            "enum": ["living_room", "bedroom", "kitchen"],
-                        },
-                        "action": {
-                            "type": "string",
-                            "description": "동작 (on, off, set_brightness)",
-                            "enum": ["on", "off", "set_brightness"],
-                        },
-                        "brightness": {
-                            "type": "integer",
-                            "description": "밝기 (0-100), set_brightness 동작 시 필요",
-                            "minimum": 0,
-                            "maximum": 100,
-                        },
-                    },
-                    "required": ["room", "action"],
-                },
-            },
-            {
-                "name": "control_alarm",
-                "description": "알람을 제어합니다. 설정, 취소, 목록 조회가 가능합니다.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "action": {
-                            "type": "string",
-                            "description": "동작 (set, cancel, list)",
-                            "enum": ["set", "cancel", "list"],
-                        },
-                        "time": {
-                            "type": "string",
-                            "description": "알람 시간 (HH:MM 형식)",
-                            "pattern": "^([01]?[0-9]|2[0-3]):[0-5][0-9]$",
-                        },
-                        "label": {"type": "string", "description": "알람 라벨"},
-                    },
-                    "required": ["action"],
-                },
-            },
-            {
-                "name": "control_thermostat",
-                "description": "온도 조절기를 제어합니다. 온도 설정, 모드 변경이 가능합니다.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "action": {
-                            "type": "string",
-                            "description": "동작 (set_temp, set_mode, off)",
-                            "enum": ["set_temp", "set_mode", "off"],
-                        },
-                        "temperature": {
-                            "type": "number",
-                            "description": "목표 온도 (10-35°C)",
-                            "minimum": 10,
-                            "maximum": 35,
-                        },
-                        "mode": {
-                            "type": "string",
-                            "description": "모드 (heating, cooling, auto)",
-                            "enum": ["heating", "cooling", "auto"],
-                        },
-                    },
-                    "required": ["action"],
-                },
-            },
-            {
-                "name": "get_device_status",
-                "description": "모든 디바이스의 현재 상태를 조회합니다.",
-                "inputSchema": {"type": "object", "properties": {}, "required": []},
-            },
-        ]
+    def get_tools(self) -> tuple[dict[str, Any], ...]:
+        """Get list of available tools for MCP.
+
+        The schemas are static and shared; callers must not mutate them.
+        """
+        return _TOOL_SCHEMAS
 
     async def control_light(self, room: str, action: str, brightness: int | None = None) -> dict[str, Any]:
         """Control a light device.
@@ -195,6 +202,22 @@ class IoTController:
         }
 
 
+# Process-wide controller shared by the REST endpoints and the LLMs
+_iot_controller: IoTController | None = None
+
+
+def get_iot_controller() -> IoTController:
+    """Get the shared IoT controller.
+
+    Returns:
+        IoTController instance (singleton).
+    """
+    global _iot_controller
+    if _iot_controller is None:
+        _iot_controller = IoTController()
+    return _iot_controller
+
+
 def create_mcp_server() -> Server:
     """Create and configure the MCP server.
 
@@ -203,30 +226,32 @@ def create_mcp_server() -> Server:
     """
     server = Server("home-ai-iot")
     controller = IoTController()
+    tools = [Tool(name=t["name"], description=t["description"], inputSchema=t["inputSchema"]) for t in _TOOL_SCHEMAS]
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available tools."""
-        tools = controller.get_tools()
-        return [Tool(name=t["name"], description=t["description"], inputSchema=t["inputSchema"]) for t in tools]
+        return tools
+
+    dispatch = {
+        "control_light": controller.control_light,
+        "control_alarm": controller.control_alarm,
+        "control_thermostat": controller.control_thermostat,
+    }
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         """Handle tool calls."""
-        if name == "control_light":
-            result = await controller.control_light(**arguments)
-        elif name == "control_alarm":
-            result = await controller.control_alarm(**arguments)
-        elif name == "control_thermostat":
-            result = await controller.control_thermostat(**arguments)
+        handler = dispatch.get(name)
+        if handler is not None:
+            result = await handler(**arguments)
         elif name == "get_device_status":
             result = {"success": True, "message": "디바이스 상태 조회 완료", "states": controller.get_all_states()}
         else:
             result = {"success": False, "message": f"Unknown tool: {name}"}
 
-        import json
-
-        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
+        # orjson keeps non-ASCII text as UTF-8, like json.dumps(ensure_ascii=False)
+        return [TextContent(type="text", text=orjson.dumps(result).decode())]
 
     return server
 
@@ -0,0 +1,39 @@
+"""Base64 helpers for audio carried in JSON payloads."""
+
+import asyncio
+
+import pybase64
+
+# Below this size the codec runs faster than a thread hand-off, so it stays on the loop
+_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def b64decode_async(data: str | bytes) -> bytes:
+    """Decode base64 audio, off the event loop for large payloads.
+
+    pybase64 releases the GIL while decoding, so other connections keep
+    being served during the work.
+
+    Args:
+        data: Base64 encoded audio.
+
+    Returns:
+        Decoded audio bytes.
+    """
+    if len(data) < _OFFLOAD_THRESHOLD:
+        return pybase64.b64decode(data, validate=False)
+    return await asyncio.to_thread(pybase64.b64decode, data, validate=False)
+
+
+async def b64encode_async(data: bytes) -> str:
+    """Encode audio as base64, off the event loop for large payloads.
+
+    Args:
+        data: Audio bytes.
+
+    Returns:
+        Base64 encoded string.
+    """
+    if len(data) < _OFFLOAD_THRESHOLD:
+        return pybase64.b64encode_as_string(data)
+    return await asyncio.to_thread(pybase64.b64encode_as_string, data)
@@ -1,24 +1,23 @@
 """REST API endpoints."""
 
-from uuid import uuid4
+import asyncio
+import time
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+import msgpack
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Response, UploadFile
+from pydantic import BaseModel, Field, TypeAdapter
 
-from home_ai.mcp_iot.server import IoTController
+from home_ai.common.ids import new_request_id
+from home_ai.common.models import IoTCommand
+from home_ai.mcp_iot.server import IoTController, get_iot_controller
+from home_ai.server.api.codec import b64decode_async, b64encode_async
 
 router = APIRouter(prefix="/api", tags=["api"])
 
-# Global IoT controller instance
-_iot_controller: IoTController | None = None
+MSGPACK_MEDIA_TYPE = "application/msgpack"
 
-
-def get_iot_controller() -> IoTController:
-    """Get IoT controller instance."""
-    global _iot_controller
-    if _iot_controller is None:
-        _iot_controller = IoTController()
-    return _iot_controller
+# Dumps a whole command list in pydantic-core instead of a per-command Python loop
+_COMMANDS_ADAPTER = TypeAdapter(list[IoTCommand])
 
 
 class ChatRequestAPI(BaseModel):
@@ -27,6 +26,7 @@ class ChatRequestAPI(BaseModel):
     text: str | None = Field(None, description="Text input")
     audio: str | None = Field(None, description="Base64 encoded audio")
     mode: str = Field("text", description="Input mode: text or audio")
+    want_audio: bool | None = Field(None, description="Synthesize a spoken reply (defaults to mode == 'audio')")
 
 
 class ChatResponseAPI(BaseModel):
@@ -39,47 +39,99 @@ class ChatResponseAPI(BaseModel):
 
 
 @router.post("/chat", response_model=ChatResponseAPI)
-async def chat(request: ChatRequestAPI):
+async def chat(request: ChatRequestAPI, accept: str = Header("application/json")):
     """Process a chat request.
 
     Accepts text or audio input and returns AI response with IoT command results.
+    Responds with MessagePack (raw audio bytes) when the client accepts it.
     """
-    from home_ai.server.app import get_llm, get_stt, get_tts
-
-    request_id = str(uuid4())
-
     # Validate input
     if request.mode == "text" and not request.text:
         raise HTTPException(status_code=400, detail="Text input required for text mode")
     if request.mode == "audio" and not request.audio:
         raise HTTPException(status_code=400, detail="Audio input required for audio mode")
 
-    # Process input
-    input_text = request.text
-
+    audio_bytes = None
     if request.mode == "audio" and request.audio:
-        import base64
+        audio_bytes = await b64decode_async(request.audio)
+
+    return await _process_chat(request.text, audio_bytes, _wants_audio(request.mode, request.want_audio), accept)
+
+
+@router.post("/chat/audio", response_model=ChatResponseAPI)
+async def chat_audio(
+    audio: UploadFile = File(...),
+    mode: str = Form("audio"),
+    text: str | None = Form(None),
+    want_audio: bool | None = Form(None),
+    accept: str = Header("application/json"),
+):
+    """Process a chat request with raw audio sent as multipart/form-data.
+
+    Same as /chat, but skips the base64 round-trip for the audio payload.
+    """
+    audio_bytes = await audio.read()
+    if not audio_bytes:
+        raise HTTPException(status_code=400, detail="Audio input required for audio mode")
 
+    return await _process_chat(text, audio_bytes, _wants_audio(mode, want_audio), accept)
+
+
+def _wants_audio(mode: str, want_audio: bool | None) -> bool:
+    """Resolve whether to synthesize a spoken reply; audio-mode requests get one unless they opt out."""
+    return mode == "audio" if want_audio is None else want_audio
+
+
+async def _process_chat(
+    text: str | None, audio: bytes | None, want_audio: bool, accept: str
+) -> ChatResponseAPI | Response:
+    """Run STT (if needed), the LLM and TTS (if wanted) for a chat request.
+
+    The response is MessagePack-encoded when ``accept`` allows it, otherwise
+    JSON with base64 encoded audio.
+    """
+    from home_ai.server.app import get_llm, get_log_writer, get_stt, get_tts
+
+    started = time.perf_counter()
+    request_id = new_request_id()
+
+    # Process input
+    input_text = text
+
+    if audio:
         stt = get_stt()
-        audio_bytes = base64.b64decode(request.audio)
-        input_text = await stt.transcribe_async(audio_bytes)
+        input_text = await stt.transcribe_async(audio)
 
     # Get LLM response
     llm = get_llm()
     response = await llm.process_async(input_text)
 
+    # Synthesize the spoken reply while the response is built and the request logged
+    tts_task = asyncio.create_task(get_tts().synthesize_async(response.text)) if want_audio else None
+
     # Prepare response
     result = ChatResponseAPI(
-        text=response.text, commands_executed=[cmd.model_dump() for cmd in response.commands], request_id=request_id
+        text=response.text, commands_executed=_COMMANDS_ADAPTER.dump_python(response.commands), request_id=request_id
     )
 
-    # Generate audio response if needed
-    if request.mode == "audio":
-        import base64
-
-        tts = get_tts()
-        audio_bytes = await tts.synthesize_async(response.text)
-        result.audio = base64.b64encode(audio_bytes).decode()
+    log_writer = get_log_writer()
+    if log_writer is not None:
+        log_writer.log_request(
+            request_id=request_id,
+            input_type="audio" if audio else "text",
+            input_text=input_text,
+            output_text=response.text,
+            iot_commands=result.commands_executed,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    if MSGPACK_MEDIA_TYPE in accept:
+        payload = result.model_dump()
+        payload["audio"] = await tts_task if tts_task is not None else None
+        return Response(content=msgpack.packb(payload, use_bin_type=True), media_type=MSGPACK_MEDIA_TYPE)
+
+    if tts_task is not None:
+        result.audio = await b64encode_async(await tts_task)
 
     return result
 
@@ -1,34 +1,59 @@
 """WebSocket API handler."""
 
-from uuid import uuid4
+import asyncio
+import time
+from typing import Any
 
+import msgpack
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter
+
+from home_ai.common.ids import new_request_id
+from home_ai.common.models import IoTCommand
+from home_ai.server.api.codec import b64decode_async, b64encode_async
+
+# Dumps a whole command list in pydantic-core instead of a per-command Python loop
+_COMMANDS_ADAPTER = TypeAdapter(list[IoTCommand])
 
 
 class ConnectionManager:
     """Manages WebSocket connections."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept a new connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
         """Remove a connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_json(self, websocket: WebSocket, data: dict):
         """Send JSON data to a client."""
-        await websocket.send_json(data)
+        await websocket.send_text(orjson.dumps(data).decode())
+
+    async def send_msgpack(self, websocket: WebSocket, data: dict):
+        """Send MessagePack data to a client as a binary frame."""
+        await websocket.send_bytes(msgpack.packb(data, use_bin_type=True))
 
     async def broadcast(self, data: dict):
-        """Broadcast data to all connected clients."""
-        for connection in self.active_connections:
-            await connection.send_json(data)
+        """Broadcast data to all connected clients.
+
+        Sends run concurrently, so a slow client doesn't delay the others.
+        Connections whose send fails are dropped.
+        """
+        message = orjson.dumps(data).decode()
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections), return_exceptions=True
+        )
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 manager = ConnectionManager()
@@ -55,21 +80,48 @@ def get_tts():
     return _get_tts()
 
 
+def get_log_writer():
+    """Get request log writer, or None when DB logging is disabled."""
+    from home_ai.server.app import get_log_writer as _get_log_writer
+
+    return _get_log_writer()
+
+
+async def _receive(websocket: WebSocket) -> tuple[dict[str, Any], bool]:
+    """Receive a message from a client.
+
+    Returns:
+        Tuple of (decoded message, whether it arrived as a binary MessagePack frame).
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+
+    if message.get("bytes") is not None:
+        return msgpack.unpackb(message["bytes"], raw=False), True
+    return orjson.loads(message["text"]), False
+
+
 async def handle_websocket(websocket: WebSocket):
     """Handle WebSocket connection.
 
+    Messages are either JSON text frames or MessagePack binary frames; the
+    response is sent in the same encoding. In MessagePack frames audio is raw
+    bytes, in JSON frames it is base64 encoded.
+
     Message format:
     {
         "type": "text" | "audio",
-        "content": "message text" | "base64 audio",
-        "request_id": "optional uuid"
+        "content": "message text" | audio,
+        "request_id": "optional uuid",
+        "want_audio": true | false (optional, defaults to type == "audio")
     }
 
     Response format:
     {
         "type": "response",
         "text": "response text",
-        "audio": "base64 audio (optional)",
+        "audio": audio (optional),
         "commands": [...],
         "request_id": "uuid"
     }
@@ -79,48 +131,61 @@ async def handle_websocket(websocket: WebSocket):
     try:
         while True:
             # Receive message
-            data = await websocket.receive_json()
+            data, binary = await _receive(websocket)
+            started = time.perf_counter()
+            send = manager.send_msgpack if binary else manager.send_json
 
             message_type = data.get("type", "text")
             content = data.get("content", "")
-            request_id = data.get("request_id", str(uuid4()))
+            request_id = data.get("request_id") or new_request_id()
+            want_audio = data.get("want_audio")
+            if want_audio is None:
+                want_audio = message_type == "audio"
 
             try:
                 # Process input
                 input_text = content
 
                 if message_type == "audio":
-                    import base64
-
                     stt = get_stt()
-                    audio_bytes = base64.b64decode(content)
+                    audio_bytes = content if binary else await b64decode_async(content)
                     input_text = await stt.transcribe_async(audio_bytes)
 
                 # Get LLM response
                 llm = get_llm()
                 response = await llm.process_async(input_text)
 
+                # Synthesize the spoken reply while the response is built and the request logged
+                tts_task = asyncio.create_task(get_tts().synthesize_async(response.text)) if want_audio else None
+
                 # Prepare response
                 response_data = {
                     "type": "response",
                     "text": response.text,
-                    "commands": [cmd.model_dump() for cmd in response.commands],
+                    "commands": _COMMANDS_ADAPTER.dump_python(response.commands),
                     "request_id": request_id,
                 }
 
-                # Generate audio response if original was audio
-                if message_type == "audio":
-                    import base64
+                log_writer = get_log_writer()
+                if log_writer is not None:
+                    log_writer.log_request(
+                        request_id=request_id,
+                        input_type="audio" if message_type == "audio" else "text",
+                        input_text=input_text,
+                        output_text=response.text,
+                        iot_commands=response_data["commands"],
+                        duration_ms=int((time.perf_counter() - started) * 1000),
+                    )
 
-                    tts = get_tts()
-                    audio_bytes = await tts.synthesize_async(response.text)
-                    response_data["audio"] = base64.b64encode(audio_bytes).decode()
+                if tts_task is not None:
+                    audio_bytes = await tts_task
+                    response_data["audio"] = audio_bytes if binary else await b64encode_async(audio_bytes)
 
-                await manager.send_json(websocket, response_data)
+                await send(websocket, response_data)
 
             except Exception as e:
                 # Send error response
-                await manager.send_json(websocket, {"type": "error", "message": str(e), "request_id": request_id})
+                await send(websocket, {"type": "error", "message": str(e), "request_id": request_id})
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -1,11 +1,17 @@
 """FastAPI application setup."""
 
-from uuid import uuid4
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from home_ai.common.config import get_settings
+from home_ai.common.ids import new_request_id
 from home_ai.server.api.rest import router as rest_router
 from home_ai.server.api.websocket import handle_websocket
 
@@ -13,6 +19,7 @@ from home_ai.server.api.websocket import handle_websocket
 _llm = None
 _stt = None
 _tts = None
+_log_writer = None
 
 
 def get_llm():
@@ -51,39 +58,90 @@ def get_tts():
     """Get or create TTS instance."""
     global _tts
     if _tts is None:
+        from home_ai.common.tts.cache import TTSCache
+
         settings = get_settings()
         if settings.tts_provider == "openai":
             from home_ai.common.tts.openai_tts import OpenAITTS
 
-            _tts = OpenAITTS(api_key=settings.openai_api_key)
+            _tts = OpenAITTS(api_key=settings.openai_api_key, cache=TTSCache.from_settings(settings))
         else:
             from home_ai.common.tts.gtts_impl import GTTSImpl
 
-            _tts = GTTSImpl()
+            _tts = GTTSImpl(cache=TTSCache.from_settings(settings))
     return _tts
 
 
+def get_log_writer():
+    """Get or create the request log writer.
+
+    Returns:
+        RequestLogWriter (a DatabaseLogger on the async engine), or None when DB logging is disabled.
+    """
+    global _log_writer
+    if _log_writer is None:
+        settings = get_settings()
+        if not settings.db_logging:
+            return None
+
+        from home_ai.server.db.connection import create_async_engine_instance, get_async_session_factory
+        from home_ai.server.db.log_writer import RequestLogWriter
+
+        engine = create_async_engine_instance(settings.database_url)
+        _log_writer = RequestLogWriter(get_async_session_factory(engine))
+    return _log_writer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the providers at startup and flush pending request logs on shutdown.
+
+    Creating the LLM/STT/TTS instances up front keeps their construction off
+    the first request and surfaces misconfiguration at boot. The LLM API
+    connection is warmed in the background so startup doesn't wait on it.
+    """
+    warmup = asyncio.create_task(get_llm().warmup())
+    get_stt()
+    get_tts()
+    get_log_writer()
+    yield
+    warmup.cancel()
+    if _log_writer is not None:
+        await asyncio.to_thread(_log_writer.close)
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application.
 
     Returns:
         Configured FastAPI application.
     """
-    app = FastAPI(title="Home AI Assistant", description="Voice-controlled Home IoT Assistant API", version="0.1.0")
-
-    # CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+    app = FastAPI(
+        title="Home AI Assistant",
+        description="Voice-controlled Home IoT Assistant API",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
+    # CORS middleware, only for explicitly configured origins
+    cors_origins = get_settings().cors_origins
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Compress larger responses (base64 audio in JSON chat replies)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Request ID middleware
     @app.middleware("http")
     async def add_request_id(request: Request, call_next):
-        request_id = str(uuid4())
+        request_id = new_request_id()
         request.state.request_id = request_id
         response = await call_next(request)
         response.headers["X-Request-ID"] = request_id
@@ -116,4 +174,12 @@ if __name__ == "__main__":
     import uvicorn
 
     settings = get_settings()
-    uvicorn.run("home_ai.server.app:app", host=settings.server_host, port=settings.server_port, reload=True)
+    # Single worker: device state and the provider singletons live in this process
+    uvicorn.run(
+        "home_ai.server.app:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        reload=settings.server_reload,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+    )
@@ -1,5 +1,6 @@
 """Database connection management."""
 
+import orjson
 from sqlalchemy import create_engine as sa_create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -17,6 +18,11 @@ def get_database_url() -> str:
     return settings.database_url
 
 
+def _json_dumps(value) -> str:
+    """Serialize JSON/JSONB column values with orjson (drivers expect str)."""
+    return orjson.dumps(value).decode()
+
+
 def create_engine(database_url: str | None = None):
     """Create SQLAlchemy engine.
 
@@ -29,7 +35,17 @@ def create_engine(database_url: str | None = None):
     if database_url is None:
         database_url = get_database_url()
 
-    return sa_create_engine(database_url)
+    # Keep warm connections for the log writer and API handlers; pre-ping drops
+    # connections the server closed while idle, and recycling bounds their lifetime
+    return sa_create_engine(
+        database_url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+    )
 
 
 def create_async_engine_instance(database_url: str | None = None):
@@ -48,7 +64,21 @@ def create_async_engine_instance(database_url: str | None = None):
     if database_url.startswith("postgresql://"):
         database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
 
-    return create_async_engine(database_url)
+    # Cache prepared statements per connection so repeated queries skip the prepare round-trip
+    connect_args = {}
+    if database_url.startswith("postgresql+asyncpg://"):
+        connect_args = {"prepared_statement_cache_size": 512}
+
+    return create_async_engine(
+        database_url,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args=connect_args,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+    )
 
 
 def get_session_factory(engine=None):
@@ -0,0 +1,95 @@
+"""Request-log writer for the async server, built on DatabaseLogger."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from uuid import NAMESPACE_OID, UUID, uuid5
+
+from sqlalchemy import insert
+
+from home_ai.logging.db_logger import DatabaseLogger
+from home_ai.logging.models import ErrorLog, RequestLog
+from home_ai.server.db.models import ErrorLogDB, RequestLogDB
+
+
+def _as_uuid(request_id: UUID | str) -> UUID:
+    """Convert a request ID to a UUID; client-chosen non-UUID IDs map to a stable name-based UUID."""
+    if isinstance(request_id, UUID):
+        return request_id
+    try:
+        return UUID(request_id)
+    except ValueError:
+        return uuid5(NAMESPACE_OID, request_id)
+
+
+def _request_row(entry: RequestLog) -> dict[str, Any]:
+    # Timestamps come from the column's server default
+    return {
+        "request_id": _as_uuid(entry.request_id),
+        "user_id": entry.user_id,
+        "input_type": entry.input_type,
+        "input_text": entry.input_text,
+        "output_text": entry.output_text,
+        "iot_commands": entry.iot_commands,
+        "duration_ms": entry.duration_ms,
+        "level": entry.level,
+    }
+
+
+def _error_row(entry: ErrorLog) -> dict[str, Any]:
+    return {
+        "request_id": None if entry.request_id is None else _as_uuid(entry.request_id),
+        "error_type": entry.error_type,
+        "error_message": entry.error_message,
+        "stack_trace": entry.stack_trace,
+    }
+
+
+class RequestLogWriter(DatabaseLogger):
+    """DatabaseLogger that writes through an async session factory.
+
+    Queueing, batching and drop/failure accounting are DatabaseLogger's; each
+    batch is inserted with one executemany statement per table, run on an
+    event loop owned by the writer thread so the async engine's connections
+    never touch the server's loop. Request IDs may be client-chosen strings.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_queue_size: int = 10_000,
+    ):
+        """Initialize request log writer.
+
+        Args:
+            session_factory: Callable that returns an async database session.
+            batch_size: Maximum number of entries written per commit.
+            flush_interval: Seconds to wait for more entries before writing a batch.
+            max_queue_size: Maximum number of pending entries; new entries are dropped when full.
+        """
+        # Created by the writer thread on its first batch
+        self._loop: asyncio.AbstractEventLoop | None = None
+        super().__init__(session_factory, batch_size, flush_interval, max_queue_size)
+
+    def close(self) -> None:
+        """Write pending rows, stop the writer thread and close its event loop."""
+        super().close()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def _write_batch(self, entries: list[RequestLog | ErrorLog]) -> None:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._insert(entries))
+
+    async def _insert(self, entries: list[RequestLog | ErrorLog]) -> None:
+        requests = [_request_row(entry) for entry in entries if isinstance(entry, RequestLog)]
+        errors = [_error_row(entry) for entry in entries if isinstance(entry, ErrorLog)]
+        async with self._session_factory() as session, session.begin():
+            if requests:
+                await session.execute(insert(RequestLogDB), requests)
+            if errors:
+                await session.execute(insert(ErrorLogDB), errors)
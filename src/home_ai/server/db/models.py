@@ -1,27 +1,63 @@
 """SQLAlchemy database models for logging."""
 
-from datetime import datetime
+from enum import IntEnum
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, SmallInteger, String, Text, TypeDecorator, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
 
+class InputType(IntEnum):
+    """Stored codes for request input types."""
+
+    OTHER = 0
+    TEXT = 1
+    AUDIO = 2
+
+
+class InputTypeCode(TypeDecorator):
+    """Stores an input type name ('text', 'audio') as a SMALLINT code.
+
+    Callers keep passing and reading the names; only the stored value is
+    the 2-byte code instead of a VARCHAR. Unknown names are stored as
+    ``OTHER`` rather than failing the whole batched insert.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        member = InputType.__members__.get(str(value).upper(), InputType.OTHER)
+        return int(member)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else InputType(value).name.lower()
+
+
 class RequestLogDB(Base):
     """SQLAlchemy model for request logs."""
 
     __tablename__ = "request_logs"
+    # Log queries filter by time range, often per user, and by executed commands (@> containment)
+    __table_args__ = (
+        Index("ix_request_logs_timestamp", "timestamp"),
+        Index("ix_request_logs_user_time", "user_id", "timestamp"),
+        Index("ix_request_logs_iot_commands_gin", "iot_commands", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     request_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
     user_id = Column(String(255), nullable=True)
-    input_type = Column(String(50), nullable=False)
+    input_type = Column(InputTypeCode, nullable=False)
     input_text = Column(Text, nullable=True)
     output_text = Column(Text, nullable=True)
-    iot_commands = Column(JSON, nullable=True)
+    iot_commands = Column(JSONB, nullable=True)
     duration_ms = Column(Integer, nullable=False)
     level = Column(String(20), default="INFO", nullable=False)
 
@@ -32,7 +68,7 @@ class ErrorLogDB(Base):
     __tablename__ = "error_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     request_id = Column(PG_UUID(as_uuid=True), nullable=True, index=True)
     error_type = Column(String(255), nullable=False)
     error_message = Column(Text, nullable=False)
@@ -0,0 +1,33 @@
+"""Concurrent batch processing shared by LLM implementations."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from home_ai.common.models import LLMResponse
+
+
+async def process_many(
+    process_async: Callable[[str, list[dict] | None], Awaitable[LLMResponse]],
+    texts: list[str],
+    contexts: list[list[dict] | None] | None,
+    max_concurrency: int,
+) -> list[LLMResponse]:
+    """Process several user inputs concurrently.
+
+    Args:
+        process_async: Coroutine function processing one input with its context.
+        texts: User input texts.
+        contexts: Optional conversation history per text, aligned with ``texts``.
+        max_concurrency: Maximum number of LLM requests in flight.
+
+    Returns:
+        LLM responses, in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def process_one(text: str, context: list[dict] | None) -> LLMResponse:
+        async with semaphore:
+            return await process_async(text, context)
+
+    contexts = contexts if contexts is not None else [None] * len(texts)
+    return list(await asyncio.gather(*(process_one(t, c) for t, c in zip(texts, contexts, strict=True))))
@@ -1,13 +1,23 @@
 """Claude LLM implementation."""
 
 import asyncio
-import json
+import logging
+from collections.abc import Callable
 from typing import Any
 
-from anthropic import Anthropic, AsyncAnthropic
+import orjson
+from anthropic import AsyncAnthropic
+from anthropic.types import Message, ToolUseBlock
 
+from home_ai.common.http import get_shared_async_http
 from home_ai.common.models import IoTCommand, LLMResponse
-from home_ai.mcp_iot.server import IoTController
+from home_ai.mcp_iot.server import IoTController, get_iot_controller
+from home_ai.server.llm.batch import process_many
+from home_ai.server.llm.response_cache import ResponseCache
+from home_ai.server.llm.sync import get_bridge_http, on_bridge_loop, run_sync
+from home_ai.server.llm.tool_tasks import gather_tool_results, settle_tool_tasks
+
+logger = logging.getLogger(__name__)
 
 
 class ClaudeLLM:
@@ -26,6 +36,10 @@ class ClaudeLLM:
 
 항상 친절하고 자연스러운 한국어로 응답해주세요."""
 
+    # Tool definitions built from the schema tuple they came from
+    _tools_source: tuple[dict[str, Any], ...] | None = None
+    _tools_cache: list[dict[str, Any]] = []
+
     def __init__(
         self,
         api_key: str,
@@ -37,22 +51,86 @@ class ClaudeLLM:
         Args:
             api_key: Anthropic API key.
             model: Model to use.
-            iot_controller: IoT controller for device control.
+            iot_controller: IoT controller for device control. Defaults to the shared controller.
         """
         self.model = model
-        self._client = Anthropic(api_key=api_key)
-        self._async_client = AsyncAnthropic(api_key=api_key)
-        self._iot_controller = iot_controller or IoTController()
+        self._async_client = AsyncAnthropic(api_key=api_key, http_client=get_shared_async_http())
+        self._bridge_client: AsyncAnthropic | None = None
+        self._iot_controller = iot_controller or get_iot_controller()
+        self._response_cache = ResponseCache()
+        self._dispatch = {
+            "control_light": self._iot_controller.control_light,
+            "control_alarm": self._iot_controller.control_alarm,
+            "control_thermostat": self._iot_controller.control_thermostat,
+        }
+        # The system prompt and tools are a fixed prefix on every call; mark it
+        # cacheable so follow-up calls (including tool-result rounds) skip its prefill
+        self._system = [{"type": "text", "text": self.SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
         self._tools = self._create_tools()
 
     def _create_tools(self) -> list[dict[str, Any]]:
-        """Create Claude tool definitions from IoT controller."""
+        """Create Claude tool definitions from IoT controller.
+
+        The IoT schemas are static, so the definitions are built once and
+        shared by every instance; the SDK only reads them.
+        """
         iot_tools = self._iot_controller.get_tools()
+        cls = type(self)
+        if iot_tools is cls._tools_source:
+            return cls._tools_cache
 
-        return [
+        tools = [
             {"name": tool["name"], "description": tool["description"], "input_schema": tool["inputSchema"]}
             for tool in iot_tools
         ]
+        # A cache breakpoint on the last tool caches every tool definition before it
+        tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
+
+        cls._tools_source, cls._tools_cache = iot_tools, tools
+        return tools
+
+    async def _stream_message(
+        self, messages: list[dict], on_text: Callable[[str], None] | None
+    ) -> tuple[Message, list[tuple[ToolUseBlock, asyncio.Task]]]:
+        """Stream one Messages API call with the cached system prompt and tools.
+
+        Each tool use starts executing as soon as its block is complete, while
+        the model is still generating the rest of the response.
+
+        Args:
+            messages: Conversation so far.
+            on_text: Optional callback receiving text deltas as they arrive.
+
+        Returns:
+            Tuple of (final message, tool use blocks paired with their running tasks).
+        """
+        tool_calls = []
+        try:
+            async with self._client().messages.stream(
+                model=self.model, max_tokens=1024, system=self._system, messages=messages, tools=self._tools
+            ) as stream:
+                async for event in stream:
+                    if event.type == "text" and on_text is not None:
+                        on_text(event.text)
+                    elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                        block = event.content_block
+                        tool_calls.append((block, asyncio.create_task(self._execute_tool(block.name, block.input))))
+                return await stream.get_final_message(), tool_calls
+        except BaseException:
+            await settle_tool_tasks(task for _, task in tool_calls)
+            raise
+
+    def _client(self) -> AsyncAnthropic:
+        """Get the SDK client for the running event loop.
+
+        Sync ``process()`` calls run on the bridge loop, which gets its own
+        connection pool: pooled connections can't be shared across loops.
+        """
+        if not on_bridge_loop():
+            return self._async_client
+        if self._bridge_client is None:
+            self._bridge_client = self._async_client.copy(http_client=get_bridge_http())
+        return self._bridge_client
 
     async def _execute_tool(self, name: str, arguments: dict) -> dict[str, Any]:
         """Execute an IoT tool.
@@ -64,20 +142,27 @@ class ClaudeLLM:
         Returns:
             Tool execution result.
         """
-        if name == "control_light":
-            return await self._iot_controller.control_light(**arguments)
-        elif name == "control_alarm":
-            return await self._iot_controller.control_alarm(**arguments)
-        elif name == "control_thermostat":
-            return await self._iot_controller.control_thermostat(**arguments)
-        elif name == "get_device_status":
+        handler = self._dispatch.get(name)
+        if handler is not None:
+            return await handler(**arguments)
+        if name == "get_device_status":
             return {
                 "success": True,
                 "message": "디바이스 상태 조회 완료",
                 "states": self._iot_controller.get_all_states(),
             }
-        else:
-            return {"success": False, "message": f"Unknown tool: {name}"}
+        return {"success": False, "message": f"Unknown tool: {name}"}
+
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API so the first request skips DNS and TLS setup.
+
+        Lists models rather than sending a message, so no tokens are billed.
+        Failures are logged and ignored; the first real request connects as usual.
+        """
+        try:
+            await self._client().models.list(limit=1)
+        except Exception:
+            logger.warning("LLM warm-up request failed", exc_info=True)
 
     def process(self, text: str, context: list[dict] | None = None) -> LLMResponse:
         """Process user input synchronously.
@@ -89,55 +174,68 @@ class ClaudeLLM:
         Returns:
             LLM response with text and commands.
         """
-        return asyncio.run(self.process_async(text, context))
+        return run_sync(self.process_async(text, context))
 
-    async def process_async(self, text: str, context: list[dict] | None = None) -> LLMResponse:
+    async def process_batch_async(
+        self, texts: list[str], contexts: list[list[dict] | None] | None = None, *, concurrency: int = 10
+    ) -> list[LLMResponse]:
+        """Process several user inputs concurrently.
+
+        Args:
+            texts: User input texts.
+            contexts: Optional conversation history per text.
+            concurrency: Maximum number of requests in flight (mind API rate limits).
+
+        Returns:
+            LLM responses, in input order.
+        """
+        return await process_many(self.process_async, texts, contexts, concurrency)
+
+    async def process_async(
+        self, text: str, context: list[dict] | None = None, on_text: Callable[[str], None] | None = None
+    ) -> LLMResponse:
         """Process user input asynchronously.
 
+        The response is streamed: tools run as soon as the model finishes
+        each tool call, and text deltas are passed to ``on_text`` as they arrive.
+
         Args:
             text: User input text.
             context: Optional conversation history.
+            on_text: Optional callback receiving response text deltas.
 
         Returns:
             LLM response with text and commands.
         """
-        messages = []
-
-        if context:
-            messages.extend(context)
+        # Replies to repeated small talk don't depend on device state; skip the round trip
+        if not context:
+            cached = self._response_cache.get(text)
+            if cached is not None:
+                if on_text is not None:
+                    on_text(cached.text)
+                return cached
 
-        messages.append({"role": "user", "content": text})
+        messages = [*(context or ()), {"role": "user", "content": text}]
 
         executed_commands: list[IoTCommand] = []
 
         # Call LLM
-        response = await self._async_client.messages.create(
-            model=self.model, max_tokens=1024, system=self.SYSTEM_PROMPT, messages=messages, tools=self._tools
-        )
+        response, tool_calls = await self._stream_message(messages, on_text)
 
         # Handle tool use if present
-        while response.stop_reason == "tool_use":
-            # Find tool use blocks
-            tool_uses = [block for block in response.content if block.type == "tool_use"]
+        while True:
+            # Tools were started while streaming; gather keeps results in tool_use order.
+            # This also runs for a final turn (e.g. max_tokens) so started tools are awaited and recorded.
+            results = await gather_tool_results(task for _, task in tool_calls)
 
-            # Add assistant message
-            messages.append({"role": "assistant", "content": response.content})
-
-            # Execute each tool and collect results
             tool_results = []
-            for tool_use in tool_uses:
-                name = tool_use.name
-                arguments = tool_use.input
-
-                # Execute tool
-                result = await self._execute_tool(name, arguments)
-
-                # Record command
+            for (tool_use, _), result in zip(tool_calls, results, strict=True):
+                # Record command; fields come from our own tool schemas, so skip validation
                 executed_commands.append(
-                    IoTCommand(
-                        device=name.replace("control_", ""),
-                        action=arguments.get("action", "unknown"),
-                        parameters=arguments,
+                    IoTCommand.model_construct(
+                        device=tool_use.name.removeprefix("control_"),
+                        action=tool_use.input.get("action", "unknown"),
+                        parameters=tool_use.input,
                     )
                 )
 
@@ -145,17 +243,19 @@ class ClaudeLLM:
                     {
                         "type": "tool_result",
                         "tool_use_id": tool_use.id,
-                        "content": json.dumps(result, ensure_ascii=False),
+                        "content": orjson.dumps(result).decode(),
                     }
                 )
 
-            # Add tool results
+            if response.stop_reason != "tool_use":
+                break
+
+            # Add assistant message and tool results
+            messages.append({"role": "assistant", "content": response.content})
             messages.append({"role": "user", "content": tool_results})
 
             # Get next response
-            response = await self._async_client.messages.create(
-                model=self.model, max_tokens=1024, system=self.SYSTEM_PROMPT, messages=messages, tools=self._tools
-            )
+            response, tool_calls = await self._stream_message(messages, on_text)
 
         # Extract final text response
         response_text = ""
@@ -164,4 +264,8 @@ class ClaudeLLM:
                 response_text = block.text
                 break
 
-        return LLMResponse(text=response_text, commands=executed_commands)
+        result = LLMResponse(text=response_text, commands=executed_commands)
+        # Only a finished answer is reusable; a truncated or refused turn should be retried
+        if not context and response.stop_reason == "end_turn":
+            self._response_cache.put(text, result)
+        return result
@@ -1,13 +1,22 @@
 """OpenAI LLM implementation."""
 
 import asyncio
-import json
+import logging
+from collections.abc import Callable
 from typing import Any
 
-from openai import AsyncOpenAI, OpenAI
+import orjson
+from openai import AsyncOpenAI
 
+from home_ai.common.http import get_shared_async_http
 from home_ai.common.models import IoTCommand, LLMResponse
-from home_ai.mcp_iot.server import IoTController
+from home_ai.mcp_iot.server import IoTController, get_iot_controller
+from home_ai.server.llm.batch import process_many
+from home_ai.server.llm.response_cache import ResponseCache
+from home_ai.server.llm.sync import get_bridge_http, on_bridge_loop, run_sync
+from home_ai.server.llm.tool_tasks import gather_tool_results, settle_tool_tasks
+
+logger = logging.getLogger(__name__)
 
 
 class OpenAILLM:
@@ -26,6 +35,10 @@ class OpenAILLM:
 
 항상 친절하고 자연스러운 한국어로 응답해주세요."""
 
+    # Tool definitions built from the schema tuple they came from
+    _tools_source: tuple[dict[str, Any], ...] | None = None
+    _tools_cache: list[dict[str, Any]] = []
+
     def __init__(
         self,
         api_key: str,
@@ -37,19 +50,33 @@ class OpenAILLM:
         Args:
             api_key: OpenAI API key.
             model: Model to use.
-            iot_controller: IoT controller for device control.
+            iot_controller: IoT controller for device control. Defaults to the shared controller.
         """
         self.model = model
-        self._client = OpenAI(api_key=api_key)
-        self._async_client = AsyncOpenAI(api_key=api_key)
-        self._iot_controller = iot_controller or IoTController()
+        self._async_client = AsyncOpenAI(api_key=api_key, http_client=get_shared_async_http())
+        self._bridge_client: AsyncOpenAI | None = None
+        self._iot_controller = iot_controller or get_iot_controller()
+        self._system_message = {"role": "system", "content": self.SYSTEM_PROMPT}
+        self._response_cache = ResponseCache()
+        self._dispatch = {
+            "control_light": self._iot_controller.control_light,
+            "control_alarm": self._iot_controller.control_alarm,
+            "control_thermostat": self._iot_controller.control_thermostat,
+        }
         self._tools = self._create_tools()
 
     def _create_tools(self) -> list[dict[str, Any]]:
-        """Create OpenAI function definitions from IoT controller."""
+        """Create OpenAI function definitions from IoT controller.
+
+        The IoT schemas are static, so the definitions are built once and
+        shared by every instance; the SDK only reads them.
+        """
         iot_tools = self._iot_controller.get_tools()
+        cls = type(self)
+        if iot_tools is cls._tools_source:
+            return cls._tools_cache
 
-        return [
+        tools = [
             {
                 "type": "function",
                 "function": {
@@ -61,6 +88,84 @@ class OpenAILLM:
             for tool in iot_tools
         ]
 
+        cls._tools_source, cls._tools_cache = iot_tools, tools
+        return tools
+
+    async def _stream_completion(
+        self, messages: list[dict], on_text: Callable[[str], None] | None
+    ) -> tuple[str, str | None, list[tuple[dict[str, Any], dict, asyncio.Task]]]:
+        """Stream one chat completion, starting each tool call as soon as its arguments are complete.
+
+        Tool call deltas arrive in index order, so a call is complete once the
+        next one starts (or the stream ends).
+
+        Args:
+            messages: Conversation so far.
+            on_text: Optional callback receiving text deltas as they arrive.
+
+        Returns:
+            Tuple of (response text, finish reason, tool calls), where each tool
+            call is (assistant message entry, parsed arguments, running task).
+        """
+        text_parts: list[str] = []
+        finish_reason = None
+        calls: list[dict[str, Any]] = []
+        tool_calls = []
+
+        def start(call: dict[str, Any]) -> None:
+            arguments = orjson.loads(call["function"]["arguments"])
+            task = asyncio.create_task(self._execute_tool(call["function"]["name"], arguments))
+            tool_calls.append((call, arguments, task))
+
+        try:
+            stream = await self._client().chat.completions.create(
+                model=self.model, messages=messages, tools=self._tools, tool_choice="auto", stream=True
+            )
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+
+                if choice.delta.content:
+                    text_parts.append(choice.delta.content)
+                    if on_text is not None:
+                        on_text(choice.delta.content)
+
+                for delta in choice.delta.tool_calls or ():
+                    if delta.index == len(calls):
+                        if calls:
+                            start(calls[-1])
+                        calls.append({"id": delta.id, "type": "function", "function": {"name": "", "arguments": ""}})
+                    function = calls[delta.index]["function"]
+                    if delta.function.name:
+                        function["name"] = delta.function.name
+                    if delta.function.arguments:
+                        function["arguments"] += delta.function.arguments
+
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+            if calls:
+                start(calls[-1])
+        except BaseException:
+            await settle_tool_tasks(task for _, _, task in tool_calls)
+            raise
+
+        return "".join(text_parts), finish_reason, tool_calls
+
+    def _client(self) -> AsyncOpenAI:
+        """Get the SDK client for the running event loop.
+
+        Sync ``process()`` calls run on the bridge loop, which gets its own
+        connection pool: pooled connections can't be shared across loops.
+        """
+        if not on_bridge_loop():
+            return self._async_client
+        if self._bridge_client is None:
+            self._bridge_client = self._async_client.copy(http_client=get_bridge_http())
+        return self._bridge_client
+
     async def _execute_tool(self, name: str, arguments: dict) -> dict[str, Any]:
         """Execute an IoT tool.
 
@@ -71,29 +176,27 @@ class OpenAILLM:
         Returns:
             Tool execution result.
         """
-        if name == "control_light":
-            return await self._iot_controller.control_light(**arguments)
-        elif name == "control_alarm":
-            return await self._iot_controller.control_alarm(**arguments)
-        elif name == "control_thermostat":
-            return await self._iot_controller.control_thermostat(**arguments)
-        elif name == "get_device_status":
+        handler = self._dispatch.get(name)
+        if handler is not None:
+            return await handler(**arguments)
+        if name == "get_device_status":
             return {
                 "success": True,
                 "message": "디바이스 상태 조회 완료",
                 "states": self._iot_controller.get_all_states(),
             }
-        else:
-            return {"success": False, "message": f"Unknown tool: {name}"}
+        return {"success": False, "message": f"Unknown tool: {name}"}
 
-    # Alias for testing
-    @property
-    def _tool_executor(self):
-        return self._execute_tool
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API so the first request skips DNS and TLS setup.
 
-    @_tool_executor.setter
-    def _tool_executor(self, value):
-        self._execute_tool = value
+        Lists models rather than sending a message, so no tokens are billed.
+        Failures are logged and ignored; the first real request connects as usual.
+        """
+        try:
+            await self._client().models.list()
+        except Exception:
+            logger.warning("LLM warm-up request failed", exc_info=True)
 
     def process(self, text: str, context: list[dict] | None = None) -> LLMResponse:
         """Process user input synchronously.
@@ -105,81 +208,92 @@ class OpenAILLM:
         Returns:
             LLM response with text and commands.
         """
-        return asyncio.run(self.process_async(text, context))
+        return run_sync(self.process_async(text, context))
 
-    async def process_async(self, text: str, context: list[dict] | None = None) -> LLMResponse:
+    async def process_batch_async(
+        self, texts: list[str], contexts: list[list[dict] | None] | None = None, *, concurrency: int = 10
+    ) -> list[LLMResponse]:
+        """Process several user inputs concurrently.
+
+        Args:
+            texts: User input texts.
+            contexts: Optional conversation history per text.
+            concurrency: Maximum number of requests in flight (mind API rate limits).
+
+        Returns:
+            LLM responses, in input order.
+        """
+        return await process_many(self.process_async, texts, contexts, concurrency)
+
+    async def process_async(
+        self, text: str, context: list[dict] | None = None, on_text: Callable[[str], None] | None = None
+    ) -> LLMResponse:
         """Process user input asynchronously.
 
+        The response is streamed: tools run as soon as the model finishes
+        each tool call, and text deltas are passed to ``on_text`` as they arrive.
+
         Args:
             text: User input text.
             context: Optional conversation history.
+            on_text: Optional callback receiving response text deltas.
 
         Returns:
             LLM response with text and commands.
         """
-        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
-
-        if context:
-            messages.extend(context)
+        # Replies to repeated small talk don't depend on device state; skip the round trip
+        if not context:
+            cached = self._response_cache.get(text)
+            if cached is not None:
+                if on_text is not None:
+                    on_text(cached.text)
+                return cached
 
-        messages.append({"role": "user", "content": text})
+        messages = [self._system_message, *(context or ()), {"role": "user", "content": text}]
 
         executed_commands: list[IoTCommand] = []
 
         # Call LLM
-        response = await self._async_client.chat.completions.create(
-            model=self.model, messages=messages, tools=self._tools, tool_choice="auto"
-        )
-
-        choice = response.choices[0]
+        response_text, finish_reason, tool_calls = await self._stream_completion(messages, on_text)
 
         # Handle tool calls if present
-        while choice.finish_reason == "tool_calls" and choice.message.tool_calls:
-            # Add assistant message with tool calls
-            messages.append(
-                {
-                    "role": "assistant",
-                    "content": choice.message.content,
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {"name": tc.function.name, "arguments": tc.function.arguments},
-                        }
-                        for tc in choice.message.tool_calls
-                    ],
-                }
-            )
-
-            # Execute each tool call
-            for tool_call in choice.message.tool_calls:
-                name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-
-                # Execute tool
-                result = await self._execute_tool(name, arguments)
-
-                # Record command
+        while True:
+            # Tools were started while streaming; gather keeps results in call order.
+            # This also runs for a final turn (e.g. length) so started tools are awaited and recorded.
+            results = await gather_tool_results(task for _, _, task in tool_calls)
+
+            tool_messages = []
+            for (call, arguments, _), result in zip(tool_calls, results, strict=True):
+                # Record command; fields come from our own tool schemas, so skip validation
                 executed_commands.append(
-                    IoTCommand(
-                        device=name.replace("control_", ""),
+                    IoTCommand.model_construct(
+                        device=call["function"]["name"].removeprefix("control_"),
                         action=arguments.get("action", "unknown"),
                         parameters=arguments,
                     )
                 )
-
-                # Add tool response
-                messages.append(
-                    {"role": "tool", "tool_call_id": tool_call.id, "content": json.dumps(result, ensure_ascii=False)}
+                tool_messages.append(
+                    {"role": "tool", "tool_call_id": call["id"], "content": orjson.dumps(result).decode()}
                 )
 
-            # Get next response
-            response = await self._async_client.chat.completions.create(
-                model=self.model, messages=messages, tools=self._tools, tool_choice="auto"
+            if finish_reason != "tool_calls" or not tool_calls:
+                break
+
+            # Add assistant message with tool calls, then the tool responses
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": response_text or None,
+                    "tool_calls": [call for call, _, _ in tool_calls],
+                }
             )
-            choice = response.choices[0]
+            messages.extend(tool_messages)
 
-        # Extract final text response
-        response_text = choice.message.content or ""
+            # Get next response
+            response_text, finish_reason, tool_calls = await self._stream_completion(messages, on_text)
 
-        return LLMResponse(text=response_text, commands=executed_commands)
+        response = LLMResponse(text=response_text, commands=executed_commands)
+        # Only a finished answer is reusable; a truncated or filtered turn should be retried
+        if not context and finish_reason == "stop":
+            self._response_cache.put(text, response)
+        return response
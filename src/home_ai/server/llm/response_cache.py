@@ -0,0 +1,88 @@
+"""In-process cache of LLM replies to repeated utterances."""
+
+import re
+import time
+from collections import OrderedDict
+
+from home_ai.common.models import LLMResponse
+
+# Words that mark an utterance as a device request; those always go to the model
+_DEVICE_TERMS = re.compile(
+    r"불|조명|전등|밝기|켜|꺼|끄|알람|깨워|온도|난방|냉방|에어컨|보일러|기기|디바이스|상태"
+    r"|light|lamp|bright|alarm|wake|temperature|thermostat|heat|cool|turn on|turn off|device|status",
+    re.IGNORECASE,
+)
+
+
+def looks_like_device_request(text: str) -> bool:
+    """Check whether an utterance mentions devices or device actions.
+
+    Args:
+        text: User input text.
+
+    Returns:
+        True if the text contains device vocabulary.
+    """
+    return _DEVICE_TERMS.search(text) is not None
+
+
+class ResponseCache:
+    """LRU cache of LLM responses keyed by the exact user utterance.
+
+    Only small talk is stored: replies that executed tools, and utterances
+    that mention devices, are never cached, so a device command (or a
+    clarification the model once gave for one) always reaches the model
+    again. Entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 600.0):
+        """Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+            ttl: Seconds a cached response stays valid.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+
+    def get(self, text: str) -> LLMResponse | None:
+        """Look up the cached response to an utterance.
+
+        Args:
+            text: User input text.
+
+        Returns:
+            Copy of the cached response, or None on a miss or an expired entry.
+        """
+        key = text.strip()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response.model_copy(deep=True)
+
+    def put(self, text: str, response: LLMResponse) -> None:
+        """Cache a small-talk response.
+
+        Responses that executed tools and utterances that look like device
+        requests are skipped.
+
+        Args:
+            text: User input text.
+            response: Final response to cache.
+        """
+        if response.commands or looks_like_device_request(text):
+            return
+
+        key = text.strip()
+        self._entries[key] = (time.monotonic() + self.ttl, response.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
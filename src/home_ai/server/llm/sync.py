@@ -0,0 +1,68 @@
+"""Run LLM coroutines from synchronous callers."""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+
+from home_ai.common.http import new_async_http
+
+T = TypeVar("T")
+
+# Background event loop shared by all sync LLM calls
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+# Connection pool for SDK calls made on the background loop
+_http: httpx.AsyncClient | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-sync-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Unlike ``asyncio.run``, the loop outlives the call, so loop-bound state
+    such as the bridge's httpx connection pool stays usable and warm across calls.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def on_bridge_loop() -> bool:
+    """Check whether the caller is running on the background loop."""
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def get_bridge_http() -> httpx.AsyncClient:
+    """Get the HTTP client for SDK calls made on the background loop.
+
+    httpcore connections are bound to the loop that opened them, so the
+    background loop must not share the server loop's pool
+    (:func:`home_ai.common.http.get_shared_async_http`).
+
+    Returns:
+        httpx.AsyncClient instance (singleton).
+    """
+    global _http
+    if _http is None or _http.is_closed:
+        _http = new_async_http()
+    return _http
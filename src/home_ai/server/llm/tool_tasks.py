@@ -0,0 +1,36 @@
+"""Awaiting tool calls started while an LLM response streams."""
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+
+async def gather_tool_results(tasks: Iterable[asyncio.Task]) -> list[dict[str, Any]]:
+    """Wait for every started tool task and return the results in order.
+
+    Unlike a bare gather, a failing tool doesn't leave the other tasks
+    unawaited: all of them finish before the first error is re-raised.
+
+    Args:
+        tasks: Tool tasks, in tool call order.
+
+    Returns:
+        Tool results, in the same order.
+    """
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def settle_tool_tasks(tasks: Iterable[asyncio.Task]) -> None:
+    """Wait for tool tasks on an error path, discarding their results.
+
+    Device changes already under way are allowed to finish, and their
+    exceptions are retrieved instead of surfacing as "never retrieved".
+
+    Args:
+        tasks: Tool tasks started before the error.
+    """
+    await asyncio.gather(*tasks, return_exceptions=True)
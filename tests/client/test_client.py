@@ -15,7 +15,6 @@ class TestAPIClient:
         client = RESTClient(base_url="http://localhost:8000")
         assert client.base_url == "http://localhost:8000"
 
-    @pytest.mark.asyncio
     async def test_rest_client_chat_text(self):
         """REST client should send text chat requests."""
         from home_ai.client.api_client import RESTClient
@@ -36,6 +35,101 @@ class TestAPIClient:
 
             assert result["text"] == "거실 조명을 켰습니다."
 
+    async def test_rest_client_chat_audio(self):
+        """REST client should upload raw audio as multipart form data."""
+        from home_ai.client.api_client import RESTClient
+
+        client = RESTClient(base_url="http://localhost:8000")
+
+        with patch.object(client, "_client") as mock_client:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"text": "네", "commands_executed": [], "request_id": "123"}
+            mock_client.post = AsyncMock(return_value=mock_response)
+
+            await client.chat_async(audio=b"\x00\x01\x02", mode="audio")
+
+            call = mock_client.post.call_args
+            assert call.args[0] == "/api/chat/audio"
+            assert call.kwargs["files"]["audio"][1] == b"\x00\x01\x02"
+            assert call.kwargs["data"]["mode"] == "audio"
+
+    async def test_rest_client_decodes_msgpack_response(self):
+        """REST client should decode MessagePack responses with raw audio bytes."""
+        import msgpack
+
+        from home_ai.client.api_client import RESTClient
+
+        client = RESTClient(base_url="http://localhost:8000")
+
+        with patch.object(client, "_client") as mock_client:
+            mock_response = MagicMock()
+            mock_response.headers = {"content-type": "application/msgpack"}
+            mock_response.content = msgpack.packb(
+                {"text": "네", "audio": b"mp3", "commands_executed": [], "request_id": "123"}, use_bin_type=True
+            )
+            mock_client.post = AsyncMock(return_value=mock_response)
+
+            result = await client.chat_async(audio=b"\x00", mode="audio")
+
+            assert result["audio"] == b"mp3"
+
+    async def test_websocket_client_sends_binary_audio(self):
+        """WebSocket client should send audio as a binary MessagePack frame."""
+        import msgpack
+
+        from home_ai.client.api_client import WebSocketClient
+
+        client = WebSocketClient(url="ws://localhost:8000/ws")
+        mock_ws = AsyncMock()
+        mock_ws.recv.return_value = msgpack.packb({"type": "response", "text": "네", "audio": b"mp3"})
+
+        with patch("home_ai.client.api_client.connect", AsyncMock(return_value=mock_ws)):
+            result = await client.send_audio_async(b"\x00\x01")
+            await client.disconnect()
+
+        sent = msgpack.unpackb(mock_ws.send.call_args.args[0], raw=False)
+        assert sent["content"] == b"\x00\x01"
+        assert result["audio"] == b"mp3"
+
+    async def test_rest_client_coalesces_concurrent_device_requests(self):
+        """Concurrent get_devices_async calls should share one HTTP request."""
+        import asyncio
+
+        from home_ai.client.api_client import RESTClient
+
+        client = RESTClient(base_url="http://localhost:8000")
+
+        async def slow_get(path):
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.json.return_value = {"lights": {}}
+            return response
+
+        with patch.object(client, "_client") as mock_client:
+            mock_client.get = AsyncMock(side_effect=slow_get)
+
+            results = await asyncio.gather(*(client.get_devices_async() for _ in range(3)))
+            assert mock_client.get.await_count == 1
+            assert all(result == {"lights": {}} for result in results)
+
+            await client.get_devices_async()
+            assert mock_client.get.await_count == 2
+
+    async def test_rest_client_shares_lazy_pool(self):
+        """REST clients for the same server should lazily share one httpx client."""
+        from home_ai.client.api_client import RESTClient, _async_clients
+
+        first = RESTClient(base_url="http://pool-test:8000")
+        second = RESTClient(base_url="http://pool-test:8000/")
+
+        assert "http://pool-test:8000" not in _async_clients
+        assert first._client is second._client
+
+        await first.close()
+        assert "http://pool-test:8000" not in _async_clients
+        assert not second._client.is_closed
+        await second.close()
+
     def test_websocket_client_creation(self):
         """WebSocket client should be creatable."""
         from home_ai.client.api_client import WebSocketClient
@@ -43,6 +137,76 @@ class TestAPIClient:
         client = WebSocketClient(url="ws://localhost:8000/ws")
         assert "ws://localhost:8000" in client.url
 
+    async def test_websocket_client_reconnects_after_close(self):
+        """A closed connection should trigger a background reconnect."""
+        from websockets.exceptions import ConnectionClosed
+        from websockets.protocol import State
+
+        from home_ai.client.api_client import WebSocketClient
+
+        client = WebSocketClient(url="ws://localhost:8000/ws")
+        mock_ws = AsyncMock()
+        mock_ws.state = State.OPEN
+        mock_ws.recv.side_effect = ConnectionClosed(None, None)
+        mock_connect = AsyncMock(return_value=mock_ws)
+
+        with patch("home_ai.client.api_client.connect", mock_connect):
+            with pytest.raises(ConnectionClosed):
+                await client.send_text_async("안녕")
+            await client._connect_task
+            await client.disconnect()
+
+        assert mock_connect.await_count == 2
+        assert mock_connect.call_args.kwargs["ping_interval"] == 20
+
+    async def test_websocket_client_sends_frames_in_order(self):
+        """Frames passed to send_async should be written in call order."""
+        from home_ai.client.api_client import WebSocketClient
+
+        client = WebSocketClient(url="ws://localhost:8000/ws")
+        mock_ws = AsyncMock()
+
+        with patch("home_ai.client.api_client.connect", AsyncMock(return_value=mock_ws)):
+            for i in range(5):
+                await client.send_async(f"frame-{i}".encode())
+            await client.disconnect()
+
+        assert [call.args[0] for call in mock_ws.send.call_args_list] == [f"frame-{i}".encode() for i in range(5)]
+        mock_ws.close.assert_awaited_once()
+
+    async def test_websocket_client_send_errors_reach_caller(self):
+        """A failing send should raise to the caller instead of being swallowed."""
+        from home_ai.client.api_client import WebSocketClient
+
+        client = WebSocketClient(url="ws://localhost:8000/ws")
+        mock_ws = AsyncMock()
+        mock_ws.send.side_effect = RuntimeError("boom")
+
+        with patch("home_ai.client.api_client.connect", AsyncMock(return_value=mock_ws)):
+            with pytest.raises(RuntimeError, match="boom"):
+                await client.send_text_async("안녕")
+            await client.disconnect()
+
+        mock_ws.recv.assert_not_awaited()
+
+    async def test_websocket_client_send_text_async(self):
+        """WebSocket client should send text as JSON without blocking the event loop."""
+        import json
+
+        from home_ai.client.api_client import WebSocketClient
+
+        client = WebSocketClient(url="ws://localhost:8000/ws")
+        mock_ws = AsyncMock()
+        mock_ws.recv.return_value = json.dumps({"type": "response", "text": "네"})
+
+        with patch("home_ai.client.api_client.connect", AsyncMock(return_value=mock_ws)):
+            result = await client.send_text_async("안녕", request_id="123")
+            await client.disconnect()
+
+        assert json.loads(mock_ws.send.call_args.args[0]) == {"type": "text", "content": "안녕", "request_id": "123"}
+        assert mock_ws.send.call_args.kwargs["text"] is True
+        assert result["text"] == "네"
+
 
 class TestAudioModule:
     """Tests for audio module."""
@@ -54,6 +218,43 @@ class TestAudioModule:
         recorder = AudioRecorder()
         assert recorder is not None
 
+    def test_audio_recorder_records_into_wav(self):
+        """AudioRecorder should write every captured chunk into the WAV payload."""
+        import io
+        import wave
+
+        from home_ai.client.audio import AudioRecorder
+
+        recorder = AudioRecorder(sample_rate=16000, chunk_size=1000)
+        recorder._pyaudio = MagicMock()
+        stream = recorder._pyaudio.open.return_value
+        stream.read.side_effect = [bytes([i]) * 2000 for i in range(4)]
+
+        with patch("home_ai.client.audio.pyaudio"):
+            audio = recorder.record(duration=0.25)
+
+        with wave.open(io.BytesIO(audio), "rb") as wf:
+            assert wf.readframes(wf.getnframes()) == b"".join(bytes([i]) * 2000 for i in range(4))
+
+    def test_audio_recorder_wav_matches_wave_module(self):
+        """The hand-built WAV header should match what the wave module writes."""
+        import io
+        import wave
+
+        from home_ai.client.audio import AudioRecorder
+
+        recorder = AudioRecorder(sample_rate=22050, channels=2)
+        pcm = bytes(range(256)) * 8
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(22050)
+            wf.writeframes(pcm)
+
+        assert recorder._frames_to_wav(pcm) == buffer.getvalue()
+
     def test_audio_player_creation(self):
         """AudioPlayer should be creatable."""
         from home_ai.client.audio import AudioPlayer
@@ -77,6 +278,24 @@ class TestAudioModule:
         assert hasattr(player, "play")
         assert hasattr(player, "play_async")
 
+    async def test_audio_player_play_async_waits_for_playback(self):
+        """play_async should start playback and wait until the mixer is idle."""
+        from home_ai.client.audio import AudioPlayer
+
+        player = AudioPlayer()
+        player._initialized = True
+
+        with (
+            patch("home_ai.client.audio.pygame") as mock_pygame,
+            patch("home_ai.client.audio._PLAYBACK_POLL_MS", 0),
+        ):
+            mock_pygame.mixer.music.get_busy.side_effect = [True, True, False]
+
+            await player.play_async(b"mp3")
+
+            mock_pygame.mixer.music.play.assert_called_once()
+            assert mock_pygame.mixer.music.get_busy.call_count == 3
+
 
 class TestClientAssistant:
     """Tests for client assistant."""
@@ -102,7 +321,6 @@ class TestClientAssistant:
         assistant = ClientAssistant(server_url="http://localhost:8000")
         assert hasattr(assistant, "process_audio")
 
-    @pytest.mark.asyncio
     async def test_assistant_process_text(self):
         """ClientAssistant should process text input."""
         from home_ai.client.api_client import RESTClient
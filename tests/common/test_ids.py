@@ -0,0 +1,32 @@
+"""Tests for request ID generation."""
+
+
+class TestRequestIds:
+    """Tests for new_request_id."""
+
+    def test_request_id_is_uuid7(self):
+        """Request IDs should be valid version 7 UUIDs."""
+        from uuid import UUID
+
+        from home_ai.common.ids import new_request_id
+
+        request_id = new_request_id()
+        parsed = UUID(request_id)
+
+        assert str(parsed) == request_id
+        assert parsed.version == 7
+        assert parsed.variant == "specified in RFC 4122"
+
+    def test_request_ids_are_time_ordered(self):
+        """Request IDs created in different milliseconds should sort by creation time."""
+        import time
+
+        from home_ai.common.ids import new_request_id
+
+        ids = []
+        for _ in range(3):
+            ids.append(new_request_id())
+            time.sleep(0.002)
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 3
@@ -16,11 +16,12 @@ class TestSTTInterface:
 
         assert hasattr(STTInterface, "transcribe_async")
 
-    def test_stt_interface_is_runtime_checkable(self):
-        """STT interface should be runtime checkable."""
+    def test_stt_interface_is_static_protocol(self):
+        """STT interface should be a static-only Protocol (no runtime isinstance checks)."""
         from home_ai.common.interfaces import STTInterface
 
-        assert hasattr(STTInterface, "__protocol_attrs__") or isinstance(STTInterface, type)
+        assert STTInterface._is_protocol
+        assert not getattr(STTInterface, "_is_runtime_protocol", False)
 
 
 class TestTTSInterface:
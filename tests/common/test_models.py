@@ -154,3 +154,11 @@ class TestConfig:
         assert hasattr(settings, "stt_provider")
         assert hasattr(settings, "tts_provider")
         assert hasattr(settings, "llm_provider")
+
+    def test_settings_are_frozen(self):
+        """Settings should be immutable once loaded."""
+        from home_ai.common.config import Settings
+
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.server_port = 9000
@@ -1,13 +1,40 @@
 """Tests for STT implementations - TDD: Write tests first."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 
+def _google_response(transcript: str) -> str:
+    """Build a Google Speech API response body: an empty result line, then the hypotheses."""
+    hypothesis = {"result": [{"alternative": [{"transcript": transcript, "confidence": 0.9}], "final": True}]}
+    return '{"result":[]}\n' + json.dumps(hypothesis, ensure_ascii=False) + "\n"
+
+
 class TestGoogleSTT:
     """Tests for Google Speech Recognition STT."""
 
+    def test_speech_recognition_google_internals_available(self, mock_audio_data):
+        """GoogleSTT relies on undocumented speech_recognition.recognizers.google helpers; fail loudly if they change."""
+        import speech_recognition as sr
+        from speech_recognition.recognizers import google as sr_google
+
+        from home_ai.common.stt.google_stt import _to_audio_data
+
+        builder = sr_google.create_request_builder(endpoint=sr_google.ENDPOINT, language="ko-KR")
+        request = builder.build(_to_audio_data(mock_audio_data))
+        parser = sr_google.OutputParser(show_all=False, with_confidence=False)
+
+        assert request.full_url.startswith(sr_google.ENDPOINT)
+        assert "lang=ko-KR" in request.full_url
+        assert request.data
+        assert dict(request.header_items())["Content-type"].startswith("audio/x-flac")
+        assert parser.parse(_google_response("테스트 음성")) == "테스트 음성"
+        with pytest.raises(sr.UnknownValueError):
+            parser.parse('{"result":[]}\n')
+
     def test_google_stt_implements_interface(self):
         """GoogleSTT should implement STTInterface."""
         from home_ai.common.stt.google_stt import GoogleSTT
@@ -22,25 +49,42 @@ class TestGoogleSTT:
 
         stt = GoogleSTT()
 
-        # Mock the recognizer directly
-        stt._recognizer = MagicMock()
-        stt._recognizer.recognize_google.return_value = "테스트 음성"
+        # Mock the HTTP client; the API answers with one JSON object per line
+        stt._http = MagicMock()
+        stt._http.post.return_value.text = _google_response("테스트 음성")
 
         result = stt.transcribe(b"fake_audio_data")
 
         assert isinstance(result, str)
         assert result == "테스트 음성"
 
-    @pytest.mark.asyncio
+    def test_google_stt_reuses_shared_http_client(self):
+        """GoogleSTT should send every request through the shared keep-alive client."""
+        from home_ai.common.http import get_shared_http
+        from home_ai.common.stt.google_stt import GoogleSTT
+
+        stt = GoogleSTT()
+        assert stt._http is get_shared_http()
+
+        stt._http = MagicMock()
+        stt._http.post.return_value.text = _google_response("안녕")
+
+        stt.transcribe(b"fake_audio_data")
+        stt.transcribe(b"fake_audio_data")
+
+        assert stt._http.post.call_count == 2
+        url = stt._http.post.call_args.args[0]
+        assert "lang=ko-KR" in url
+        assert stt._http.post.call_args.kwargs["headers"]["Content-type"] == "audio/x-flac; rate=16000"
+
     async def test_google_stt_transcribe_async(self):
         """GoogleSTT.transcribe_async should work asynchronously."""
         from home_ai.common.stt.google_stt import GoogleSTT
 
         stt = GoogleSTT()
 
-        # Mock the recognizer directly
-        stt._recognizer = MagicMock()
-        stt._recognizer.recognize_google.return_value = "비동기 테스트"
+        stt._http = MagicMock()
+        stt._http.post.return_value.text = _google_response("비동기 테스트")
 
         result = await stt.transcribe_async(b"fake_audio_data")
 
@@ -49,15 +93,66 @@ class TestGoogleSTT:
 
     def test_google_stt_handles_recognition_error(self):
         """GoogleSTT should handle recognition errors gracefully."""
+        import speech_recognition as sr
+
         from home_ai.common.stt.google_stt import GoogleSTT
 
         stt = GoogleSTT()
-        stt._recognizer = MagicMock()
-        stt._recognizer.recognize_google.side_effect = Exception("Recognition failed")
+        stt._http = MagicMock()
+        stt._http.post.side_effect = httpx.ConnectError("Recognition failed")
 
-        with pytest.raises(Exception, match="Recognition failed"):
+        with pytest.raises(Exception, match="API request failed: .*Recognition failed") as exc_info:
             stt.transcribe(b"fake_audio_data")
 
+        assert isinstance(exc_info.value.__cause__, sr.RequestError)
+
+    def test_google_stt_reports_http_errors_as_request_errors(self):
+        """Error statuses should surface as speech_recognition's RequestError, like recognize_google."""
+        import speech_recognition as sr
+
+        from home_ai.common.stt.google_stt import GoogleSTT
+
+        stt = GoogleSTT()
+        stt._http = MagicMock()
+        request = httpx.Request("POST", "http://www.google.com/speech-api/v2/recognize")
+        stt._http.post.return_value = httpx.Response(403, request=request)
+
+        with pytest.raises(Exception, match="API request failed: recognition request failed: Forbidden") as exc_info:
+            stt.transcribe(b"fake_audio_data")
+
+        assert isinstance(exc_info.value.__cause__, sr.RequestError)
+
+    def test_google_stt_handles_unintelligible_audio(self):
+        """GoogleSTT should report audio the API could not recognize."""
+        from home_ai.common.stt.google_stt import GoogleSTT
+
+        stt = GoogleSTT()
+        stt._http = MagicMock()
+        stt._http.post.return_value.text = '{"result":[]}\n'
+
+        with pytest.raises(Exception, match="Could not understand audio"):
+            stt.transcribe(b"fake_audio_data")
+
+    def test_google_stt_unwraps_wav_header(self, mock_audio_data):
+        """WAV input should be unwrapped so the header isn't treated as samples."""
+        from home_ai.common.stt.google_stt import _to_audio_data
+
+        audio = _to_audio_data(mock_audio_data)
+
+        assert audio.frame_data == b"\x00\x00" * 16000
+        assert (audio.sample_rate, audio.sample_width) == (16000, 2)
+
+    def test_google_stt_accepts_raw_pcm(self):
+        """Headerless input should be taken as 16 kHz 16-bit PCM without conversion."""
+        from home_ai.common.stt.google_stt import _to_audio_data
+
+        pcm = b"\x01\x00" * 800
+
+        audio = _to_audio_data(pcm)
+
+        assert audio.frame_data is pcm
+        assert (audio.sample_rate, audio.sample_width) == (16000, 2)
+
     def test_google_stt_default_language(self):
         """GoogleSTT should default to Korean language."""
         from home_ai.common.stt.google_stt import GoogleSTT
@@ -100,7 +195,6 @@ class TestOpenAISTT:
         assert isinstance(result, str)
         assert result == "테스트 음성"
 
-    @pytest.mark.asyncio
     async def test_openai_stt_transcribe_async(self):
         """OpenAISTT.transcribe_async should work asynchronously."""
         from home_ai.common.stt.openai_stt import OpenAISTT
@@ -131,3 +225,49 @@ class TestOpenAISTT:
         stt = OpenAISTT(api_key="test_key", model="whisper-custom")
 
         assert stt.model == "whisper-custom"
+
+    def test_openai_stt_shares_http_pool_with_tts(self):
+        """OpenAI STT and TTS clients should share one HTTP connection pool."""
+        from home_ai.common.http import get_shared_async_http
+        from home_ai.common.stt.openai_stt import OpenAISTT
+        from home_ai.common.tts.openai_tts import OpenAITTS
+
+        stt = OpenAISTT(api_key="test_key")
+        tts = OpenAITTS(api_key="test_key")
+
+        assert stt._async_client._client is get_shared_async_http()
+        assert tts._async_client._client is stt._async_client._client
+
+    async def test_openai_stt_stream_transcribe_yields_deltas(self):
+        """stream_transcribe should yield each delta as soon as it arrives."""
+        from home_ai.common.stt.openai_stt import OpenAISTT
+
+        stt = OpenAISTT(api_key="test_key", model="gpt-4o-mini-transcribe")
+        events = []
+
+        async def stream():
+            for delta in ("테", "스트"):
+                events.append(f"sent:{delta}")
+                yield MagicMock(type="transcript.text.delta", delta=delta)
+            events.append("done")
+            yield MagicMock(type="transcript.text.done", text="테스트")
+
+        stt._async_client = MagicMock()
+        stt._async_client.audio.transcriptions.create = AsyncMock(return_value=stream())
+
+        async for delta in stt.stream_transcribe(b"fake_audio_data"):
+            events.append(f"got:{delta}")
+
+        assert events == ["sent:테", "got:테", "sent:스트", "got:스트", "done"]
+        assert stt._async_client.audio.transcriptions.create.call_args.kwargs["stream"] is True
+
+    async def test_openai_stt_stream_transcribe_whisper_yields_full_text(self):
+        """Models without streaming support should yield the whole transcript once."""
+        from home_ai.common.stt.openai_stt import OpenAISTT
+
+        stt = OpenAISTT(api_key="test_key")
+        stt._async_client = MagicMock()
+        stt._async_client.audio.transcriptions.create = AsyncMock(return_value=MagicMock(text="테스트"))
+
+        assert [delta async for delta in stt.stream_transcribe(b"fake_audio_data")] == ["테스트"]
+        assert "stream" not in stt._async_client.audio.transcriptions.create.call_args.kwargs
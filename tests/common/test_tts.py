@@ -2,8 +2,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 
 class TestGTTS:
     """Tests for gTTS implementation."""
@@ -32,7 +30,6 @@ class TestGTTS:
 
             assert isinstance(result, bytes)
 
-    @pytest.mark.asyncio
     async def test_gtts_synthesize_async(self):
         """GTTSImpl.synthesize_async should work asynchronously."""
         from home_ai.common.tts.gtts_impl import GTTSImpl
@@ -48,6 +45,38 @@ class TestGTTS:
 
             assert isinstance(result, bytes)
 
+    async def test_gtts_synthesize_async_runs_on_gtts_pool(self):
+        """GTTSImpl.synthesize_async should run on the dedicated gTTS thread pool."""
+        import threading
+
+        from home_ai.common.tts.gtts_impl import GTTSImpl
+
+        tts = GTTSImpl()
+        thread_names = []
+
+        def synthesize(text):
+            thread_names.append(threading.current_thread().name)
+            return b"audio_data"
+
+        with patch.object(tts, "synthesize", side_effect=synthesize):
+            await tts.synthesize_async("테스트 텍스트")
+
+        assert thread_names[0].startswith("gtts_")
+
+    async def test_gtts_speak_async_runs_off_the_synthesis_pool(self):
+        """GTTSImpl.speak_async should play on its own pool, leaving the gTTS pool for synthesis."""
+        import threading
+
+        from home_ai.common.tts.gtts_impl import GTTSImpl
+
+        tts = GTTSImpl()
+        thread_names = []
+
+        with patch.object(tts, "speak", side_effect=lambda text: thread_names.append(threading.current_thread().name)):
+            await tts.speak_async("테스트 텍스트")
+
+        assert thread_names[0].startswith("gtts-speak_")
+
     def test_gtts_uses_korean_language(self):
         """GTTSImpl should default to Korean language."""
         from home_ai.common.tts.gtts_impl import GTTSImpl
@@ -92,7 +121,6 @@ class TestOpenAITTS:
 
             assert isinstance(result, bytes)
 
-    @pytest.mark.asyncio
     async def test_openai_tts_synthesize_async(self):
         """OpenAITTS.synthesize_async should work asynchronously."""
         from home_ai.common.tts.openai_tts import OpenAITTS
@@ -108,6 +136,62 @@ class TestOpenAITTS:
 
             assert isinstance(result, bytes)
 
+    async def test_openai_tts_stream_synthesize_yields_before_stream_closes(self):
+        """stream_synthesize should yield each chunk as it arrives and cache the whole clip."""
+        from home_ai.common.tts.openai_tts import OpenAITTS
+
+        tts = OpenAITTS(api_key="test_key")
+        events = []
+
+        async def iter_bytes(chunk_size):
+            for chunk in (b"ID3", b"mp3"):
+                events.append(f"sent:{chunk.decode()}")
+                yield chunk
+
+        response = MagicMock()
+        response.iter_bytes = iter_bytes
+        stream = MagicMock()
+        stream.__aenter__ = AsyncMock(return_value=response)
+        stream.__aexit__ = AsyncMock(side_effect=lambda *exc_info: events.append("closed"))
+
+        with patch.object(tts, "_async_client") as mock_client:
+            mock_client.audio.speech.with_streaming_response.create = MagicMock(return_value=stream)
+
+            async for chunk in tts.stream_synthesize("테스트"):
+                events.append(f"got:{chunk.decode()}")
+
+            assert events == ["sent:ID3", "got:ID3", "sent:mp3", "got:mp3", "closed"]
+            assert [chunk async for chunk in tts.stream_synthesize("테스트")] == [b"ID3mp3"]
+            mock_client.audio.speech.with_streaming_response.create.assert_called_once()
+
+    async def test_openai_tts_synthesize_many_bounds_concurrency(self):
+        """OpenAITTS.synthesize_many should keep order, dedupe texts and cap concurrency."""
+        import asyncio
+
+        from home_ai.common.tts.openai_tts import OpenAITTS
+
+        tts = OpenAITTS(api_key="test_key", max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def create(model, voice, input):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content=input.encode())
+
+        with patch.object(tts, "_async_client") as mock_client:
+            mock_client.audio.speech.create = AsyncMock(side_effect=create)
+
+            texts = ["하나", "둘", "셋", "하나", "넷"]
+            result = await tts.synthesize_many(texts)
+
+            assert result == [text.encode() for text in texts]
+            assert mock_client.audio.speech.create.await_count == 4
+            assert peak == 2
+
     def test_openai_tts_default_voice(self):
         """OpenAITTS should have default voice."""
         from home_ai.common.tts.openai_tts import OpenAITTS
@@ -131,3 +215,155 @@ class TestOpenAITTS:
         tts = OpenAITTS(api_key="test_key")
 
         assert tts.model == "tts-1"
+
+
+class TestTTSCache:
+    """Tests for the synthesized audio cache."""
+
+    def test_gtts_synthesize_uses_cache(self):
+        """Repeated GTTSImpl.synthesize calls should hit the cache."""
+        from home_ai.common.tts.gtts_impl import GTTSImpl
+
+        tts = GTTSImpl()
+
+        with patch("home_ai.common.tts.gtts_impl.gTTS") as mock_gtts:
+            mock_gtts.return_value.write_to_fp = MagicMock(side_effect=lambda fp: fp.write(b"audio_data"))
+
+            assert tts.synthesize("안녕하세요") == b"audio_data"
+            assert tts.synthesize("안녕하세요") == b"audio_data"
+
+            mock_gtts.assert_called_once()
+
+    async def test_gtts_synthesize_async_serves_cache_hits_inline(self):
+        """Cached phrases should be returned without going through the gTTS thread pool."""
+        from home_ai.common.tts.gtts_impl import GTTSImpl
+
+        tts = GTTSImpl()
+        tts._cache.put(tts._cache_key("테스트"), b"cached")
+
+        with patch("home_ai.common.tts.gtts_impl._GTTS_POOL") as mock_pool:
+            assert await tts.synthesize_async("테스트") == b"cached"
+
+            mock_pool.submit.assert_not_called()
+
+    async def test_openai_tts_cache_key_includes_voice(self):
+        """OpenAITTS should not serve audio cached for a different voice."""
+        from home_ai.common.tts.cache import TTSCache
+        from home_ai.common.tts.openai_tts import OpenAITTS
+
+        cache = TTSCache()
+        alloy = OpenAITTS(api_key="test_key", voice="alloy", cache=cache)
+        nova = OpenAITTS(api_key="test_key", voice="nova", cache=cache)
+
+        for tts in (alloy, nova):
+            tts._async_client = MagicMock()
+            tts._async_client.audio.speech.create = AsyncMock(return_value=MagicMock(content=tts.voice.encode()))
+
+        assert await alloy.synthesize_async("안녕") == b"alloy"
+        assert await nova.synthesize_async("안녕") == b"nova"
+        assert await alloy.synthesize_async("안녕") == b"alloy"
+        alloy._async_client.audio.speech.create.assert_awaited_once()
+
+    def test_disk_cache_persists_across_instances(self, tmp_path):
+        """Audio written to the disk cache should be readable by a new cache instance."""
+        from home_ai.common.tts.cache import TTSCache
+
+        key = TTSCache.key("gtts", "ko", "안녕")
+        TTSCache(cache_dir=str(tmp_path)).put(key, b"mp3")
+
+        assert TTSCache(cache_dir=str(tmp_path)).get(key) == b"mp3"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_disk_cache_evicts_least_recently_used(self, tmp_path):
+        """The disk cache should evict the least recently used clips beyond max_bytes."""
+        import os
+
+        from home_ai.common.tts.cache import TTSCache
+
+        cache = TTSCache(cache_dir=str(tmp_path), max_bytes=20)
+        cache.put("old", b"x" * 10)
+        os.utime(tmp_path / "old.mp3", (0, 0))
+        cache.put("new", b"y" * 10)
+        cache.put("newest", b"z" * 10)
+
+        assert not (tmp_path / "old.mp3").exists()
+        assert (tmp_path / "new.mp3").exists()
+        assert (tmp_path / "newest.mp3").exists()
+
+    def test_disk_cache_tracks_size_without_rescanning(self, tmp_path):
+        """Puts should evict using the in-memory disk index instead of globbing the directory."""
+        from pathlib import Path
+
+        from home_ai.common.tts.cache import TTSCache
+
+        (tmp_path / "existing.mp3").write_bytes(b"e" * 10)
+        cache = TTSCache(cache_dir=str(tmp_path), max_bytes=20)
+
+        with patch.object(Path, "glob") as mock_glob:
+            cache.put("a", b"a" * 10)
+            cache.put("b", b"b" * 10)
+
+            mock_glob.assert_not_called()
+
+        assert not (tmp_path / "existing.mp3").exists()
+        assert cache.get("a") == b"a" * 10
+        assert cache.get("b") == b"b" * 10
+
+    async def test_disk_cache_async_io_runs_off_the_loop(self, tmp_path):
+        """get_async/put_async should hand disk reads and writes to a worker thread."""
+        import asyncio
+
+        from home_ai.common.tts.cache import TTSCache
+
+        key = TTSCache.key("openai", "tts-1", "alloy", "안녕")
+        await TTSCache(cache_dir=str(tmp_path)).put_async(key, b"mp3")
+        fresh = TTSCache(cache_dir=str(tmp_path))
+
+        with patch("home_ai.common.tts.cache.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            assert await fresh.get_async(key) == b"mp3"
+            assert await fresh.get_async(key) == b"mp3"
+
+        # The second lookup is served from memory
+        mock_to_thread.assert_called_once()
+
+
+class TestPlayback:
+    """Tests for shared TTS playback helpers."""
+
+    def test_split_first_sentence(self):
+        """split_first_sentence should split on the first sentence boundary."""
+        from home_ai.common.tts.playback import split_first_sentence
+
+        assert split_first_sentence("거실 조명을 켰습니다. 온도는 22도입니다. 좋은 하루!") == (
+            "거실 조명을 켰습니다.",
+            "온도는 22도입니다. 좋은 하루!",
+        )
+        assert split_first_sentence("알람을 설정했습니다") == ("알람을 설정했습니다", "")
+
+    def test_speak_pipelined_plays_sentences_in_order(self):
+        """speak_pipelined should play the first sentence, then the remainder."""
+        from home_ai.common.tts.playback import speak_pipelined
+
+        synthesize = MagicMock(side_effect=lambda text: text.encode())
+
+        with patch("home_ai.common.tts.playback.play_mp3") as mock_play:
+            speak_pipelined(synthesize, "첫 문장입니다. 두 번째 문장입니다.")
+
+        assert [call.args[0] for call in mock_play.call_args_list] == [
+            "첫 문장입니다.".encode(),
+            "두 번째 문장입니다.".encode(),
+        ]
+
+    def test_play_mp3_initializes_mixer_once(self):
+        """play_mp3 should only open the mixer when it isn't initialized yet."""
+        from home_ai.common.tts.playback import play_mp3
+
+        with patch("home_ai.common.tts.playback.pygame") as mock_pygame:
+            mock_pygame.mixer.get_init.side_effect = [None, (44100, -16, 2)]
+            mock_pygame.mixer.music.get_busy.return_value = False
+
+            play_mp3(b"mp3")
+            play_mp3(b"mp3")
+
+            mock_pygame.mixer.init.assert_called_once()
+            assert mock_pygame.mixer.music.play.call_count == 2
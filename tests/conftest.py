@@ -9,9 +9,9 @@ import pytest
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_audio_data() -> bytes:
-    """Generate mock audio data for testing."""
+    """Generate mock audio data for testing (built once; bytes are immutable)."""
     import io
     import wave
 
@@ -119,6 +119,20 @@ def mock_api_client():
     return mock
 
 
+@pytest.fixture(scope="session")
+def test_client():
+    """Server app test client, built once and shared across tests.
+
+    The lifespan is not entered, so no provider clients, API keys or
+    database connections are needed.
+    """
+    from fastapi.testclient import TestClient
+
+    from home_ai.server.app import create_app
+
+    return TestClient(create_app())
+
+
 # ============================================================================
 # Integration Test Markers
 # ============================================================================
@@ -9,7 +9,6 @@ import pytest
 class TestFullFlow:
     """End-to-end tests for the complete assistant flow."""
 
-    @pytest.mark.asyncio
     async def test_text_to_iot_flow(self):
         """Test complete text input to IoT control flow."""
         from home_ai.common.models import IoTCommand, LLMResponse
@@ -36,7 +35,6 @@ class TestFullFlow:
         states = controller.get_all_states()
         assert states["lights"]["living_room"]["power"] == "on"
 
-    @pytest.mark.asyncio
     async def test_alarm_flow(self):
         """Test alarm setting flow."""
         from home_ai.mcp_iot.server import IoTController
@@ -59,7 +57,6 @@ class TestFullFlow:
         states = controller.get_all_states()
         assert len(states["alarm"]["alarms"]) == 0
 
-    @pytest.mark.asyncio
     async def test_thermostat_flow(self):
         """Test thermostat control flow."""
         from home_ai.mcp_iot.server import IoTController
@@ -79,29 +76,15 @@ class TestFullFlow:
         assert states["thermostat"]["target_temp"] == 24
         assert states["thermostat"]["mode"] == "cooling"
 
-    def test_server_api_health(self):
+    def test_server_api_health(self, test_client):
         """Test server health endpoint."""
-        from fastapi.testclient import TestClient
-
-        from home_ai.server.app import create_app
-
-        app = create_app()
-        client = TestClient(app)
-
-        response = client.get("/health")
+        response = test_client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
-    def test_server_api_devices(self):
+    def test_server_api_devices(self, test_client):
         """Test device status endpoint."""
-        from fastapi.testclient import TestClient
-
-        from home_ai.server.app import create_app
-
-        app = create_app()
-        client = TestClient(app)
-
-        response = client.get("/api/devices")
+        response = test_client.get("/api/devices")
         assert response.status_code == 200
 
         data = response.json()
@@ -109,7 +92,6 @@ class TestFullFlow:
         assert "alarm" in data
         assert "thermostat" in data
 
-    @pytest.mark.asyncio
     async def test_client_assistant_text_mode(self):
         """Test client assistant in text mode."""
         from home_ai.client.api_client import RESTClient
@@ -33,6 +33,7 @@ class TestDBLogger:
             output_text="거실 조명을 켰습니다.",
             duration_ms=150,
         )
+        logger.flush()
 
         assert len(logs) == 1
         assert logs[0].request_id == request_id
@@ -61,6 +62,7 @@ class TestDBLogger:
         logger.log_error(
             request_id=request_id, error_type="ValueError", error_message="Invalid input", stack_trace="Traceback..."
         )
+        logger.flush()
 
         assert len(logs) == 1
         assert logs[0].request_id == request_id
@@ -94,9 +96,96 @@ class TestDBLogger:
             iot_commands=iot_commands,
             duration_ms=100,
         )
+        logger.flush()
 
         assert logs[0].iot_commands == iot_commands
 
+    def test_db_logger_batches_commits(self):
+        """DBLogger should write queued entries in batches with one commit each."""
+        from home_ai.logging.db_logger import DatabaseLogger
+
+        logs = []
+        commits = []
+
+        class MockSession:
+            def add(self, obj):
+                logs.append(obj)
+
+            def commit(self):
+                commits.append(len(logs))
+
+            def close(self):
+                pass
+
+        logger = DatabaseLogger(session_factory=lambda: MockSession(), batch_size=10, flush_interval=1.0)
+
+        for _ in range(25):
+            logger.log_error(error_type="ValueError", error_message="Invalid input")
+        logger.close()
+
+        assert len(logs) == 25
+        assert len(commits) == 3
+
+    def test_db_logger_drops_entries_when_queue_full(self):
+        """DBLogger should drop entries instead of blocking when its queue is full."""
+        import threading
+
+        from home_ai.logging.db_logger import DatabaseLogger
+
+        release = threading.Event()
+
+        class BlockingSession:
+            def add(self, obj):
+                release.wait()
+
+            def commit(self):
+                pass
+
+            def close(self):
+                pass
+
+        logger = DatabaseLogger(session_factory=lambda: BlockingSession(), batch_size=1, max_queue_size=1)
+
+        for _ in range(5):
+            logger.log_error(error_type="ValueError", error_message="Invalid input")
+
+        assert logger.dropped >= 3
+        release.set()
+        logger.close()
+
+    def test_db_logger_counts_failed_writes(self):
+        """Entries lost to a failed commit should be counted, not just logged."""
+        from home_ai.logging.db_logger import DatabaseLogger
+
+        class FailingSession:
+            def add(self, obj):
+                pass
+
+            def commit(self):
+                raise ConnectionError("database down")
+
+            def close(self):
+                pass
+
+        logger = DatabaseLogger(session_factory=lambda: FailingSession(), batch_size=10, flush_interval=1.0)
+
+        for _ in range(3):
+            logger.log_error(error_type="ValueError", error_message="Invalid input")
+        logger.close()
+
+        assert logger.failed == 3
+
+    def test_db_logger_close_releases_exit_hook(self):
+        """Closed loggers should be dropped from the shared exit hook's registry."""
+        from home_ai.logging import db_logger
+        from home_ai.logging.db_logger import DatabaseLogger
+
+        logger = DatabaseLogger(session_factory=lambda: None)
+        assert logger in db_logger._open_loggers
+
+        logger.close()
+        assert logger not in db_logger._open_loggers
+
 
 class TestLogModels:
     """Tests for log database models."""
@@ -147,3 +236,12 @@ class TestLogModels:
         log = ErrorLog(request_id=uuid4(), error_type="TestError", error_message="Test error", stack_trace="")
 
         assert hasattr(log, "timestamp")
+
+    def test_log_models_use_slots(self):
+        """Log models should be slotted to keep per-row overhead low."""
+        from home_ai.logging.models import ErrorLog, RequestLog
+
+        log = RequestLog(request_id=uuid4(), input_type="text", duration_ms=100)
+
+        assert not hasattr(log, "__dict__")
+        assert "__dict__" not in dir(ErrorLog)
@@ -34,6 +34,7 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test")
         logger.info("Test info message")
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
@@ -48,6 +49,7 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test")
         logger.error("Test error message")
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
@@ -62,6 +64,7 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test", level="DEBUG")
         logger.debug("Test debug message")
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
@@ -76,6 +79,7 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test")
         logger.warning("Test warning message")
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
@@ -90,6 +94,7 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test")
         logger.info("Test message with timestamp")
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
@@ -105,11 +110,40 @@ class TestFileLogger:
         log_dir = tmp_path / "logs"
         logger = FileLogger(log_dir=str(log_dir), name="test")
         logger.info("Request processed", extra={"request_id": "123", "duration_ms": 50})
+        logger.flush()
 
         log_file = list(log_dir.glob("*.log"))[0]
         content = log_file.read_text()
 
         assert "Request processed" in content
+        assert "Request processed | request_id=123 duration_ms=50" in content
+
+    def test_file_logger_extra_data_with_custom_format(self, tmp_path):
+        """Extra data should be rendered regardless of the format string."""
+        from home_ai.logging.file_logger import FileLogger
+
+        log_dir = tmp_path / "logs"
+        logger = FileLogger(log_dir=str(log_dir), name="test", format_string="%(levelname)s %(message)s")
+        logger.warning("Slow request", extra={"duration_ms": 900})
+        logger.info("100% done")
+        logger.flush()
+
+        content = list(log_dir.glob("*.log"))[0].read_text()
+        assert content.splitlines() == ["WARNING Slow request | duration_ms=900", "INFO 100% done"]
+
+    def test_file_logger_does_not_duplicate_handlers(self, tmp_path):
+        """Re-creating a logger should replace its handler and close the old file."""
+        from home_ai.logging.file_logger import FileLogger
+
+        first = FileLogger(log_dir=str(tmp_path), name="test")
+        first.info("first")
+        first.flush()
+        old_handler = first._listener.handlers[0]
+
+        second = FileLogger(log_dir=str(tmp_path), name="test")
+
+        assert len(second._logger.handlers) == 1
+        assert old_handler.stream is None
 
     def test_file_logger_daily_rotation_filename(self, tmp_path):
         """FileLogger should use date-based filename for rotation."""
@@ -123,6 +157,25 @@ class TestFileLogger:
         log_files = list(log_dir.glob(f"*{today}*.log"))
         assert len(log_files) >= 1
 
+    def test_file_logger_switches_file_at_midnight(self, tmp_path):
+        """FileLogger should start a new dated file once the day changes."""
+        import logging
+        from datetime import timedelta
+
+        from home_ai.logging.file_logger import FileLogger
+
+        log_dir = tmp_path / "logs"
+        logger = FileLogger(log_dir=str(log_dir), name="test")
+
+        tomorrow = datetime.now() + timedelta(days=1)
+        record = logging.LogRecord("home_ai.test", logging.INFO, __file__, 0, "Tomorrow's message", None, None)
+        record.created = tomorrow.timestamp()
+        logger._logger.handle(record)
+        logger.flush()
+
+        log_file = log_dir / f"test-{tomorrow:%Y-%m-%d}.log"
+        assert "Tomorrow's message" in log_file.read_text()
+
 
 class TestClientLogger:
     """Tests for client-specific file logger."""
@@ -73,6 +73,88 @@ class TestLightDevice:
 
         assert result.success is False
 
+    def test_light_reuses_result_for_repeated_command(self):
+        """Repeating a command that doesn't change state should return the cached result."""
+        from home_ai.mcp_iot.devices.light import Light
+
+        light = Light(room="living_room")
+        first = light.execute(IoTCommand(device="light", action="on"))
+        second = light.execute(IoTCommand(device="light", action="on"))
+        assert second == first
+
+        light.execute(IoTCommand(device="light", action="set_brightness", parameters={"brightness": 50}))
+        third = light.execute(IoTCommand(device="light", action="on"))
+        assert third.data["brightness"] == 100
+
+    def test_light_cached_results_are_copies(self):
+        """Mutating a returned result or state must not leak into later calls."""
+        from home_ai.mcp_iot.devices.light import Light
+
+        light = Light(room="living_room")
+        first = light.execute(IoTCommand(device="light", action="on"))
+        first.data["power"] = "off"
+        light.get_state()["brightness"] = 0
+
+        second = light.execute(IoTCommand(device="light", action="on"))
+        assert second is not first
+        assert second.data == {"room": "living_room", "power": "on", "brightness": 100}
+        assert light.get_state() == second.data
+
+    def test_light_state_cached_until_change(self):
+        """get_state should reflect the light's state after a change."""
+        from home_ai.mcp_iot.devices.light import Light
+
+        light = Light(room="living_room")
+        state = light.get_state()
+        assert light.get_state() == state
+
+        light.execute(IoTCommand(device="light", action="on"))
+        assert light.get_state() != state
+        assert light.get_state()["power"] == "on"
+
+    def test_light_state_kept_on_repeated_command(self):
+        """A command that doesn't change the state should leave get_state unchanged."""
+        from home_ai.mcp_iot.devices.light import Light
+
+        light = Light(room="living_room")
+        light.execute(IoTCommand(device="light", action="on"))
+        state = light.get_state()
+
+        light.execute(IoTCommand(device="light", action="on"))
+        assert light.get_state() == state
+
+    def test_light_room_change_invalidates_results(self):
+        """Renaming the room should rebuild messages and state."""
+        from home_ai.mcp_iot.devices.light import Light
+
+        light = Light(room="living_room")
+        light.execute(IoTCommand(device="light", action="on"))
+        light.room = "bedroom"
+
+        result = light.execute(IoTCommand(device="light", action="on"))
+        assert result.message.startswith("bedroom")
+        assert result.data["room"] == "bedroom"
+
+    def test_devices_reject_unknown_action(self):
+        """Every device should report an unknown action as a failed result."""
+        from home_ai.mcp_iot.devices.alarm import Alarm
+        from home_ai.mcp_iot.devices.light import Light
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        for device in (Light(), Thermostat(), Alarm()):
+            result = device.execute(IoTCommand(device=device.device_type, action="explode"))
+            assert result.success is False
+            assert "explode" in result.message
+
+    def test_devices_have_no_instance_dict(self):
+        """Devices should use __slots__ instead of a per-instance __dict__."""
+        from home_ai.mcp_iot.devices.alarm import Alarm
+        from home_ai.mcp_iot.devices.light import Light
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        for device in (Light(), Thermostat(), Alarm()):
+            assert not hasattr(device, "__dict__")
+
 
 class TestAlarmDevice:
     """Tests for Alarm device."""
@@ -107,6 +189,19 @@ class TestAlarmDevice:
         assert len(state["alarms"]) == 1
         assert state["alarms"][0]["time"] == "07:00"
 
+    def test_alarm_created_at_is_iso_timestamp(self):
+        """Alarms should expose created_at as an ISO timestamp."""
+        from datetime import datetime
+
+        from home_ai.mcp_iot.devices.alarm import Alarm
+
+        alarm = Alarm()
+        result = alarm.execute(IoTCommand(device="alarm", action="set", parameters={"time": "07:00"}))
+
+        created_at = datetime.fromisoformat(result.data["alarm"]["created_at"])
+        assert abs((datetime.now() - created_at).total_seconds()) < 5
+        assert "created_at_ns" not in alarm.get_state()["alarms"][0]
+
     def test_alarm_cancel(self):
         """Alarm should cancel alarm with 'cancel' action."""
         from home_ai.mcp_iot.devices.alarm import Alarm
@@ -134,6 +229,29 @@ class TestAlarmDevice:
         assert result.success is True
         assert len(result.data["alarms"]) == 2
 
+    def test_alarm_set_same_time_replaces(self):
+        """Setting an alarm for an existing time should replace it, not duplicate it."""
+        from home_ai.mcp_iot.devices.alarm import Alarm
+
+        alarm = Alarm()
+        alarm.execute(IoTCommand(device="alarm", action="set", parameters={"time": "07:00", "label": "Old"}))
+        alarm.execute(IoTCommand(device="alarm", action="set", parameters={"time": "07:00", "label": "New"}))
+
+        alarms = alarm.get_state()["alarms"]
+        assert [a["label"] for a in alarms] == ["New"]
+
+    def test_alarm_list_returns_copy(self):
+        """Mutating a listed result should not change the device's alarms."""
+        from home_ai.mcp_iot.devices.alarm import Alarm
+
+        alarm = Alarm()
+        alarm.execute(IoTCommand(device="alarm", action="set", parameters={"time": "07:00"}))
+
+        result = alarm.execute(IoTCommand(device="alarm", action="list"))
+        result.data["alarms"].clear()
+
+        assert len(alarm.get_state()["alarms"]) == 1
+
 
 class TestThermostatDevice:
     """Tests for Thermostat device."""
@@ -189,3 +307,55 @@ class TestThermostatDevice:
 
         assert result.success is True
         assert thermostat.get_state()["mode"] == "off"
+
+    def test_thermostat_repeated_off_reuses_result(self):
+        """Repeated 'off' should reuse the result until the thermostat is turned back on."""
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        thermostat = Thermostat()
+        first = thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        assert thermostat.execute(IoTCommand(device="thermostat", action="off")) == first
+
+        thermostat.execute(IoTCommand(device="thermostat", action="set_temp", parameters={"temperature": 25}))
+        result = thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        assert result.data["target_temp"] == 25
+
+    def test_thermostat_cached_results_are_copies(self):
+        """Mutating a returned off result or state must not leak into later calls."""
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        thermostat = Thermostat()
+        first = thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        first.data["mode"] = "cooling"
+        thermostat.get_state()["target_temp"] = 30
+
+        second = thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        assert second.data == {"current_temp": 22.0, "target_temp": 22.0, "mode": "off"}
+        assert thermostat.get_state() == second.data
+
+    def test_thermostat_off_after_set_mode_off_reports_current_state(self):
+        """'off' should not reuse a result built before the temperature changed."""
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        thermostat = Thermostat()
+        thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        thermostat.execute(IoTCommand(device="thermostat", action="set_temp", parameters={"temperature": 25}))
+        thermostat.execute(IoTCommand(device="thermostat", action="set_mode", parameters={"mode": "off"}))
+        result = thermostat.execute(IoTCommand(device="thermostat", action="off"))
+
+        assert result.data["target_temp"] == 25
+        assert result.data["mode"] == "off"
+
+    def test_thermostat_state_tracks_changes(self):
+        """Cached thermostat state should reflect every change."""
+        from home_ai.mcp_iot.devices.thermostat import Thermostat
+
+        thermostat = Thermostat()
+        assert thermostat.get_state()["mode"] == "auto"
+
+        thermostat.execute(IoTCommand(device="thermostat", action="set_mode", parameters={"mode": "cooling"}))
+        assert thermostat.get_state()["mode"] == "cooling"
+
+        thermostat.execute(IoTCommand(device="thermostat", action="off"))
+        thermostat.execute(IoTCommand(device="thermostat", action="set_temp", parameters={"temperature": 30}))
+        assert thermostat.get_state() == {"current_temp": 22.0, "target_temp": 30.0, "mode": "auto"}
@@ -1,7 +1,5 @@
 """Tests for MCP IoT Server - TDD: Write tests first."""
 
-import pytest
-
 
 class TestMCPServer:
     """Tests for MCP IoT Server."""
@@ -45,7 +43,12 @@ class TestMCPServer:
         tool_names = [t["name"] for t in tools]
         assert "control_thermostat" in tool_names
 
-    @pytest.mark.asyncio
+    def test_get_tools_returns_shared_schemas(self):
+        """Tool schemas should be built once and shared between controllers."""
+        from home_ai.mcp_iot.server import IoTController
+
+        assert IoTController().get_tools() is IoTController().get_tools()
+
     async def test_control_light_on(self):
         """Control light tool should turn light on."""
         from home_ai.mcp_iot.server import IoTController
@@ -56,7 +59,6 @@ class TestMCPServer:
         assert result["success"] is True
         assert "켰습니다" in result["message"]
 
-    @pytest.mark.asyncio
     async def test_control_light_brightness(self):
         """Control light tool should set brightness."""
         from home_ai.mcp_iot.server import IoTController
@@ -67,7 +69,6 @@ class TestMCPServer:
         assert result["success"] is True
         assert "50%" in result["message"]
 
-    @pytest.mark.asyncio
     async def test_control_alarm_set(self):
         """Control alarm tool should set alarm."""
         from home_ai.mcp_iot.server import IoTController
@@ -77,7 +78,6 @@ class TestMCPServer:
 
         assert result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_control_thermostat_temp(self):
         """Control thermostat tool should set temperature."""
         from home_ai.mcp_iot.server import IoTController
@@ -98,3 +98,21 @@ class TestMCPServer:
         assert "lights" in states
         assert "alarm" in states
         assert "thermostat" in states
+
+    async def test_call_tool_dispatches_by_name(self):
+        """call_tool should route known tools to the controller and reject unknown ones."""
+        import json
+
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        from home_ai.mcp_iot.server import create_mcp_server
+
+        handler = create_mcp_server().request_handlers[CallToolRequest]
+
+        async def call(name, arguments):
+            request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+            return json.loads((await handler(request)).root.content[0].text)
+
+        assert (await call("control_light", {"room": "living_room", "action": "on"}))["state"]["power"] == "on"
+        assert "states" in await call("get_device_status", {})
+        assert (await call("unknown_tool", {}))["success"] is False
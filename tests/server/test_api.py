@@ -6,16 +6,14 @@ import pytest
 from fastapi.testclient import TestClient
 
 
-class TestRESTAPI:
-    """Tests for REST API endpoints."""
+@pytest.fixture
+def client(test_client):
+    """Shared server test client (built once per session in tests/conftest.py)."""
+    return test_client
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from home_ai.server.app import create_app
 
-        app = create_app()
-        return TestClient(app)
+class TestRESTAPI:
+    """Tests for REST API endpoints."""
 
     def test_health_endpoint(self, client):
         """Health endpoint should return OK."""
@@ -24,6 +22,30 @@ class TestRESTAPI:
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
+    def test_app_builds_providers_at_startup(self):
+        """Providers should be created when the app starts, not on the first request."""
+        from home_ai.server.app import create_app
+
+        with (
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_stt") as mock_stt,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+        ):
+            mock_llm.return_value.warmup = AsyncMock()
+            with TestClient(create_app()):
+                mock_llm.assert_called_once()
+                mock_llm.return_value.warmup.assert_called_once()
+                mock_stt.assert_called_once()
+                mock_tts.assert_called_once()
+
+    def test_app_uses_orjson_responses(self):
+        """JSON endpoints should be rendered with orjson by default."""
+        from fastapi.responses import ORJSONResponse
+
+        from home_ai.server.app import create_app
+
+        assert create_app().router.default_response_class is ORJSONResponse
+
     def test_chat_endpoint_text_mode(self, client):
         """Chat endpoint should accept text input."""
         with patch("home_ai.server.app.get_llm") as mock_llm:
@@ -39,6 +61,153 @@ class TestRESTAPI:
             data = response.json()
             assert "text" in data
 
+    def test_chat_endpoint_returns_executed_commands(self, client):
+        """Chat endpoint should serialize the executed IoT commands."""
+        with patch("home_ai.server.app.get_llm") as mock_llm:
+            from home_ai.common.models import IoTCommand, LLMResponse
+
+            command = IoTCommand(device="light", action="on", parameters={"room": "living_room"})
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[command]))
+
+            response = client.post("/api/chat", json={"text": "거실 불 켜줘", "mode": "text"})
+
+            assert response.json()["commands_executed"] == [command.model_dump()]
+
+    def test_chat_endpoint_queues_request_log(self, client):
+        """Chat endpoint should hand the request log to the log writer."""
+        with (
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_log_writer") as mock_writer,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+
+            response = client.post("/api/chat", json={"text": "거실 불 켜줘", "mode": "text"})
+
+            log = mock_writer.return_value.log_request.call_args.kwargs
+            assert log["request_id"] == response.json()["request_id"]
+            assert log["input_type"] == "text"
+            assert log["input_text"] == "거실 불 켜줘"
+            assert log["output_text"] == "네"
+
+    def test_chat_audio_upload_endpoint(self, client):
+        """Chat audio endpoint should accept raw multipart audio."""
+        with (
+            patch("home_ai.server.app.get_stt") as mock_stt,
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_stt.return_value.transcribe_async = AsyncMock(return_value="거실 불 켜줘")
+            mock_instance = MagicMock()
+            mock_instance.process_async = AsyncMock(return_value=LLMResponse(text="거실 조명을 켰습니다.", commands=[]))
+            mock_llm.return_value = mock_instance
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
+
+            response = client.post(
+                "/api/chat/audio", data={"mode": "audio"}, files={"audio": ("audio.wav", b"RIFF", "audio/wav")}
+            )
+
+            assert response.status_code == 200
+            mock_stt.return_value.transcribe_async.assert_awaited_once_with(b"RIFF")
+            assert response.json()["audio"] == "bXAz"
+
+    def test_chat_endpoint_logs_while_reply_is_synthesized(self, client):
+        """The request log should be queued without waiting for TTS to finish."""
+        import asyncio
+
+        logged_during_tts = []
+
+        with (
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+            patch("home_ai.server.app.get_log_writer") as mock_writer,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            async def synthesize(text):
+                await asyncio.sleep(0)
+                logged_during_tts.append(mock_writer.return_value.log_request.called)
+                return b"mp3"
+
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+            mock_tts.return_value.synthesize_async = synthesize
+
+            response = client.post("/api/chat", json={"text": "안녕", "mode": "text", "want_audio": True})
+
+            assert response.json()["audio"] == "bXAz"
+            assert logged_during_tts == [True]
+
+    def test_chat_audio_endpoint_can_skip_spoken_reply(self, client):
+        """Audio requests that opt out of a spoken reply should skip TTS."""
+        with (
+            patch("home_ai.server.app.get_stt") as mock_stt,
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_stt.return_value.transcribe_async = AsyncMock(return_value="거실 불 켜줘")
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
+
+            response = client.post(
+                "/api/chat/audio",
+                data={"mode": "audio", "want_audio": "false"},
+                files={"audio": ("audio.wav", b"RIFF", "audio/wav")},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["audio"] is None
+            mock_tts.return_value.synthesize_async.assert_not_called()
+
+    def test_chat_endpoint_text_mode_with_spoken_reply(self, client):
+        """Text requests can ask for a spoken reply."""
+        with (
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
+
+            response = client.post("/api/chat", json={"text": "안녕", "mode": "text", "want_audio": True})
+
+            assert response.json()["audio"] == "bXAz"
+
+    def test_chat_endpoint_msgpack_response(self, client):
+        """Chat endpoint should answer in MessagePack when the client accepts it."""
+        import msgpack
+
+        with (
+            patch("home_ai.server.app.get_stt") as mock_stt,
+            patch("home_ai.server.app.get_llm") as mock_llm,
+            patch("home_ai.server.app.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_stt.return_value.transcribe_async = AsyncMock(return_value="거실 불 켜줘")
+            mock_instance = MagicMock()
+            mock_instance.process_async = AsyncMock(return_value=LLMResponse(text="거실 조명을 켰습니다.", commands=[]))
+            mock_llm.return_value = mock_instance
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
+
+            response = client.post(
+                "/api/chat/audio",
+                data={"mode": "audio"},
+                files={"audio": ("audio.wav", b"RIFF", "audio/wav")},
+                headers={"Accept": "application/msgpack"},
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/msgpack"
+            data = msgpack.unpackb(response.content, raw=False)
+            assert data["text"] == "거실 조명을 켰습니다."
+            assert data["audio"] == b"mp3"
+
     def test_chat_endpoint_requires_input(self, client):
         """Chat endpoint should require text or audio."""
         response = client.post("/api/chat", json={"mode": "text"})
@@ -60,14 +229,6 @@ class TestRESTAPI:
 class TestWebSocketAPI:
     """Tests for WebSocket API."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from home_ai.server.app import create_app
-
-        app = create_app()
-        return TestClient(app)
-
     def test_websocket_connection(self, client):
         """WebSocket should accept connections."""
         with client.websocket_connect("/ws") as websocket:
@@ -90,17 +251,84 @@ class TestWebSocketAPI:
                 assert response["type"] == "response"
                 assert "text" in response
 
+    def test_websocket_text_message_with_spoken_reply(self, client):
+        """Text messages can ask for a spoken reply with want_audio."""
+        with (
+            patch("home_ai.server.api.websocket.get_llm") as mock_llm,
+            patch("home_ai.server.api.websocket.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
 
-class TestMiddleware:
-    """Tests for middleware."""
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from home_ai.server.app import create_app
+            with client.websocket_connect("/ws") as websocket:
+                websocket.send_json({"type": "text", "content": "안녕", "want_audio": True})
+                assert websocket.receive_json()["audio"] == "bXAz"
+
+                websocket.send_json({"type": "text", "content": "안녕"})
+                assert "audio" not in websocket.receive_json()
+
+            mock_tts.return_value.synthesize_async.assert_awaited_once_with("네")
+
+    def test_websocket_logs_unknown_message_type_as_text(self, client):
+        """A client-chosen message type should not reach the input_type log column as-is."""
+        with (
+            patch("home_ai.server.api.websocket.get_llm") as mock_llm,
+            patch("home_ai.server.api.websocket.get_log_writer") as mock_writer,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네", commands=[]))
+
+            with client.websocket_connect("/ws") as websocket:
+                websocket.send_json({"type": "chat", "content": "안녕"})
+                websocket.receive_json()
+
+            assert mock_writer.return_value.log_request.call_args.kwargs["input_type"] == "text"
+
+    def test_websocket_msgpack_audio_message(self, client):
+        """WebSocket should accept binary MessagePack audio frames and reply in kind."""
+        import msgpack
+
+        with (
+            patch("home_ai.server.api.websocket.get_stt") as mock_stt,
+            patch("home_ai.server.api.websocket.get_llm") as mock_llm,
+            patch("home_ai.server.api.websocket.get_tts") as mock_tts,
+        ):
+            from home_ai.common.models import LLMResponse
+
+            mock_stt.return_value.transcribe_async = AsyncMock(return_value="거실 불 켜줘")
+            mock_instance = MagicMock()
+            mock_instance.process_async = AsyncMock(return_value=LLMResponse(text="거실 조명을 켰습니다.", commands=[]))
+            mock_llm.return_value = mock_instance
+            mock_tts.return_value.synthesize_async = AsyncMock(return_value=b"mp3")
+
+            with client.websocket_connect("/ws") as websocket:
+                websocket.send_bytes(msgpack.packb({"type": "audio", "content": b"RIFF"}, use_bin_type=True))
+
+                response = msgpack.unpackb(websocket.receive_bytes(), raw=False)
+                assert response["type"] == "response"
+                assert response["audio"] == b"mp3"
+                mock_stt.return_value.transcribe_async.assert_awaited_once_with(b"RIFF")
+
+    async def test_broadcast_drops_failed_connections(self):
+        """Broadcast should reach every client and drop the ones that fail."""
+        from home_ai.server.api.websocket import ConnectionManager
 
-        app = create_app()
-        return TestClient(app)
+        manager = ConnectionManager()
+        healthy, broken = AsyncMock(), AsyncMock()
+        broken.send_text.side_effect = RuntimeError("closed")
+        manager.active_connections = {broken, healthy}
+
+        await manager.broadcast({"type": "notice", "text": "안녕"})
+
+        healthy.send_text.assert_awaited_once_with('{"type":"notice","text":"안녕"}')
+        assert manager.active_connections == {healthy}
+
+
+class TestMiddleware:
+    """Tests for middleware."""
 
     def test_request_id_header(self, client):
         """Response should include request ID header."""
@@ -114,3 +342,67 @@ class TestMiddleware:
 
         # CORS should be configured
         assert response.status_code in [200, 204, 405]
+
+    def test_cors_allows_configured_origin(self):
+        """Only configured origins should get CORS headers."""
+        from home_ai.common.config import Settings
+        from home_ai.server.app import create_app
+
+        settings = Settings(cors_origins=["https://home.example"])
+        with patch("home_ai.server.app.get_settings", return_value=settings):
+            client = TestClient(create_app())
+
+        allowed = client.get("/health", headers={"Origin": "https://home.example"})
+        denied = client.get("/health", headers={"Origin": "https://evil.example"})
+
+        assert allowed.headers["access-control-allow-origin"] == "https://home.example"
+        assert "access-control-allow-origin" not in denied.headers
+
+    def test_large_responses_are_gzipped(self, client):
+        """Large JSON responses should be gzip-compressed for clients that accept it."""
+        with patch("home_ai.server.app.get_llm") as mock_llm:
+            from home_ai.common.models import LLMResponse
+
+            mock_llm.return_value.process_async = AsyncMock(return_value=LLMResponse(text="네" * 2000, commands=[]))
+
+            response = client.post(
+                "/api/chat", json={"text": "안녕", "mode": "text"}, headers={"Accept-Encoding": "gzip"}
+            )
+
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json()["text"] == "네" * 2000
+
+
+class TestBase64Codec:
+    """Tests for the async base64 helpers."""
+
+    async def test_small_payload_stays_on_loop(self):
+        """Small payloads should be encoded inline without a thread hand-off."""
+        from home_ai.server.api.codec import b64decode_async, b64encode_async
+
+        with patch("home_ai.server.api.codec.asyncio.to_thread") as mock_to_thread:
+            assert await b64encode_async(b"mp3") == "bXAz"
+            assert await b64decode_async("bXAz") == b"mp3"
+            mock_to_thread.assert_not_called()
+
+    async def test_large_payload_runs_in_thread(self):
+        """Large payloads should round-trip through a worker thread."""
+        import threading
+
+        import pybase64
+
+        from home_ai.server.api.codec import b64decode_async, b64encode_async
+
+        audio = bytes(range(256)) * 1024
+        threads = []
+        original = pybase64.b64encode_as_string
+
+        def record_thread(data):
+            threads.append(threading.current_thread())
+            return original(data)
+
+        with patch("home_ai.server.api.codec.pybase64.b64encode_as_string", side_effect=record_thread):
+            encoded = await b64encode_async(audio)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert await b64decode_async(encoded) == audio
@@ -1,9 +1,89 @@
 """Tests for LLM module - TDD: Write tests first."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
+
+class _ClaudeStream:
+    """Stand-in for an Anthropic MessageStream that replays a final message as events."""
+
+    def __init__(self, message):
+        self._message = message
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        from anthropic.lib.streaming import ContentBlockStopEvent, TextEvent
+
+        for index, block in enumerate(self._message.content):
+            if block.type == "text":
+                yield TextEvent(type="text", text=block.text, snapshot=block.text)
+            else:
+                yield ContentBlockStopEvent(type="content_block_stop", index=index, content_block=block)
+            # Let tasks started for earlier events run, as they would during network waits
+            await asyncio.sleep(0)
+
+    async def get_final_message(self):
+        return self._message
+
+
+def _claude_stream(*messages) -> MagicMock:
+    """Mock ``messages.stream`` returning one replayed stream per call."""
+    return MagicMock(side_effect=[_ClaudeStream(message) for message in messages])
+
+
+def _claude_message(*content, stop_reason="end_turn"):
+    """Build a real Anthropic Message; bare strings become text blocks."""
+    from anthropic.types import Message, TextBlock, Usage
+
+    blocks = [TextBlock(type="text", text=block) if isinstance(block, str) else block for block in content]
+    return Message(
+        id="msg_test",
+        type="message",
+        role="assistant",
+        model="claude-test",
+        content=blocks,
+        stop_reason=stop_reason,
+        usage=Usage(input_tokens=0, output_tokens=0),
+    )
+
+
+def _claude_tool_use(tool_id, name, arguments):
+    from anthropic.types import ToolUseBlock
+
+    return ToolUseBlock(type="tool_use", id=tool_id, name=name, input=arguments)
+
+
+def _openai_chunk(content=None, tool_calls=None, finish_reason=None):
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, Choice, ChoiceDelta
+
+    delta = ChoiceDelta(content=content, tool_calls=tool_calls)
+    return ChatCompletionChunk(
+        id="chatcmpl-test",
+        object="chat.completion.chunk",
+        created=0,
+        model="gpt-test",
+        choices=[Choice(index=0, delta=delta, finish_reason=finish_reason)],
+    )
+
+
+def _openai_tool_delta(index, call_id=None, name=None, arguments=None):
+    from openai.types.chat.chat_completion_chunk import ChoiceDeltaToolCall, ChoiceDeltaToolCallFunction
+
+    return ChoiceDeltaToolCall(
+        index=index, id=call_id, function=ChoiceDeltaToolCallFunction(name=name, arguments=arguments)
+    )
+
+
+async def _openai_stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(0)
 
 
 class TestOpenAILLM:
@@ -24,7 +104,26 @@ class TestOpenAILLM:
         llm = OpenAILLM(api_key="test_key")
         assert len(llm._tools) > 0
 
-    @pytest.mark.asyncio
+    async def test_openai_llm_execute_tool_dispatch(self):
+        """_execute_tool should route device tools, status queries and unknown names."""
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+
+        light = await llm._execute_tool("control_light", {"room": "living_room", "action": "on"})
+        status = await llm._execute_tool("get_device_status", {})
+        unknown = await llm._execute_tool("open_door", {})
+
+        assert light["success"] is True
+        assert status["states"]["lights"]["living_room"]["power"] == "on"
+        assert unknown == {"success": False, "message": "Unknown tool: open_door"}
+
+    def test_openai_llm_shares_tool_definitions(self):
+        """Tool definitions should be built once and shared across instances."""
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        assert OpenAILLM(api_key="test_key")._tools is OpenAILLM(api_key="test_key")._tools
+
     async def test_openai_llm_process_text_response(self):
         """OpenAI LLM should return text response."""
         from home_ai.common.models import LLMResponse
@@ -33,24 +132,18 @@ class TestOpenAILLM:
         llm = OpenAILLM(api_key="test_key")
 
         # Mock the client
-        mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = "네, 거실 조명을 켜겠습니다."
-        mock_message.tool_calls = None
-        mock_choice.message = mock_message
-        mock_choice.finish_reason = "stop"
-        mock_response.choices = [mock_choice]
-
         llm._async_client = MagicMock()
-        llm._async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        llm._async_client.chat.completions.create = AsyncMock(
+            return_value=_openai_stream(
+                _openai_chunk(content="네, 거실 조명을 "), _openai_chunk(content="켜겠습니다.", finish_reason="stop")
+            )
+        )
 
         result = await llm.process_async("거실 불 켜줘")
 
         assert isinstance(result, LLMResponse)
         assert result.text == "네, 거실 조명을 켜겠습니다."
 
-    @pytest.mark.asyncio
     async def test_openai_llm_process_with_tool_call(self):
         """OpenAI LLM should handle tool calls."""
         from home_ai.common.models import LLMResponse
@@ -58,43 +151,107 @@ class TestOpenAILLM:
 
         llm = OpenAILLM(api_key="test_key")
 
-        # Mock tool call response
-        mock_tool_call = MagicMock()
-        mock_tool_call.id = "call_123"
-        mock_tool_call.function.name = "control_light"
-        mock_tool_call.function.arguments = json.dumps({"room": "living_room", "action": "on"})
-
-        # First response with tool call
-        mock_response1 = MagicMock()
-        mock_choice1 = MagicMock()
-        mock_message1 = MagicMock()
-        mock_message1.content = None
-        mock_message1.tool_calls = [mock_tool_call]
-        mock_choice1.message = mock_message1
-        mock_choice1.finish_reason = "tool_calls"
-        mock_response1.choices = [mock_choice1]
-
+        # First response streams a tool call with its arguments split across chunks
+        arguments = json.dumps({"room": "living_room", "action": "on"})
+        first = _openai_stream(
+            _openai_chunk(tool_calls=[_openai_tool_delta(0, "call_123", "control_light", arguments[:10])]),
+            _openai_chunk(tool_calls=[_openai_tool_delta(0, arguments=arguments[10:])]),
+            _openai_chunk(finish_reason="tool_calls"),
+        )
         # Second response after tool execution
-        mock_response2 = MagicMock()
-        mock_choice2 = MagicMock()
-        mock_message2 = MagicMock()
-        mock_message2.content = "거실 조명을 켰습니다."
-        mock_message2.tool_calls = None
-        mock_choice2.message = mock_message2
-        mock_choice2.finish_reason = "stop"
-        mock_response2.choices = [mock_choice2]
+        second = _openai_stream(_openai_chunk(content="거실 조명을 켰습니다.", finish_reason="stop"))
 
         llm._async_client = MagicMock()
-        llm._async_client.chat.completions.create = AsyncMock(side_effect=[mock_response1, mock_response2])
-
-        # Mock tool executor
-        llm._tool_executor = AsyncMock(return_value={"success": True, "message": "거실 조명을 켰습니다."})
+        llm._async_client.chat.completions.create = AsyncMock(side_effect=[first, second])
 
         result = await llm.process_async("거실 불 켜줘")
 
         assert isinstance(result, LLMResponse)
         assert len(result.commands) > 0
 
+        messages = llm._async_client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[-2]["tool_calls"][0]["function"] == {"name": "control_light", "arguments": arguments}
+        assert messages[-1]["tool_call_id"] == "call_123"
+
+    async def test_openai_llm_starts_tool_before_stream_ends(self):
+        """A tool call should start once the next call begins streaming, and text deltas reach on_text."""
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+        events = []
+
+        async def execute_tool(name, arguments):
+            events.append(f"tool:{name}")
+            return {"success": True}
+
+        llm._execute_tool = execute_tool
+
+        first = _openai_stream(
+            _openai_chunk(tool_calls=[_openai_tool_delta(0, "call_1", "control_light", '{"action": "on"}')]),
+            _openai_chunk(tool_calls=[_openai_tool_delta(1, "call_2", "control_alarm", '{"action": "list"}')]),
+            _openai_chunk(finish_reason="tool_calls"),
+        )
+        second = _openai_stream(_openai_chunk(content="완료", finish_reason="stop"))
+        llm._async_client = MagicMock()
+        llm._async_client.chat.completions.create = AsyncMock(side_effect=[first, second])
+
+        def on_text(delta):
+            events.append(f"text:{delta}")
+
+        result = await llm.process_async("불 켜고 알람 알려줘", on_text=on_text)
+
+        assert events == ["tool:control_light", "tool:control_alarm", "text:완료"]
+        assert [command.device for command in result.commands] == ["light", "alarm"]
+        assert llm._async_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    async def test_openai_llm_awaits_started_tools_when_stream_fails(self):
+        """Tools started before a stream error should still be awaited before the error propagates."""
+        import pytest
+
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+        finished = []
+
+        async def execute_tool(name, arguments):
+            await asyncio.sleep(0)
+            finished.append(name)
+            return {"success": True}
+
+        async def failing_stream():
+            yield _openai_chunk(tool_calls=[_openai_tool_delta(0, "call_1", "control_light", '{"action": "on"}')])
+            yield _openai_chunk(tool_calls=[_openai_tool_delta(1, "call_2", "control_alarm", '{"action": "list"}')])
+            raise ConnectionError("stream dropped")
+
+        llm._execute_tool = execute_tool
+        llm._async_client = MagicMock()
+        llm._async_client.chat.completions.create = AsyncMock(return_value=failing_stream())
+
+        with pytest.raises(ConnectionError):
+            await llm.process_async("불 켜줘")
+
+        assert finished == ["control_light"]
+
+    async def test_openai_llm_records_tools_from_final_turn(self):
+        """Tool calls in a turn that doesn't end with tool_calls should still be awaited and recorded."""
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+        llm._execute_tool = AsyncMock(return_value={"success": True})
+        llm._async_client = MagicMock()
+        llm._async_client.chat.completions.create = AsyncMock(
+            return_value=_openai_stream(
+                _openai_chunk(tool_calls=[_openai_tool_delta(0, "call_1", "control_light", '{"action": "on"}')]),
+                _openai_chunk(finish_reason="length"),
+            )
+        )
+
+        result = await llm.process_async("불 켜줘")
+
+        llm._execute_tool.assert_awaited_once_with("control_light", {"action": "on"})
+        assert [command.device for command in result.commands] == ["light"]
+        llm._async_client.chat.completions.create.assert_awaited_once()
+
 
 class TestClaudeLLM:
     """Tests for Claude LLM implementation."""
@@ -114,7 +271,94 @@ class TestClaudeLLM:
         llm = ClaudeLLM(api_key="test_key")
         assert len(llm._tools) > 0
 
-    @pytest.mark.asyncio
+    async def test_claude_llm_warmup_swallows_errors(self):
+        """Warm-up should hit a token-free endpoint and never raise."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+        llm._async_client = MagicMock()
+        llm._async_client.models.list = AsyncMock(side_effect=ConnectionError("offline"))
+
+        await llm.warmup()
+
+        llm._async_client.models.list.assert_awaited_once()
+
+    def test_llms_share_default_iot_controller(self):
+        """LLMs without an explicit controller should drive the same devices as the REST API."""
+        from home_ai.mcp_iot.server import get_iot_controller
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        assert ClaudeLLM(api_key="test_key")._iot_controller is get_iot_controller()
+        assert OpenAILLM(api_key="test_key")._iot_controller is get_iot_controller()
+
+    def test_claude_llm_shares_tool_definitions(self):
+        """Tool definitions should be built once and shared across instances."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        assert ClaudeLLM(api_key="test_key")._tools is ClaudeLLM(api_key="test_key")._tools
+
+    def test_claude_llm_uses_shared_http_pool(self):
+        """ClaudeLLM should reuse the process-wide HTTP connection pool."""
+        from home_ai.common.http import get_shared_async_http
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+
+        assert llm._async_client._client is get_shared_async_http()
+
+    async def test_claude_llm_marks_prefix_cacheable(self):
+        """System prompt and tool definitions should carry a prompt-cache breakpoint."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+
+        llm._async_client = MagicMock()
+        llm._async_client.messages.stream = _claude_stream(_claude_message("네"))
+
+        await llm.process_async("안녕")
+
+        kwargs = llm._async_client.messages.stream.call_args.kwargs
+        assert kwargs["system"][0]["text"] == ClaudeLLM.SYSTEM_PROMPT
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert all("cache_control" not in tool for tool in kwargs["tools"][:-1])
+
+    async def test_claude_llm_runs_tools_concurrently(self):
+        """Tool uses in one turn should run concurrently and keep their result order."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+
+        light = _claude_tool_use("tu_1", "control_light", {"room": "living_room", "action": "on"})
+        thermostat = _claude_tool_use("tu_2", "control_thermostat", {"action": "set_temp", "temperature": 22})
+
+        first = _claude_message(light, thermostat, stop_reason="tool_use")
+        final = _claude_message("완료했습니다.")
+        llm._async_client = MagicMock()
+        llm._async_client.messages.stream = _claude_stream(first, final)
+
+        running = 0
+        peak = 0
+
+        async def execute_tool(name, arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 if name == "control_light" else 0)
+            running -= 1
+            return {"success": True, "message": name}
+
+        llm._execute_tool = execute_tool
+
+        result = await llm.process_async("불 켜고 온도 22도로 맞춰줘")
+
+        tool_results = llm._async_client.messages.stream.call_args.kwargs["messages"][-1]["content"]
+        assert peak == 2
+        assert [item["tool_use_id"] for item in tool_results] == ["tu_1", "tu_2"]
+        assert "control_light" in tool_results[0]["content"]
+        assert [command.device for command in result.commands] == ["light", "thermostat"]
+
     async def test_claude_llm_process_text_response(self):
         """Claude LLM should return text response."""
         from home_ai.common.models import LLMResponse
@@ -123,14 +367,256 @@ class TestClaudeLLM:
         llm = ClaudeLLM(api_key="test_key")
 
         # Mock the client
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(type="text", text="네, 거실 조명을 켜겠습니다.")]
-        mock_response.stop_reason = "end_turn"
-
         llm._async_client = MagicMock()
-        llm._async_client.messages.create = AsyncMock(return_value=mock_response)
+        llm._async_client.messages.stream = _claude_stream(_claude_message("네, 거실 조명을 켜겠습니다."))
 
-        result = await llm.process_async("거실 불 켜줘")
+        on_text = MagicMock()
+        result = await llm.process_async("거실 불 켜줘", on_text=on_text)
+
+        on_text.assert_called_once_with("네, 거실 조명을 켜겠습니다.")
 
         assert isinstance(result, LLMResponse)
         assert "조명" in result.text or "켜" in result.text
+
+    async def test_claude_llm_reuses_reply_to_repeated_utterance(self):
+        """A repeated utterance without tool use should be answered from the response cache."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+
+        llm._async_client = MagicMock()
+        llm._async_client.messages.stream = _claude_stream(_claude_message("안녕하세요!"))
+
+        first = await llm.process_async("안녕")
+        second = await llm.process_async("안녕 ")
+
+        assert second == first
+        assert llm._async_client.messages.stream.call_count == 1
+
+    async def test_claude_llm_awaits_started_tools_when_stream_fails(self):
+        """Tools started before a stream error should still be awaited before the error propagates."""
+        import pytest
+
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+        finished = []
+
+        async def execute_tool(name, arguments):
+            await asyncio.sleep(0)
+            finished.append(name)
+            return {"success": True}
+
+        class _FailingStream(_ClaudeStream):
+            async def __aiter__(self):
+                async for event in super().__aiter__():
+                    yield event
+                raise ConnectionError("stream dropped")
+
+        light = _claude_tool_use("tu_1", "control_light", {"room": "living_room", "action": "on"})
+        llm._execute_tool = execute_tool
+        llm._async_client = MagicMock()
+        llm._async_client.messages.stream = MagicMock(
+            return_value=_FailingStream(_claude_message(light, stop_reason="tool_use"))
+        )
+
+        with pytest.raises(ConnectionError):
+            await llm.process_async("불 켜줘")
+
+        assert finished == ["control_light"]
+
+    async def test_claude_llm_records_tools_from_final_turn(self):
+        """Tool uses in a turn that stops for another reason should still be awaited and recorded."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+
+        llm = ClaudeLLM(api_key="test_key")
+        llm._execute_tool = AsyncMock(return_value={"success": True})
+
+        light = _claude_tool_use("tu_1", "control_light", {"room": "living_room", "action": "on"})
+        llm._async_client = MagicMock()
+        llm._async_client.messages.stream = _claude_stream(_claude_message(light, stop_reason="max_tokens"))
+
+        result = await llm.process_async("불 켜줘")
+
+        llm._execute_tool.assert_awaited_once()
+        assert [command.device for command in result.commands] == ["light"]
+        assert llm._async_client.messages.stream.call_count == 1
+
+
+class TestResponseCache:
+    """Tests for the LLM response cache."""
+
+    def test_response_cache_skips_command_replies(self):
+        """Replies that executed tools must not be cached."""
+        from home_ai.common.models import IoTCommand, LLMResponse
+        from home_ai.server.llm.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.put("불 켜줘", LLMResponse(text="켰습니다.", commands=[IoTCommand(device="light", action="on")]))
+        cache.put("안녕", LLMResponse(text="안녕하세요!"))
+
+        assert cache.get("불 켜줘") is None
+        assert cache.get("안녕").text == "안녕하세요!"
+
+    def test_response_cache_evicts_least_recently_used(self):
+        """The cache should drop the least recently used entry when full."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.response_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", LLMResponse(text="A"))
+        cache.put("b", LLMResponse(text="B"))
+        cache.get("a")
+        cache.put("c", LLMResponse(text="C"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").text == "A"
+        assert cache.get("c").text == "C"
+
+    def test_response_cache_skips_device_requests(self):
+        """Utterances that mention devices should always reach the model, even without tool calls."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.put("거실 불 켜줘", LLMResponse(text="어느 방 조명을 켤까요?"))
+        cache.put("Turn on the light", LLMResponse(text="Which room?"))
+
+        assert cache.get("거실 불 켜줘") is None
+        assert cache.get("Turn on the light") is None
+
+    def test_response_cache_returns_copies(self):
+        """Mutating a stored or returned response must not change what the cache serves."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        response = LLMResponse(text="안녕하세요!")
+        cache.put("안녕", response)
+        response.text = "바뀜"
+        cache.get("안녕").text = "바뀜"
+
+        assert cache.get("안녕").text == "안녕하세요!"
+
+    def test_response_cache_entries_expire(self):
+        """Cached responses should expire after the TTL."""
+        from unittest.mock import patch
+
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.response_cache import ResponseCache
+
+        cache = ResponseCache(ttl=60)
+        with patch("home_ai.server.llm.response_cache.time.monotonic", return_value=1000.0):
+            cache.put("안녕", LLMResponse(text="안녕하세요!"))
+        with patch("home_ai.server.llm.response_cache.time.monotonic", return_value=1059.0):
+            assert cache.get("안녕").text == "안녕하세요!"
+        with patch("home_ai.server.llm.response_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("안녕") is None
+
+    async def test_llms_cache_only_finished_answers(self):
+        """A turn that didn't end normally (truncated, refused) should not be cached."""
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        claude = ClaudeLLM(api_key="test_key")
+        claude._async_client = MagicMock()
+        claude._async_client.messages.stream = _claude_stream(
+            _claude_message("안녕하", stop_reason="max_tokens"), _claude_message("안녕하세요!")
+        )
+        openai = OpenAILLM(api_key="test_key")
+        openai._async_client = MagicMock()
+        openai._async_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                _openai_stream(_openai_chunk(content="안녕하", finish_reason="length")),
+                _openai_stream(_openai_chunk(content="안녕하세요!", finish_reason="stop")),
+            ]
+        )
+
+        for llm in (claude, openai):
+            assert (await llm.process_async("안녕")).text == "안녕하"
+            assert (await llm.process_async("안녕")).text == "안녕하세요!"
+            assert (await llm.process_async("안녕")).text == "안녕하세요!"
+
+        assert claude._async_client.messages.stream.call_count == 2
+        assert openai._async_client.chat.completions.create.await_count == 2
+
+
+class TestBatchProcessing:
+    """Tests for concurrent batch processing."""
+
+    async def test_process_many_bounds_concurrency_and_keeps_order(self):
+        """process_many should cap in-flight requests and return responses in input order."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.batch import process_many
+
+        running = 0
+        peak = 0
+
+        async def process_async(text, context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 if text == "a" else 0)
+            running -= 1
+            return LLMResponse(text=f"{text}:{context}")
+
+        results = await process_many(process_async, ["a", "b", "c"], [None, [{"role": "user"}], None], 2)
+
+        assert peak == 2
+        assert [result.text for result in results] == ["a:None", "b:[{'role': 'user'}]", "c:None"]
+
+    async def test_openai_llm_process_batch_async(self):
+        """OpenAILLM.process_batch_async should process every text."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+        llm.process_async = AsyncMock(side_effect=lambda text, context: LLMResponse(text=text.upper()))
+
+        results = await llm.process_batch_async(["a", "b"], concurrency=1)
+
+        assert [result.text for result in results] == ["A", "B"]
+
+
+class TestSyncBridge:
+    """Tests for running LLM coroutines from sync code."""
+
+    def test_process_reuses_background_loop(self):
+        """Sync process() calls should run on one long-lived event loop."""
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.openai_llm import OpenAILLM
+
+        llm = OpenAILLM(api_key="test_key")
+        loops = []
+
+        async def process_async(text, context=None):
+            loops.append(asyncio.get_running_loop())
+            return LLMResponse(text=text)
+
+        llm.process_async = process_async
+
+        assert llm.process("안녕").text == "안녕"
+        assert llm.process("또 안녕").text == "또 안녕"
+        assert loops[0] is loops[1]
+        assert loops[0].is_running()
+
+    async def test_process_uses_its_own_http_pool(self):
+        """Sync calls on the bridge loop should not use the server loop's connection pool."""
+        from home_ai.common.http import get_shared_async_http
+        from home_ai.common.models import LLMResponse
+        from home_ai.server.llm.claude_llm import ClaudeLLM
+        from home_ai.server.llm.sync import get_bridge_http
+
+        llm = ClaudeLLM(api_key="test_key")
+        clients = []
+
+        async def process_async(text, context=None):
+            clients.append(llm._client())
+            return LLMResponse(text=text)
+
+        llm.process_async = process_async
+        await asyncio.to_thread(llm.process, "안녕")
+
+        assert clients[0]._client is get_bridge_http()
+        assert clients[0]._client is not get_shared_async_http()
+        assert llm._client() is llm._async_client